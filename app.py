@@ -4,10 +4,11 @@ import shutil
 from flask import Flask
 from datetime import datetime
 from flask_wtf.csrf import CSRFProtect
-from app.models.database import db
+from app.models.database import db, configure_sqlite
 from app.routes.main_routes import main_bp
 from app.routes.auth_routes import auth_bp
 from app.routes.main_routes import revoke_access, grant_access
+from app.services.assets import init_assets
 from flask_login import LoginManager
 from flask_migrate import Migrate
 import subprocess
@@ -27,9 +28,6 @@ def cleanup_pycache():
     except Exception as e:
         print(f"Error during __pycache__ cleanup: {e}")
 
-# Register the cleanup function to run at exit
-atexit.register(cleanup_pycache)
-
 # Initialize CSRF protection
 csrf = CSRFProtect()
 login_manager = LoginManager()
@@ -59,6 +57,9 @@ def create_app(config_name='default'):
     # Initialize extensions
     print("Initializing extensions...")
     db.init_app(app)
+    # Apply the SQLite connection profile before the first connection is opened
+    with app.app_context():
+        configure_sqlite(db.engine, app.config.get('SQLITE_PRAGMAS'))
     csrf.init_app(app)
     
     # Initialize Flask-Migrate
@@ -71,6 +72,9 @@ def create_app(config_name='default'):
     app.register_blueprint(main_bp)
     app.register_blueprint(auth_bp)
     
+    # Serve fingerprinted, precompressed static assets when a build exists
+    init_assets(app)
+    
     # Create a dummy current_user object for templates
     class DummyUser:
         is_authenticated = False
@@ -98,31 +102,45 @@ def create_app(config_name='default'):
         os.makedirs(db_dir)
         print("db directory created successfully")
     
-    # Create database tables if they don't exist
-    print("Creating database tables...")
-    with app.app_context():
-        try:
-            db.create_all()
-            print("Database tables created successfully")
-           
-            # Check if the database is empty (no users)
-            from app.models.models import User
-            user_count = User.query.count()
-           
-            if user_count == 0:
-                print("Database is empty. Running seed data script...")
-                try:
-                    # Import and run seed data function directly
-                    from seed_db import create_seed_data
-                    create_seed_data()
-                    print("Seed data created successfully!")
-                except Exception as e:
-                    print(f"Error creating seed data: {e}")
-        except Exception as e:
-            print(f"Error creating database tables: {e}")
+    # Production boots skip this; run `python manage.py createdb` once instead
+    if app.config.get('AUTO_CREATE_DB', True):
+        with app.app_context():
+            init_database()
+    
+    # Register the cleanup function to run at exit (once, however many apps are created)
+    if app.config.get('CLEANUP_PYCACHE', True):
+        atexit.unregister(cleanup_pycache)
+        atexit.register(cleanup_pycache)
     
     return app
 
+def init_database(seed=True):
+    """Create missing tables and, if there are no users yet, load the seed data.
+
+    Needs an app context.
+    """
+    # Create database tables if they don't exist
+    print("Creating database tables...")
+    try:
+        db.create_all()
+        print("Database tables created successfully")
+       
+        # Check if the database is empty (no users)
+        from app.models.models import User
+        user_count = User.query.count()
+       
+        if seed and user_count == 0:
+            print("Database is empty. Running seed data script...")
+            try:
+                # Import and run seed data function directly
+                from seed_db import create_seed_data
+                create_seed_data()
+                print("Seed data created successfully!")
+            except Exception as e:
+                print(f"Error creating seed data: {e}")
+    except Exception as e:
+        print(f"Error creating database tables: {e}")
+
 # Create the application instance - uses 'default' configuration by default
 # To use a different configuration, set the FLASK_CONFIG environment variable
 # e.g., FLASK_CONFIG=production python app.py
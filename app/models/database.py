@@ -1,4 +1,21 @@
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event
 
 # Initialize SQLAlchemy
-db = SQLAlchemy() 
\ No newline at end of file
+db = SQLAlchemy()
+
+def configure_sqlite(engine, pragmas):
+    """Run the given PRAGMAs on every new connection of a SQLite engine.
+
+    SQLite settings such as foreign_keys and busy_timeout are per connection,
+    so they are applied from the engine's connect event rather than once.
+    """
+    if engine.dialect.name != 'sqlite' or not pragmas:
+        return
+    
+    @event.listens_for(engine, 'connect')
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f'PRAGMA {name}={value}')
+        cursor.close()
@@ -10,7 +10,7 @@ class User(db.Model, UserMixin):
     full_name = db.Column(db.String(100), nullable=False)
     username = db.Column(db.String(80), unique=True, nullable=False)
     email = db.Column(db.String(120), unique=True, nullable=False)
-    password_hash = db.Column(db.String(128), nullable=False)
+    password_hash = db.Column(db.String(256), nullable=False)
     date_joined = db.Column(db.DateTime, default=datetime.utcnow)
     
     tournaments = db.relationship('Tournament', backref='creator', lazy=True)
@@ -25,6 +25,18 @@ class User(db.Model, UserMixin):
     def check_password(self, password):
         return check_password_hash(self.password_hash, password)
 
+# Substring searches (ILIKE '%q%') in search_users and get_tournaments can only use
+# trigram indexes; PostgreSQL only, other databases keep scanning
+db.event.listen(db.metadata, 'before_create',
+                db.DDL('CREATE EXTENSION IF NOT EXISTS pg_trgm').execute_if(dialect='postgresql'))
+
+def trigram_index(name, column):
+    return db.Index(name, column, postgresql_using='gin',
+                    postgresql_ops={column.key: 'gin_trgm_ops'}).ddl_if(dialect='postgresql')
+
+trigram_index('ix_user_username_trgm', User.username)
+trigram_index('ix_user_email_trgm', User.email)
+
 class Tournament(db.Model):
     __tablename__ = 'tournament'
     
@@ -35,17 +47,29 @@ class Tournament(db.Model):
     start_date = db.Column(db.Date, nullable=False)
     end_date = db.Column(db.Date, nullable=False)
     creator_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    # Bumped on every write to the tournament's data; used to key cached responses
+    data_version = db.Column(db.Integer, nullable=False, default=0, server_default='0')
     
-    teams = db.relationship('Team', backref='tournament', lazy=True)
-    matches = db.relationship('Match', backref='tournament', lazy=True)
-    tournament_access = db.relationship('TournamentAccess', backref='tournament', lazy=True)
+    # Children are removed by the database's ON DELETE CASCADE, not loaded and nulled by the ORM
+    teams = db.relationship('Team', backref='tournament', lazy=True, passive_deletes=True)
+    matches = db.relationship('Match', backref='tournament', lazy=True, passive_deletes=True)
+    tournament_access = db.relationship('TournamentAccess', backref='tournament', lazy=True, passive_deletes=True)
+
+# Serves /api/tournaments: one user's tournaments in listing order, so pages are index range scans
+db.Index('ix_tournament_creator_listing', Tournament.creator_id, Tournament.year.desc(), Tournament.name)
+trigram_index('ix_tournament_name_trgm', Tournament.name)
+trigram_index('ix_tournament_description_trgm', Tournament.description)
 
 class TournamentAccess(db.Model):
     __tablename__ = 'tournament_access'
+    __table_args__ = (
+        # A tournament is shared with a user at most once; also serves lookups by tournament
+        db.Index('uq_tournament_access_tournament_user', 'tournament_id', 'user_id', unique=True),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
-    tournament_id = db.Column(db.Integer, db.ForeignKey('tournament.id'), nullable=False)
-    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    tournament_id = db.Column(db.Integer, db.ForeignKey('tournament.id', ondelete='CASCADE'), nullable=False)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False, index=True)
     access_granted = db.Column(db.DateTime, default=datetime.utcnow)
 
 class Team(db.Model):
@@ -61,11 +85,18 @@ class Team(db.Model):
     losses = db.Column(db.Integer, default=0)
     points = db.Column(db.Integer, default=0)
     creator_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
-    tournament_id = db.Column(db.Integer, db.ForeignKey('tournament.id'), nullable=False)
+    tournament_id = db.Column(db.Integer, db.ForeignKey('tournament.id', ondelete='CASCADE'), nullable=False, index=True)
     
-    players = db.relationship('Player', backref='team', lazy=True)
-    team1_matches = db.relationship('Match', foreign_keys='Match.team1_id', backref='team1', lazy=True)
-    team2_matches = db.relationship('Match', foreign_keys='Match.team2_id', backref='team2', lazy=True)
+    players = db.relationship('Player', backref='team', lazy=True, passive_deletes=True)
+    team1_matches = db.relationship('Match', foreign_keys='Match.team1_id', backref='team1', lazy=True,
+                                    passive_deletes=True)
+    team2_matches = db.relationship('Match', foreign_keys='Match.team2_id', backref='team2', lazy=True,
+                                    passive_deletes=True)
+
+# Serves the home page leaderboard, which reads teams in standings order
+db.Index('ix_team_leaderboard', Team.wins.desc(), Team.points.desc())
+# Editor listing of a tournament's teams by name
+db.Index('ix_team_tournament_name', Team.tournament_id, Team.name, Team.id)
 
 class Player(db.Model):
     __tablename__ = 'player'
@@ -76,39 +107,50 @@ class Player(db.Model):
     weight = db.Column(db.Integer, nullable=True)  # in kg
     position = db.Column(db.String(2), nullable=False)  # PG, SG, SF, PF, C
     jersey_number = db.Column(db.Integer, nullable=False)
-    team_id = db.Column(db.Integer, db.ForeignKey('team.id'), nullable=False)
+    team_id = db.Column(db.Integer, db.ForeignKey('team.id', ondelete='CASCADE'), nullable=False, index=True)
     creator_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
     
-    stats = db.relationship('PlayerStats', backref='player', lazy=True)
+    stats = db.relationship('PlayerStats', backref='player', lazy=True, passive_deletes=True)
+
+# Editor listings of a team's players by name or jersey number
+db.Index('ix_player_team_name', Player.team_id, Player.name, Player.id)
+db.Index('ix_player_team_jersey', Player.team_id, Player.jersey_number, Player.id)
 
 class Match(db.Model):
     __tablename__ = 'match'
     
     id = db.Column(db.Integer, primary_key=True)
-    tournament_id = db.Column(db.Integer, db.ForeignKey('tournament.id'), nullable=False)
-    team1_id = db.Column(db.Integer, db.ForeignKey('team.id'), nullable=False)
-    team2_id = db.Column(db.Integer, db.ForeignKey('team.id'), nullable=False)
+    tournament_id = db.Column(db.Integer, db.ForeignKey('tournament.id', ondelete='CASCADE'), nullable=False, index=True)
+    team1_id = db.Column(db.Integer, db.ForeignKey('team.id', ondelete='CASCADE'), nullable=False, index=True)
+    team2_id = db.Column(db.Integer, db.ForeignKey('team.id', ondelete='CASCADE'), nullable=False, index=True)
     venue_name = db.Column(db.String(100), nullable=True)
     match_date = db.Column(db.DateTime, nullable=False)
     creator_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
     
-    score = db.relationship('MatchScore', backref='match', uselist=False, lazy=True)
-    player_stats = db.relationship('PlayerStats', backref='match', lazy=True)
+    score = db.relationship('MatchScore', backref='match', uselist=False, lazy=True, passive_deletes=True)
+    player_stats = db.relationship('PlayerStats', backref='match', lazy=True, passive_deletes=True)
+
+# Editor listing of a tournament's matches by date
+db.Index('ix_match_tournament_date', Match.tournament_id, Match.match_date, Match.id)
 
 class MatchScore(db.Model):
     __tablename__ = 'match_score'
     
     id = db.Column(db.Integer, primary_key=True)
-    match_id = db.Column(db.Integer, db.ForeignKey('match.id'), nullable=False, unique=True)
+    match_id = db.Column(db.Integer, db.ForeignKey('match.id', ondelete='CASCADE'), nullable=False, unique=True)
     team1_score = db.Column(db.Integer, nullable=False)
     team2_score = db.Column(db.Integer, nullable=False)
 
 class PlayerStats(db.Model):
     __tablename__ = 'player_stats'
+    __table_args__ = (
+        # One stat line per player per match; also serves lookups by match
+        db.Index('uq_player_stats_match_player', 'match_id', 'player_id', unique=True),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
-    match_id = db.Column(db.Integer, db.ForeignKey('match.id'), nullable=False)
-    player_id = db.Column(db.Integer, db.ForeignKey('player.id'), nullable=False)
+    match_id = db.Column(db.Integer, db.ForeignKey('match.id', ondelete='CASCADE'), nullable=False)
+    player_id = db.Column(db.Integer, db.ForeignKey('player.id', ondelete='CASCADE'), nullable=False, index=True)
     points = db.Column(db.Integer, default=0)
     rebounds = db.Column(db.Integer, default=0)
     assists = db.Column(db.Integer, default=0)
@@ -122,6 +164,37 @@ class PlayerStats(db.Model):
     double_double = db.Column(db.Boolean, default=False)
     triple_double = db.Column(db.Boolean, default=False)
 
+class PlayerSeasonTotals(db.Model):
+    """A player's stat lines summed up; kept in step with PlayerStats by refresh_season_totals"""
+    __tablename__ = 'player_season_totals'
+    
+    player_id = db.Column(db.Integer, db.ForeignKey('player.id', ondelete='CASCADE'), primary_key=True)
+    games = db.Column(db.Integer, nullable=False, default=0)
+    points = db.Column(db.Integer, nullable=False, default=0)
+    rebounds = db.Column(db.Integer, nullable=False, default=0)
+    assists = db.Column(db.Integer, nullable=False, default=0)
+    steals = db.Column(db.Integer, nullable=False, default=0)
+    blocks = db.Column(db.Integer, nullable=False, default=0)
+    turnovers = db.Column(db.Integer, nullable=False, default=0)
+    three_pointers = db.Column(db.Integer, nullable=False, default=0)
+    efficiency = db.Column(db.Integer, nullable=False, default=0)
+    double_doubles = db.Column(db.Integer, nullable=False, default=0)
+    triple_doubles = db.Column(db.Integer, nullable=False, default=0)
+
+class UploadJob(db.Model):
+    __tablename__ = 'upload_job'
+    
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False, index=True)
+    filename = db.Column(db.String(255), nullable=False)
+    # queued -> running -> succeeded / failed
+    status = db.Column(db.String(20), nullable=False, default='queued')
+    progress = db.Column(db.Integer, nullable=False, default=0)
+    message = db.Column(db.Text, nullable=True)
+    tournament_id = db.Column(db.Integer, db.ForeignKey('tournament.id', ondelete='SET NULL'), nullable=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
 # Add event listeners for calculated fields
 @db.event.listens_for(PlayerStats, 'before_insert')
 @db.event.listens_for(PlayerStats, 'before_update')
@@ -136,4 +209,42 @@ def set_calculated_fields(mapper, connection, target):
     target.double_double = sum(1 for cat in categories if cat >= 10) >= 2
     
     # Calculate triple_double
-    target.triple_double = sum(1 for cat in categories if cat >= 10) >= 3
\ No newline at end of file
+    target.triple_double = sum(1 for cat in categories if cat >= 10) >= 3
+
+# Season totals
+
+SEASON_TOTAL_FIELDS = ['points', 'rebounds', 'assists', 'steals', 'blocks', 'turnovers', 'three_pointers', 'efficiency']
+
+def refresh_season_totals(connection, player_ids):
+    """Recompute the PlayerSeasonTotals rows of the given players from their stat lines.
+
+    `player_ids` is a list of ids or a select() of them. Players without stat
+    lines are left without a row. Bulk writes to player_stats, which bypass the
+    ORM, call this themselves in the same transaction.
+    """
+    totals = PlayerSeasonTotals.__table__
+    stats = PlayerStats.__table__
+    connection.execute(totals.delete().where(totals.c.player_id.in_(player_ids)))
+    connection.execute(totals.insert().from_select(
+        ['player_id', 'games'] + SEASON_TOTAL_FIELDS + ['double_doubles', 'triple_doubles'],
+        db.select(
+            stats.c.player_id,
+            db.func.count(),
+            *[db.func.coalesce(db.func.sum(stats.c[field]), 0) for field in SEASON_TOTAL_FIELDS],
+            db.func.sum(db.case((stats.c.double_double, 1), else_=0)),
+            db.func.sum(db.case((stats.c.triple_double, 1), else_=0))
+        ).where(stats.c.player_id.in_(player_ids)).group_by(stats.c.player_id)
+    ))
+
+@db.event.listens_for(db.session, 'after_flush')
+def refresh_flushed_season_totals(session, flush_context):
+    # Stat lines added, changed or deleted through the ORM; a line moved to
+    # another player changes both players' totals
+    player_ids = set()
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        if isinstance(obj, PlayerStats):
+            player_ids.add(obj.player_id)
+            player_ids.update(db.inspect(obj).attrs.player_id.history.deleted)
+    player_ids.discard(None)
+    if player_ids:
+        refresh_season_totals(session.connection(), sorted(player_ids))
@@ -1,112 +1,137 @@
-from flask import Blueprint, render_template, request, redirect, url_for, flash, send_from_directory, jsonify
+from flask import Blueprint, render_template, request, redirect, url_for, flash, jsonify, current_app, session
+from markupsafe import Markup
 from flask_login import login_required, current_user
-from sqlalchemy import desc
-import pandas as pd
+from sqlalchemy import desc, func, select
+from sqlalchemy.orm import aliased, contains_eager, joinedload
 from datetime import datetime
-import os
-import re
-from app.models.models import User, Tournament, Team, Player, Match, MatchScore, PlayerStats, TournamentAccess, db
+from app.models.models import User, Tournament, Team, Player, Match, MatchScore, PlayerStats, PlayerSeasonTotals, TournamentAccess, UploadJob, db, refresh_season_totals
 from app.forms.forms import (TournamentUploadForm, TournamentDetailsForm, TeamForm, PlayerForm, MatchForm, DeleteConfirmForm)
+from app.services.standings import match_result, apply_result_change
+from app.services.jobs import enqueue_upload, fail_stale_job, FINISHED_STATUSES
+from app.services.pagination import fetch_page, sort_order, with_next_cursor, InvalidCursor
+from app.services.cascade import delete_tournament_cascade, delete_team_cascade
+from app.services.downloads import UPLOAD_TEMPLATE, static_file_digest, static_file_version, send_static_download
+from app.services.access import tournament_access, reset_tournament_access, access_denied, player_with_team_or_404
+from app.services.cache import (analytics_cache, page_cache, bump_data_version, tournaments_fingerprint,
+                                versioned_key, make_etag, not_modified, with_etag)
 
 # Create blueprint
 main_bp = Blueprint('main', __name__)
 
+# Access checks are resolved once per request; start every request with a fresh scope
+main_bp.before_app_request(reset_tournament_access)
+
 # Define allowed file extensions
 ALLOWED_EXTENSIONS = {'xlsx'}
 
 def allowed_file(filename):
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
-# Helper function to normalize column names (strips asterisks)
-def normalize_columns(df):
-    # Create a mapping of original column names to normalized ones
-    column_map = {col: re.sub(r'[*]', '', col) for col in df.columns}
-    # Rename columns
-    return df.rename(columns=column_map), column_map
-
 @main_bp.route('/download_template')
 def download_template():
     """Route to download the tournament Excel template"""
     try:
-        # Flask's way of getting the app's root directory
-        from flask import current_app
-        import os
-        
-        # Set the path to the template file within the app structure
-        # current_app.root_path should point to the 'app' directory
-        file_path = os.path.join(current_app.root_path, 'app', 'static', 'templates', 'Tournament Upload Template.xlsx')
-        
-        # For debugging
-        print(f"Looking for file at: {file_path}")
-        print(f"File exists: {os.path.exists(file_path)}")
-        
-        # Check if the file exists
-        if not os.path.exists(file_path):
-            # Try to create the directory structure if it doesn't exist
-            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        digest = static_file_digest(UPLOAD_TEMPLATE)
+        if digest is None:
             flash('Template file not found. Please ensure it is placed in the correct location.', 'danger')
             return redirect(url_for('main.upload'))
         
-        # File exists, send it
-        return send_from_directory(
-            os.path.dirname(file_path),
-            os.path.basename(file_path),
-            as_attachment=True
-        )
+        return send_static_download(UPLOAD_TEMPLATE, digest)
     except Exception as e:
         print(f"Error downloading template: {str(e)}")
         flash(f'Error downloading template: {str(e)}', 'danger')
         return redirect(url_for('main.upload'))
 
-@main_bp.route('/')
-def index():
-    """Route for the home page"""
-   
-    # Check if year filter is applied
-    year_filter = request.args.get('year')
-   
-    # Get teams for leaderboard
-    teams = Team.query.all()
-    # Sort teams by wins and points for the leaderboard
-    sorted_teams = sorted(teams, key=lambda team: (team.wins, team.points), reverse=True)
-   
-    # Get tournament years for the dropdown
-    tournament_years = db.session.query(Tournament.year).distinct().order_by(desc(Tournament.year)).all()
-    years = [{'year': year[0]} for year in tournament_years]
-    
-    # If no years found, use current year
-    if not years:
-        from datetime import datetime
-        years = [{'year': datetime.now().year}]
+def _render_index_fragments(year):
+    """Render the leaderboard and match card sections of the home page.
+
+    Uses a fixed number of queries: the leaderboard is ordered in SQL from the
+    maintained team standings, and match cards load their teams and score in
+    the same query as the matches.
+    """
+    # Get teams for leaderboard, best record first
+    leaderboard_query = Team.query
+    if year is not None:
+        leaderboard_query = leaderboard_query.join(Tournament).filter(Tournament.year == year)
+    sorted_teams = leaderboard_query.order_by(desc(Team.wins), desc(Team.points), Team.id).all()
    
     # Get upcoming matches
     # Filter by date > today
-    from datetime import datetime
     today = datetime.now()
-    upcoming_query = Match.query.filter(Match.match_date > today)
+    upcoming_query = Match.query.filter(Match.match_date > today)\
+        .options(joinedload(Match.team1), joinedload(Match.team2))
     
     # Apply year filter if provided
-    if year_filter and year_filter != 'all':
+    if year is not None:
         # Join with tournament to filter by year
-        upcoming_query = upcoming_query.join(Tournament).filter(Tournament.year == year_filter)
+        upcoming_query = upcoming_query.join(Tournament).filter(Tournament.year == year)
     
     upcoming_matches = upcoming_query.order_by(Match.match_date).limit(4).all()
    
     # Get recent matches (matches with scores)
-    recent_query = Match.query.join(MatchScore)
+    recent_query = Match.query.join(MatchScore)\
+        .options(contains_eager(Match.score), joinedload(Match.team1), joinedload(Match.team2))
     
     # Apply year filter if provided
-    if year_filter and year_filter != 'all':
-        recent_query = recent_query.join(Tournament).filter(Tournament.year == year_filter)
+    if year is not None:
+        recent_query = recent_query.join(Tournament).filter(Tournament.year == year)
     
     recent_matches = recent_query.order_by(desc(Match.match_date)).limit(3).all()
+    
+    return {
+        'leaderboard_rows': Markup(render_template('partials/_leaderboard_rows.html', teams=sorted_teams)),
+        'upcoming_matches_html': Markup(render_template('partials/_upcoming_matches.html',
+                                                        upcoming_matches=upcoming_matches)),
+        'recent_matches_html': Markup(render_template('partials/_recent_matches.html',
+                                                      recent_matches=recent_matches))
+    }
+
+@main_bp.route('/')
+def index():
+    """Route for the home page.
+
+    The leaderboard and match sections are cached per season until data of a
+    tournament in that season changes (see tournaments_fingerprint) or the
+    PAGE_CACHE_TTL passes. With INDEX_PAGE_CACHE on, anonymous visitors are
+    served whole cached pages the same way.
+    """
+   
+    # Check if year filter is applied
+    year_filter = request.args.get('year')
+    year = request.args.get('year', type=int) if year_filter != 'all' else None
+    cache = page_cache()
+    
+    # Anonymous visitors without pending messages all get the same page
+    page_key = None
+    if current_app.config.get('INDEX_PAGE_CACHE') and not current_user.is_authenticated \
+            and '_flashes' not in session:
+        page_key = ('index_page', year_filter, tournaments_fingerprint())
+        page = cache.get(page_key)
+        if page is not None:
+            return page
+   
+    # Get tournament years for the dropdown
+    tournament_years = db.session.query(Tournament.year).distinct().order_by(desc(Tournament.year)).all()
+    years = [{'year': row[0]} for row in tournament_years]
+    
+    # If no years found, use current year
+    if not years:
+        years = [{'year': datetime.now().year}]
+    
+    scope = [Tournament.year == year] if year is not None else []
+    fragments_key = ('index_fragments', year, tournaments_fingerprint(*scope))
+    fragments = cache.get(fragments_key)
+    if fragments is None:
+        fragments = _render_index_fragments(year)
+        cache.set(fragments_key, fragments)
    
-    return render_template('index.html',
-                          teams=sorted_teams,
-                          seasons=years,
-                          upcoming_matches=upcoming_matches,
-                          recent_matches=recent_matches,
-                          selected_season=year_filter)
+    page = render_template('index.html',
+                           seasons=years,
+                           selected_season=year_filter,
+                           **fragments)
+    if page_key is not None:
+        cache.set(page_key, page)
+    return page
 
 @main_bp.route('/share', methods=['GET', 'POST'])
 @login_required
@@ -159,346 +184,91 @@ def share():
 @main_bp.route('/upload', methods=['GET', 'POST'])
 @login_required
 def upload():
-    """Route for uploading tournament data via Excel"""
+    """Route for uploading tournament data via Excel.
+
+    The import runs as a background job; XHR submissions get the job id back
+    and poll /api/upload_jobs/<id>, plain form posts are redirected to a page
+    showing the job's state.
+    """
     form = TournamentUploadForm()
+    wants_json = request.headers.get('X-Requested-With') == 'XMLHttpRequest'
     
     if form.validate_on_submit():
         file = form.file.data
         
         if file and allowed_file(file.filename):
             try:
-                # Process tournament Excel file
-                xls = pd.ExcelFile(file)
-                
-                # Map expected sheet names to actual sheet names for flexibility
-                sheet_mapping = {
-                    "Tournament Details": ["Tournament Details", "Tournament"],
-                    "Teams": ["Teams"],
-                    "Players": ["Players"],
-                    "Matches": ["Matches"],
-                    "Match Scores": ["Match Scores"],
-                    "Player Stats": ["Player Stats"]
-                }
-                
-                # Check for the required sheets using the mapping
-                missing_sheets = []
-                actual_sheet_names = {}
-                
-                for expected_sheet, alternatives in sheet_mapping.items():
-                    found = False
-                    for alt in alternatives:
-                        if alt in xls.sheet_names:
-                            actual_sheet_names[expected_sheet] = alt
-                            found = True
-                            break
-                    
-                    if not found:
-                        missing_sheets.append(expected_sheet)
-                
-                if missing_sheets:
-                    flash(f'Missing required sheets: {", ".join(missing_sheets)}', 'danger')
-                    return redirect(request.url)
-                
-                # 1. Process Tournament Details/Tournament sheet
-                tournament_df = pd.read_excel(xls, actual_sheet_names["Tournament Details"])
-                # Normalize column names by removing asterisks
-                tournament_df, tour_col_map = normalize_columns(tournament_df)
-                
-                if tournament_df.empty:
-                    flash('Tournament sheet is empty', 'danger')
-                    return redirect(request.url)
-                
-                t_row = tournament_df.iloc[0]  # Get first row
-                
-                # Check required fields (now without asterisks)
-                required_fields = ['name', 'year', 'start_date', 'end_date']
-                missing_fields = [field for field in required_fields if field not in tournament_df.columns or pd.isna(t_row[field])]
-                
-                if missing_fields:
-                    flash(f'Missing required fields in Tournament sheet: {", ".join(missing_fields)}', 'danger')
-                    return redirect(request.url)
-                
-                # Convert dates properly - handle different formats
-                try:
-                    start_date = pd.to_datetime(t_row['start_date']).date()
-                    end_date = pd.to_datetime(t_row['end_date']).date()
-                except Exception as e:
-                    flash(f'Error parsing dates: {str(e)}. Please ensure dates are in a valid format (e.g., DD/MM/YYYY).', 'danger')
-                    return redirect(request.url)
-                
-                tournament = Tournament(
-                    name=t_row['name'],
-                    description=t_row.get('description', ''),
-                    year=int(t_row['year']),
-                    start_date=start_date,
-                    end_date=end_date,
-                    creator_id=current_user.id
-                )
-                db.session.add(tournament)
-                db.session.flush()  # Get tournament ID
-                
-                # 2. Process Teams
-                teams_df = pd.read_excel(xls, actual_sheet_names["Teams"])
-                # Normalize column names
-                teams_df, teams_col_map = normalize_columns(teams_df)
-                
-                team_map = {}  # To store team_id mapping
-                
-                if teams_df.empty:
-                    flash('Teams sheet is empty', 'danger')
-                    return redirect(request.url)
-                
-                # Check required fields
-                required_fields = ['team_id', 'name']
-                missing_fields = [field for field in required_fields if field not in teams_df.columns]
-                
-                if missing_fields:
-                    flash(f'Missing required fields in Teams sheet: {", ".join(missing_fields)}', 'danger')
-                    return redirect(request.url)
-                
-                for _, row in teams_df.iterrows():
-                    # Skip rows with missing required values
-                    if pd.isna(row['team_id']) or pd.isna(row['name']):
-                        continue
-                    
-                    team = Team(
-                        name=row['name'],
-                        created_year=int(row['created_year']) if 'created_year' in row and not pd.isna(row['created_year']) else None,
-                        logo_shape_type=int(row['logo_shape_type']) if 'logo_shape_type' in row and not pd.isna(row['logo_shape_type']) else 1,
-                        primary_color=row['primary_color'] if 'primary_color' in row and not pd.isna(row['primary_color']) else '#000000',
-                        secondary_color=row['secondary_color'] if 'secondary_color' in row and not pd.isna(row['secondary_color']) else '#FFFFFF',
-                        wins=int(row['wins']) if 'wins' in row and not pd.isna(row['wins']) else 0,
-                        losses=int(row['losses']) if 'losses' in row and not pd.isna(row['losses']) else 0,
-                        points=int(row['points']) if 'points' in row and not pd.isna(row['points']) else 0,
-                        creator_id=current_user.id,
-                        tournament_id=tournament.id
-                    )
-                    db.session.add(team)
-                    db.session.flush()
-                    team_map[int(row['team_id'])] = team.id
-                
-                # 3. Process Players
-                players_df = pd.read_excel(xls, actual_sheet_names["Players"])
-                # Normalize column names
-                players_df, players_col_map = normalize_columns(players_df)
-                
-                player_map = {}  # To store player_id mapping
-                
-                if players_df.empty:
-                    flash('Players sheet is empty', 'danger')
-                    return redirect(request.url)
-                
-                # Check required fields
-                required_fields = ['player_id', 'name', 'position', 'jersey_number', 'team_id']
-                missing_fields = [field for field in required_fields if field not in players_df.columns]
-                
-                if missing_fields:
-                    flash(f'Missing required fields in Players sheet: {", ".join(missing_fields)}', 'danger')
-                    return redirect(request.url)
-                
-                for _, row in players_df.iterrows():
-                    # Skip rows with missing required values
-                    if (pd.isna(row['player_id']) or pd.isna(row['name']) or 
-                        pd.isna(row['position']) or pd.isna(row['jersey_number']) or 
-                        pd.isna(row['team_id'])):
-                        continue
-                    
-                    # Skip players with team_id not in the team map
-                    team_id_int = int(row['team_id'])
-                    if team_id_int not in team_map:
-                        continue
-                    
-                    player = Player(
-                        name=row['name'],
-                        height=int(row['height']) if 'height' in row and not pd.isna(row['height']) else None,
-                        weight=int(row['weight']) if 'weight' in row and not pd.isna(row['weight']) else None,
-                        position=row['position'],
-                        jersey_number=int(row['jersey_number']),
-                        team_id=team_map[team_id_int],
-                        creator_id=current_user.id
-                    )
-                    db.session.add(player)
-                    db.session.flush()
-                    player_map[int(row['player_id'])] = player.id
-                
-                # 4. Process Matches
-                matches_df = pd.read_excel(xls, actual_sheet_names["Matches"])
-                # Normalize column names
-                matches_df, matches_col_map = normalize_columns(matches_df)
-                
-                match_map = {}  # To store match_id mapping
-                
-                if matches_df.empty:
-                    flash('Matches sheet is empty', 'danger')
-                    return redirect(request.url)
-                
-                # Check required fields
-                required_fields = ['match_id', 'team1_id', 'team2_id', 'match_date']
-                missing_fields = [field for field in required_fields if field not in matches_df.columns]
-                
-                if missing_fields:
-                    flash(f'Missing required fields in Matches sheet: {", ".join(missing_fields)}', 'danger')
-                    return redirect(request.url)
-                
-                for _, row in matches_df.iterrows():
-                    # Skip rows with missing required values
-                    if (pd.isna(row['match_id']) or pd.isna(row['team1_id']) or 
-                        pd.isna(row['team2_id']) or pd.isna(row['match_date'])):
-                        continue
-                    
-                    # Skip matches with team_id not in the team map
-                    team1_id_int = int(row['team1_id'])
-                    team2_id_int = int(row['team2_id'])
-                    if team1_id_int not in team_map or team2_id_int not in team_map:
-                        continue
-                    
-                    # Handle different date formats
-                    try:
-                        match_date = pd.to_datetime(row['match_date'])
-                    except Exception as e:
-                        flash(f'Error parsing match date: {str(e)}. Row with match_id={row["match_id"]}', 'danger')
-                        return redirect(request.url)
-                    
-                    match = Match(
-                        tournament_id=tournament.id,
-                        team1_id=team_map[team1_id_int],
-                        team2_id=team_map[team2_id_int],
-                        venue_name=row['venue_name'] if 'venue_name' in row and not pd.isna(row['venue_name']) else None,
-                        match_date=match_date,
-                        creator_id=current_user.id
-                    )
-                    db.session.add(match)
-                    db.session.flush()
-                    match_map[int(row['match_id'])] = match.id
-                
-                # 5. Process Match Scores
-                scores_df = pd.read_excel(xls, actual_sheet_names["Match Scores"])
-                # Normalize column names
-                scores_df, scores_col_map = normalize_columns(scores_df)
-                
-                if not scores_df.empty:
-                    # Check required fields
-                    required_fields = ['match_id', 'team1_score', 'team2_score']
-                    missing_fields = [field for field in required_fields if field not in scores_df.columns]
-                    
-                    if missing_fields:
-                        flash(f'Missing required fields in Match Scores sheet: {", ".join(missing_fields)}', 'danger')
-                        return redirect(request.url)
-                    
-                    for _, row in scores_df.iterrows():
-                        # Skip rows with missing required values
-                        if (pd.isna(row['match_id']) or pd.isna(row['team1_score']) or 
-                            pd.isna(row['team2_score'])):
-                            continue
-                        
-                        # Skip scores with match_id not in the match map
-                        match_id_int = int(row['match_id'])
-                        if match_id_int not in match_map:
-                            continue
-                        
-                        score = MatchScore(
-                            match_id=match_map[match_id_int],
-                            team1_score=int(row['team1_score']),
-                            team2_score=int(row['team2_score'])
-                        )
-                        db.session.add(score)
-                
-                # 6. Process Player Stats
-                stats_df = pd.read_excel(xls, actual_sheet_names["Player Stats"])
-                # Normalize column names
-                stats_df, stats_col_map = normalize_columns(stats_df)
-                
-                if not stats_df.empty:
-                    # Check required fields
-                    required_fields = ['match_id', 'player_id', 'points', 'rebounds', 'assists']
-                    missing_fields = [field for field in required_fields if field not in stats_df.columns]
-                    
-                    if missing_fields:
-                        flash(f'Missing required fields in Player Stats sheet: {", ".join(missing_fields)}', 'danger')
-                        return redirect(request.url)
-                    
-                    for _, row in stats_df.iterrows():
-                        # Skip rows with missing required values
-                        if (pd.isna(row['match_id']) or pd.isna(row['player_id']) or 
-                            pd.isna(row['points']) or pd.isna(row['rebounds']) or 
-                            pd.isna(row['assists'])):
-                            continue
-                        
-                        # Skip stats with match_id or player_id not in the maps
-                        match_id_int = int(row['match_id'])
-                        player_id_int = int(row['player_id'])
-                        
-                        if match_id_int not in match_map or player_id_int not in player_map:
-                            continue
-                        
-                        stats = PlayerStats(
-                            match_id=match_map[match_id_int],
-                            player_id=player_map[player_id_int],
-                            points=int(row['points']),
-                            rebounds=int(row['rebounds']),
-                            assists=int(row['assists']),
-                            steals=int(row['steals']) if 'steals' in row and not pd.isna(row['steals']) else 0,
-                            blocks=int(row['blocks']) if 'blocks' in row and not pd.isna(row['blocks']) else 0,
-                            turnovers=int(row['turnovers']) if 'turnovers' in row and not pd.isna(row['turnovers']) else 0,
-                            three_pointers=int(row['three_pointers']) if 'three_pointers' in row and not pd.isna(row['three_pointers']) else 0
-                        )
-                        db.session.add(stats)
-                
-                # Calculate team wins, losses, and points based on match scores
-                update_team_statistics(tournament.id)
-                
-                db.session.commit()
-                flash('Tournament uploaded successfully!', 'success')
-                return redirect(url_for('main.upload', success=True))
-            
+                job = enqueue_upload(file, current_user.id)
             except Exception as e:
                 db.session.rollback()
+                print(f"Error in upload: {str(e)}")
+                if wants_json:
+                    return jsonify({'error': f'Error uploading tournament: {str(e)}'}), 500
                 flash(f'Error uploading tournament: {str(e)}', 'danger')
                 return redirect(request.url)
+            
+            if wants_json:
+                return jsonify({
+                    'job_id': job.id,
+                    'status_url': url_for('main.get_upload_job', job_id=job.id)
+                }), 202
+            return redirect(url_for('main.upload', job=job.id))
+        
+        if wants_json:
+            return jsonify({'error': 'Only .xlsx files can be uploaded'}), 400
+    
+    elif wants_json and request.method == 'POST':
+        errors = [error for field_errors in form.errors.values() for error in field_errors]
+        return jsonify({'error': ' '.join(errors) or 'Invalid upload'}), 400
+    
+    # Report the outcome of a job the user was redirected back with
+    job_id = request.args.get('job', type=int)
+    if job_id:
+        job = db.session.get(UploadJob, job_id)
+        if job and job.user_id == current_user.id:
+            fail_stale_job(job)
+            if job.status == 'succeeded':
+                flash(job.message, 'success')
+            elif job.status == 'failed':
+                flash(job.message, 'danger')
+            else:
+                flash('Your tournament is being imported. Refresh this page to check on it.', 'info')
+    
+    return render_template('upload.html', form=form, template_version=static_file_version(UPLOAD_TEMPLATE))
+
+@main_bp.app_errorhandler(413)
+def upload_too_large(error):
+    """Request bodies above MAX_CONTENT_LENGTH, i.e. workbooks over the upload limit"""
+    message = f"File size exceeds maximum limit of {current_app.config['UPLOAD_MAX_SIZE_MB']}MB"
+    if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+        return jsonify({'error': message}), 413
+    flash(message, 'danger')
+    return redirect(url_for('main.upload'))
+
+@main_bp.route('/api/upload_jobs/<int:job_id>', methods=['GET'])
+@login_required
+def get_upload_job(job_id):
+    """Progress of a tournament upload job"""
+    job = UploadJob.query.get_or_404(job_id)
     
-    return render_template('upload.html', form=form)
-
-def update_team_statistics(tournament_id):
-    """Update team wins, losses, and points based on match scores"""
-    # Get all matches with scores for this tournament
-    matches_with_scores = db.session.query(Match, MatchScore)\
-                                     .join(MatchScore)\
-                                     .filter(Match.tournament_id == tournament_id)\
-                                     .all()
+    if job.user_id != current_user.id:
+        return jsonify({'error': 'Access denied'}), 403
     
-    # Reset all team statistics for this tournament
-    teams = Team.query.filter_by(tournament_id=tournament_id).all()
-    for team in teams:
-        team.wins = 0
-        team.losses = 0
-        team.points = 0
-    
-    # Update based on match results
-    for match, score in matches_with_scores:
-        # Determine winner and update stats
-        if score.team1_score > score.team2_score:
-            # Team 1 wins
-            team1 = Team.query.get(match.team1_id)
-            team2 = Team.query.get(match.team2_id)
-            if team1 and team2:
-                team1.wins += 1
-                team1.points += 2  # 2 points for a win
-                team2.losses += 1
-        elif score.team2_score > score.team1_score:
-            # Team 2 wins
-            team1 = Team.query.get(match.team1_id)
-            team2 = Team.query.get(match.team2_id)
-            if team1 and team2:
-                team2.wins += 1
-                team2.points += 2  # 2 points for a win
-                team1.losses += 1
-        else:
-            # Draw
-            team1 = Team.query.get(match.team1_id)
-            team2 = Team.query.get(match.team2_id)
-            if team1 and team2:
-                team1.points += 1  # 1 point for a draw
-                team2.points += 1  # 1 point for a draw
+    # Nothing else finishes a job whose worker died mid-import
+    fail_stale_job(job)
+    
+    response = jsonify({
+        'id': job.id,
+        'filename': job.filename,
+        'status': job.status,
+        'progress': job.progress,
+        'message': job.message,
+        'finished': job.status in FINISHED_STATUSES,
+        'tournament_id': job.tournament_id,
+        'result_url': url_for('main.upload', job=job.id)
+    })
+    response.headers['Cache-Control'] = 'no-store'
+    return response
 
 @main_bp.route('/terms')
 def terms():
@@ -515,21 +285,12 @@ def visualise():
     """Route for data visualization page"""
     # Get tournaments that the current user has access to
     if current_user.is_authenticated:
-        # Get tournaments created by the user
-        created_tournaments = Tournament.query.filter_by(creator_id=current_user.id).all()
+        # Tournaments created by or shared with the user
+        access = tournament_access()
+        tournaments = Tournament.query.filter(Tournament.id.in_(access.readable)).order_by(Tournament.id).all()
         
-        # Get tournaments shared with the user
-        shared_tournament_ids = db.session.query(TournamentAccess.tournament_id)\
-            .filter_by(user_id=current_user.id).all()
-        shared_tournament_ids = [t[0] for t in shared_tournament_ids]
-        
-        shared_tournaments = Tournament.query.filter(Tournament.id.in_(shared_tournament_ids)).all()
-        
-        # Combine both lists
-        tournaments = created_tournaments + shared_tournaments
-        
-        # Remove duplicates
-        tournaments = list({t.id: t for t in tournaments}.values())
+        # Own tournaments first, then the shared ones
+        tournaments.sort(key=lambda t: t.id not in access.owned)
     else:
         tournaments = []
     
@@ -545,109 +306,44 @@ def get_tournament_data():
         team_id = request.args.get('team_id', 'all')
         player_id = request.args.get('player_id', 'all')
         
-        # Initialize response data
-        response = {
-            'summary': {},
-            'team_standings': {},
-            'points_distribution': {},
-            'top_scorers': {},
-            'player_efficiency': {},
-            'match_score_trends': {},
-            'double_triple_leaders': {},
-            'team_records': {}
-        }
-        
         # If tournament_id is 'all', get data across all accessible tournaments
         if tournament_id == 'all':
-            # Get tournaments created by the user
-            created_tournament_ids = [t.id for t in Tournament.query.filter_by(creator_id=current_user.id).all()]
-            
-            # Get tournaments shared with the user
-            shared_tournament_ids = [t[0] for t in db.session.query(TournamentAccess.tournament_id)
-                                .filter_by(user_id=current_user.id).all()]
-            
-            # Combine both lists
-            tournament_ids = list(set(created_tournament_ids + shared_tournament_ids))
+            # Tournaments created by or shared with the user, with their data versions
+            versions = dict(tournament_access().versions)
         else:
             # Check if user has access to the specified tournament
-            tournament = Tournament.query.get_or_404(tournament_id)
-            if tournament.creator_id != current_user.id and not TournamentAccess.query.filter_by(
-                tournament_id=tournament_id, user_id=current_user.id).first():
-                return jsonify({'error': 'Access denied'}), 403
+            tournament_id = int(tournament_id)
+            access = tournament_access()
+            if not access.can_view(tournament_id):
+                return access_denied(tournament_id)
             
-            tournament_ids = [int(tournament_id)]
-        
-        # Get tournament summary data
-        tournaments = Tournament.query.filter(Tournament.id.in_(tournament_ids)).all()
-        
-        # Get teams for these tournaments
-        teams_query = Team.query.filter(Team.tournament_id.in_(tournament_ids))
-        
-        # Apply team filter if specified
-        if team_id != 'all':
-            teams_query = teams_query.filter_by(id=team_id)
-        
-        teams = teams_query.all()
-        team_ids = [team.id for team in teams]
-        
-        # Get players for these teams
-        players_query = Player.query.filter(Player.team_id.in_(team_ids))
-        
-        # Apply player filter if specified
-        if player_id != 'all':
-            players_query = players_query.filter_by(id=player_id)
-        
-        players = players_query.all()
-        player_ids = [player.id for player in players]
+            versions = access.version(tournament_id)
         
-        # Get matches for these tournaments
-        matches = Match.query.filter(Match.tournament_id.in_(tournament_ids)).all()
-        match_ids = [match.id for match in matches]
+        # Optional team/player filters
+        team_filter = int(team_id) if team_id != 'all' else None
+        player_filter = int(player_id) if player_id != 'all' else None
         
-        # Get match scores
-        match_scores = MatchScore.query.filter(MatchScore.match_id.in_(match_ids)).all()
+        # Let the client reuse its copy while none of the tournaments has changed
+        etag = make_etag(versions)
+        unchanged = not_modified(etag)
+        if unchanged:
+            return unchanged
         
-        # Get player stats
-        player_stats_query = PlayerStats.query.filter(PlayerStats.match_id.in_(match_ids))
+        # Serve from cache while none of the tournaments has changed
+        cache = analytics_cache()
+        cache_key = versioned_key('tournament_data', versions, team_filter, player_filter)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return with_etag(jsonify(cached), etag)
         
-        # Apply player filter if specified
-        if player_id != 'all':
-            player_stats_query = player_stats_query.filter(PlayerStats.player_id.in_(player_ids))
+        # Chart series from the tournaments' column frames, which are cached per
+        # data version and so shared by every team/player filter
+        from app.services import analytics
+        response = analytics.chart_data(analytics.tournament_frames(versions), team_filter, player_filter)
         
-        player_stats = player_stats_query.all()
+        cache.set(cache_key, response)
         
-        # Process the data for visualizations
-        
-        # Summary data
-        response['summary'] = {
-            'teams_count': len(teams),
-            'players_count': len(players),
-            'matches_count': len(matches),
-            'avg_points_per_game': _calculate_avg_points_per_game(match_scores) if match_scores else 0
-        }
-        
-        # Team standings
-        response['team_standings'] = _get_team_standings_data(teams)
-        
-        # Points distribution
-        response['points_distribution'] = _get_points_distribution_data(teams, match_scores)
-        
-        # Top scorers
-        response['top_scorers'] = _get_top_scorers_data(players, player_stats)
-        
-        # Player efficiency
-        response['player_efficiency'] = _get_player_efficiency_data(players, player_stats)
-        
-        # Match score trends
-        response['match_score_trends'] = _get_match_score_trends_data(matches, match_scores)
-        
-        # Double-triple leaders
-        response['double_triple_leaders'] = _get_double_triple_leaders_data(players, player_stats)
-        
-        # Team records
-        response['team_records'] = _get_team_records_data(teams, match_scores)
-        
-        return jsonify(response)
+        return with_etag(jsonify(response), etag)
     
     except Exception as e:
         print(f"Error in get_tournament_data: {str(e)}")
@@ -665,10 +361,15 @@ def get_teams():
             return jsonify([])
         
         # Check if user has access to the tournament
-        tournament = Tournament.query.get_or_404(tournament_id)
-        if tournament.creator_id != current_user.id and not TournamentAccess.query.filter_by(
-            tournament_id=tournament_id, user_id=current_user.id).first():
-            return jsonify({'error': 'Access denied'}), 403
+        tournament_id = int(tournament_id)
+        access = tournament_access()
+        if not access.can_view(tournament_id):
+            return access_denied(tournament_id)
+        
+        etag = make_etag(access.version(tournament_id))
+        unchanged = not_modified(etag)
+        if unchanged:
+            return unchanged
         
         # Get teams for the tournament
         teams = Team.query.filter_by(tournament_id=tournament_id).all()
@@ -676,7 +377,7 @@ def get_teams():
         # Format the response
         team_list = [{'id': team.id, 'name': team.name} for team in teams]
         
-        return jsonify(team_list)
+        return with_etag(jsonify(team_list), etag)
     except Exception as e:
         print(f"Error in get_teams: {str(e)}")
         return jsonify({'error': str(e)}), 500
@@ -695,10 +396,14 @@ def get_players():
         team = Team.query.get_or_404(team_id)
         
         # Check if user has access to the tournament
-        tournament = Tournament.query.get_or_404(team.tournament_id)
-        if tournament.creator_id != current_user.id and not TournamentAccess.query.filter_by(
-            tournament_id=tournament.id, user_id=current_user.id).first():
-            return jsonify({'error': 'Access denied'}), 403
+        access = tournament_access()
+        if not access.can_view(team.tournament_id):
+            return access_denied(team.tournament_id)
+        
+        etag = make_etag(access.version(team.tournament_id))
+        unchanged = not_modified(etag)
+        if unchanged:
+            return unchanged
         
         # Get players for the team
         players = Player.query.filter_by(team_id=team_id).all()
@@ -706,272 +411,12 @@ def get_players():
         # Format the response
         player_list = [{'id': player.id, 'name': player.name} for player in players]
         
-        return jsonify(player_list)
+        return with_etag(jsonify(player_list), etag)
     
     except Exception as e:
         print(f"Error in get_players: {str(e)}")
         return jsonify({'error': str(e)}), 500
 
-# Helper functions for processing data
-
-def _calculate_avg_points_per_game(match_scores):
-    """Calculate the average points per game"""
-    if not match_scores:
-        return 0
-    
-    total_points = sum(score.team1_score + score.team2_score for score in match_scores)
-    return round(total_points / (len(match_scores) * 2), 1)  # Divide by 2 teams per match
-
-def _get_team_standings_data(teams):
-    """Format team standings data for visualization"""
-    if not teams:
-        return {'labels': [], 'wins': [], 'losses': []}
-    
-    # Sort teams by wins (descending)
-    sorted_teams = sorted(teams, key=lambda team: team.wins, reverse=True)
-    
-    return {
-        'labels': [team.name for team in sorted_teams],
-        'wins': [team.wins for team in sorted_teams],
-        'losses': [team.losses for team in sorted_teams]
-    }
-
-def _get_points_distribution_data(teams, match_scores):
-    """Format points distribution data for visualization"""
-    if not teams or not match_scores:
-        return {'labels': [], 'points_scored': [], 'points_conceded': []}
-    
-    # Create a dictionary to store team data
-    team_data = {team.id: {
-        'name': team.name,
-        'points_scored': 0,
-        'points_conceded': 0,
-        'games_played': 0
-    } for team in teams}
-    
-    # Process match scores
-    for score in match_scores:
-        match = Match.query.get(score.match_id)
-        
-        # Process team1 data
-        if match.team1_id in team_data:
-            team_data[match.team1_id]['points_scored'] += score.team1_score
-            team_data[match.team1_id]['points_conceded'] += score.team2_score
-            team_data[match.team1_id]['games_played'] += 1
-        
-        # Process team2 data
-        if match.team2_id in team_data:
-            team_data[match.team2_id]['points_scored'] += score.team2_score
-            team_data[match.team2_id]['points_conceded'] += score.team1_score
-            team_data[match.team2_id]['games_played'] += 1
-    
-    # Calculate averages
-    for team_id, data in team_data.items():
-        if data['games_played'] > 0:
-            data['points_scored'] = round(data['points_scored'] / data['games_played'], 1)
-            data['points_conceded'] = round(data['points_conceded'] / data['games_played'], 1)
-    
-    # Sort by points scored (descending)
-    sorted_teams = sorted(team_data.values(), key=lambda x: x['points_scored'], reverse=True)
-    
-    return {
-        'labels': [team['name'] for team in sorted_teams],
-        'points_scored': [team['points_scored'] for team in sorted_teams],
-        'points_conceded': [team['points_conceded'] for team in sorted_teams]
-    }
-
-def _get_top_scorers_data(players, player_stats):
-    """Format top scorers data for visualization"""
-    if not players or not player_stats:
-        return {'labels': [], 'points': [], 'teams': []}
-    
-    # Create a dictionary to store player data
-    player_data = {player.id: {
-        'name': player.name,
-        'total_points': 0,
-        'games_played': 0,
-        'team': Team.query.get(player.team_id).name
-    } for player in players}
-    
-    # Process player stats
-    for stat in player_stats:
-        if stat.player_id in player_data:
-            player_data[stat.player_id]['total_points'] += stat.points
-            player_data[stat.player_id]['games_played'] += 1
-    
-    # Calculate averages
-    for player_id, data in player_data.items():
-        if data['games_played'] > 0:
-            data['ppg'] = round(data['total_points'] / data['games_played'], 1)
-        else:
-            data['ppg'] = 0
-    
-    # Sort by PPG (descending) and take top 5
-    sorted_players = sorted(player_data.values(), key=lambda x: x['ppg'], reverse=True)[:5]
-    
-    return {
-        'labels': [f"{player['name'].split(' ')[0][0]}. {player['name'].split(' ')[-1]}" for player in sorted_players],
-        'points': [player['ppg'] for player in sorted_players],
-        'teams': [player['team'] for player in sorted_players]
-    }
-
-def _get_player_efficiency_data(players, player_stats):
-    """Format player efficiency data for visualization"""
-    if not players or not player_stats:
-        return {'labels': [], 'efficiency': [], 'teams': []}
-    
-    # Create a dictionary to store player data
-    player_data = {player.id: {
-        'name': player.name,
-        'total_efficiency': 0,
-        'games_played': 0,
-        'team': Team.query.get(player.team_id).name
-    } for player in players}
-    
-    # Process player stats
-    for stat in player_stats:
-        if stat.player_id in player_data:
-            player_data[stat.player_id]['total_efficiency'] += stat.efficiency
-            player_data[stat.player_id]['games_played'] += 1
-    
-    # Calculate averages
-    for player_id, data in player_data.items():
-        if data['games_played'] > 0:
-            data['avg_efficiency'] = round(data['total_efficiency'] / data['games_played'], 1)
-        else:
-            data['avg_efficiency'] = 0
-    
-    # Sort by efficiency (descending) and take top 5
-    sorted_players = sorted(player_data.values(), key=lambda x: x['avg_efficiency'], reverse=True)[:5]
-    
-    return {
-        'labels': [f"{player['name'].split(' ')[0][0]}. {player['name'].split(' ')[-1]}" for player in sorted_players],
-        'efficiency': [player['avg_efficiency'] for player in sorted_players],
-        'teams': [player['team'] for player in sorted_players]
-    }
-
-def _get_match_score_trends_data(matches, match_scores):
-    """Format match score trends data for visualization"""
-    if not matches or not match_scores:
-        return {'labels': [], 'winning_scores': [], 'losing_scores': [], 'avg_scores': []}
-    
-    # Create a dictionary to map match_id to match_score
-    score_map = {score.match_id: score for score in match_scores}
-    
-    # Filter matches with scores and sort by date
-    scored_matches = [match for match in matches if match.id in score_map]
-    sorted_matches = sorted(scored_matches, key=lambda x: x.match_date)[:10]  # Last 10 matches
-    
-    labels = []
-    winning_scores = []
-    losing_scores = []
-    avg_scores = []
-    
-    for idx, match in enumerate(sorted_matches):
-        score = score_map[match.id]
-        
-        # Create labels (Game 1, Game 2, etc.)
-        labels.append(f"Game {idx+1}")
-        
-        # Determine winning and losing scores
-        if score.team1_score >= score.team2_score:
-            winning_scores.append(score.team1_score)
-            losing_scores.append(score.team2_score)
-        else:
-            winning_scores.append(score.team2_score)
-            losing_scores.append(score.team1_score)
-        
-        # Calculate average score
-        avg_scores.append(round((score.team1_score + score.team2_score) / 2, 1))
-    
-    return {
-        'labels': labels,
-        'winning_scores': winning_scores,
-        'losing_scores': losing_scores,
-        'avg_scores': avg_scores
-    }
-
-def _get_double_triple_leaders_data(players, player_stats):
-    """Format double-double and triple-double leaders data for visualization"""
-    if not players or not player_stats:
-        return {'labels': [], 'double_doubles': [], 'triple_doubles': []}
-    
-    # Create a dictionary to store player data
-    player_data = {player.id: {
-        'name': player.name,
-        'double_doubles': 0,
-        'triple_doubles': 0
-    } for player in players}
-    
-    # Process player stats
-    for stat in player_stats:
-        if stat.player_id in player_data:
-            if stat.double_double:
-                player_data[stat.player_id]['double_doubles'] += 1
-            if stat.triple_double:
-                player_data[stat.player_id]['triple_doubles'] += 1
-    
-    # Sort by double-doubles and triple-doubles (descending) and take top 5
-    sorted_players = sorted(
-        player_data.values(),
-        key=lambda x: (x['triple_doubles'], x['double_doubles']),
-        reverse=True
-    )[:5]
-    
-    return {
-        'labels': [f"{player['name'].split(' ')[0][0]}. {player['name'].split(' ')[-1]}" for player in sorted_players],
-        'double_doubles': [player['double_doubles'] for player in sorted_players],
-        'triple_doubles': [player['triple_doubles'] for player in sorted_players]
-    }
-
-def _get_team_records_data(teams, match_scores):
-    """Format team records data for visualization"""
-    if not teams or not match_scores:
-        return []
-    
-    # Create a dictionary to store team data
-    team_data = {team.id: {
-        'team': team.name,
-        'wins': team.wins,
-        'losses': team.losses,
-        'win_pct': round(team.wins / (team.wins + team.losses) * 100, 1) if (team.wins + team.losses) > 0 else 0,
-        'pts_scored': 0,
-        'pts_allowed': 0,
-        'games_played': 0
-    } for team in teams}
-    
-    # Process match scores
-    for score in match_scores:
-        match = Match.query.get(score.match_id)
-        
-        # Process team1 data
-        if match.team1_id in team_data:
-            team_data[match.team1_id]['pts_scored'] += score.team1_score
-            team_data[match.team1_id]['pts_allowed'] += score.team2_score
-            team_data[match.team1_id]['games_played'] += 1
-        
-        # Process team2 data
-        if match.team2_id in team_data:
-            team_data[match.team2_id]['pts_scored'] += score.team2_score
-            team_data[match.team2_id]['pts_allowed'] += score.team1_score
-            team_data[match.team2_id]['games_played'] += 1
-    
-    # Calculate averages and point differential
-    for team_id, data in team_data.items():
-        if data['games_played'] > 0:
-            data['pts_scored'] = round(data['pts_scored'] / data['games_played'], 1)
-            data['pts_allowed'] = round(data['pts_allowed'] / data['games_played'], 1)
-            data['diff'] = round(data['pts_scored'] - data['pts_allowed'], 1)
-        else:
-            data['pts_scored'] = 0
-            data['pts_allowed'] = 0
-            data['diff'] = 0
-    
-    # Sort by win percentage (descending)
-    sorted_teams = sorted(team_data.values(), key=lambda x: x['win_pct'], reverse=True)
-    
-    return sorted_teams
-
 @main_bp.route('/api/player_stats', methods=['GET'])
 @login_required
 def get_player_stats():
@@ -982,39 +427,40 @@ def get_player_stats():
         if not player_id:
             return jsonify({'error': 'Missing player_id parameter'}), 400
         
-        # Get player details
-        player = Player.query.get_or_404(player_id)
-        
-        # Get team to check tournament access
-        team = Team.query.get_or_404(player.team_id)
+        # Get player details and the team to check tournament access
+        player, team = player_with_team_or_404(player_id)
         
         # Check if user has access to the tournament
-        tournament = Tournament.query.get_or_404(team.tournament_id)
-        if tournament.creator_id != current_user.id and not TournamentAccess.query.filter_by(
-            tournament_id=tournament.id, user_id=current_user.id).first():
-            return jsonify({'error': 'Access denied'}), 403
+        access = tournament_access()
+        if not access.can_view(team.tournament_id):
+            return access_denied(team.tournament_id)
         
-        # Get player stats from all matches
-        player_stats = PlayerStats.query.filter_by(player_id=player_id).all()
+        etag = make_etag(access.version(team.tournament_id))
+        unchanged = not_modified(etag)
+        if unchanged:
+            return unchanged
         
-        if not player_stats:
+        # The player's season totals, kept up to date as stats are saved
+        totals = db.session.get(PlayerSeasonTotals, player_id)
+        
+        if not totals or not totals.games:
             # No stats available, return default data
-            return jsonify({
+            return with_etag(jsonify({
                 'player_name': player.name,
                 'team_name': team.name,
                 'stat_labels': ['Points', 'Rebounds', 'Assists', 'Steals', 'Blocks', '3-Pointers'],
                 'player_stats': [0, 0, 0, 0, 0, 0],
                 'league_avg_stats': [15.7, 5.2, 4.3, 1.1, 0.6, 1.8]
-            })
+            }), etag)
         
         # Calculate averages
-        total_games = len(player_stats)
-        avg_points = sum(stat.points for stat in player_stats) / total_games
-        avg_rebounds = sum(stat.rebounds for stat in player_stats) / total_games
-        avg_assists = sum(stat.assists for stat in player_stats) / total_games
-        avg_steals = sum(stat.steals for stat in player_stats) / total_games
-        avg_blocks = sum(stat.blocks for stat in player_stats) / total_games
-        avg_three_pointers = sum(stat.three_pointers for stat in player_stats) / total_games
+        total_games = totals.games
+        avg_points = totals.points / total_games
+        avg_rebounds = totals.rebounds / total_games
+        avg_assists = totals.assists / total_games
+        avg_steals = totals.steals / total_games
+        avg_blocks = totals.blocks / total_games
+        avg_three_pointers = totals.three_pointers / total_games
         
         # Calculate league averages from all players, but using fixed values for simplicity
         # Could be calculated dynamically based on all player stats in the future
@@ -1025,7 +471,7 @@ def get_player_stats():
         league_avg_blocks = 0.6
         league_avg_three_pointers = 1.8
         
-        return jsonify({
+        return with_etag(jsonify({
             'player_name': player.name,
             'team_name': team.name,
             'stat_labels': ['Points', 'Rebounds', 'Assists', 'Steals', 'Blocks', '3-Pointers'],
@@ -1045,7 +491,7 @@ def get_player_stats():
                 league_avg_blocks,
                 league_avg_three_pointers
             ]
-        })
+        }), etag)
     
     except Exception as e:
         print(f"Error in get_player_stats: {str(e)}")
@@ -1078,17 +524,42 @@ def tournament_editor():
 # API Endpoints for Tournament Management
 
 # Tournament endpoints
+
+# Newest year first, then by name; id keeps the order total for the cursor
+TOURNAMENT_LIST_ORDER = [(Tournament.year, True), (Tournament.name, False), (Tournament.id, False)]
+
 @main_bp.route('/api/tournaments', methods=['GET'])
 @login_required
 def get_tournaments():
-    """Get tournaments created by the current user with optional search"""
+    """Get tournaments created by the current user with optional search.
+
+    Supports keyset pagination through ?limit= and ?cursor= (see
+    app/services/pagination.py); without a limit every tournament is returned.
+    """
     search_query = request.args.get('q', '')
     
-    query = Tournament.query.filter_by(creator_id=current_user.id)
+    # Team and match counts come from correlated subqueries, evaluated only for the returned page
+    teams_count = select(func.count(Team.id))\
+        .where(Team.tournament_id == Tournament.id)\
+        .correlate(Tournament).scalar_subquery()
+    matches_count = select(func.count(Match.id))\
+        .where(Match.tournament_id == Tournament.id)\
+        .correlate(Tournament).scalar_subquery()
+    
+    query = select(
+        Tournament.id,
+        Tournament.name,
+        Tournament.description,
+        Tournament.year,
+        Tournament.start_date,
+        Tournament.end_date,
+        teams_count.label('teams_count'),
+        matches_count.label('matches_count')
+    ).where(Tournament.creator_id == current_user.id)
     
     if search_query:
         search_term = f"%{search_query}%"
-        query = query.filter(
+        query = query.where(
             db.or_(
                 Tournament.name.ilike(search_term),
                 Tournament.description.ilike(search_term),
@@ -1096,26 +567,23 @@ def get_tournaments():
             )
         )
     
-    tournaments = query.order_by(Tournament.year.desc(), Tournament.name).all()
-    
-    result = []
-    for tournament in tournaments:
-        # Count teams and matches for the tournament
-        teams_count = Team.query.filter_by(tournament_id=tournament.id).count()
-        matches_count = Match.query.filter_by(tournament_id=tournament.id).count()
-        
-        result.append({
-            'id': tournament.id,
-            'name': tournament.name,
-            'description': tournament.description or '',
-            'year': tournament.year,
-            'start_date': tournament.start_date.isoformat() if tournament.start_date else None,
-            'end_date': tournament.end_date.isoformat() if tournament.end_date else None,
-            'teams_count': teams_count,
-            'matches_count': matches_count
-        })
-    
-    return jsonify(result)
+    try:
+        rows, next_cursor = fetch_page(query, TOURNAMENT_LIST_ORDER)
+    except InvalidCursor as e:
+        return jsonify({'error': str(e)}), 400
+    
+    result = [{
+        'id': row.id,
+        'name': row.name,
+        'description': row.description or '',
+        'year': row.year,
+        'start_date': row.start_date.isoformat() if row.start_date else None,
+        'end_date': row.end_date.isoformat() if row.end_date else None,
+        'teams_count': row.teams_count,
+        'matches_count': row.matches_count
+    } for row in rows]
+    
+    return with_next_cursor(jsonify(result), next_cursor)
 
 @main_bp.route('/api/tournament/<int:tournament_id>', methods=['GET'])
 @login_required
@@ -1126,6 +594,11 @@ def get_tournament(tournament_id):
     if tournament.creator_id != current_user.id:
         return jsonify({'error': 'Access denied'}), 403
     
+    etag = make_etag({tournament.id: tournament.data_version})
+    unchanged = not_modified(etag)
+    if unchanged:
+        return unchanged
+    
     result = {
         'id': tournament.id,
         'name': tournament.name,
@@ -1135,7 +608,7 @@ def get_tournament(tournament_id):
         'end_date': tournament.end_date.isoformat() if tournament.end_date else None
     }
     
-    return jsonify(result)
+    return with_etag(jsonify(result), etag)
 
 @main_bp.route('/api/tournament/<int:tournament_id>', methods=['PUT'])
 @login_required
@@ -1160,6 +633,7 @@ def update_tournament(tournament_id):
         end_date = datetime.fromisoformat(data['end_date'])
         tournament.end_date = end_date.date()
     
+    bump_data_version(tournament.id)
     db.session.commit()
     
     return jsonify({'message': 'Tournament updated successfully'})
@@ -1177,43 +651,8 @@ def delete_tournament(tournament_id):
     try:
         db.session.begin_nested()
         
-        # Delete associated data in correct order (respecting foreign key constraints)
-        
-        # 1. Delete player stats
-        player_ids = db.session.query(Player.id).filter(Player.team_id.in_(
-            db.session.query(Team.id).filter_by(tournament_id=tournament_id)
-        )).all()
-        player_ids = [pid[0] for pid in player_ids]
-        
-        match_ids = db.session.query(Match.id).filter_by(tournament_id=tournament_id).all()
-        match_ids = [mid[0] for mid in match_ids]
-        
-        PlayerStats.query.filter(
-            db.and_(
-                PlayerStats.player_id.in_(player_ids),
-                PlayerStats.match_id.in_(match_ids)
-            )
-        ).delete(synchronize_session=False)
-        
-        # 2. Delete match scores
-        MatchScore.query.filter(MatchScore.match_id.in_(match_ids)).delete(synchronize_session=False)
-        
-        # 3. Delete matches
-        Match.query.filter_by(tournament_id=tournament_id).delete(synchronize_session=False)
-        
-        # 4. Delete players
-        Player.query.filter(Player.team_id.in_(
-            db.session.query(Team.id).filter_by(tournament_id=tournament_id)
-        )).delete(synchronize_session=False)
-        
-        # 5. Delete teams
-        Team.query.filter_by(tournament_id=tournament_id).delete(synchronize_session=False)
-        
-        # 6. Delete tournament access
-        TournamentAccess.query.filter_by(tournament_id=tournament_id).delete(synchronize_session=False)
-        
-        # 7. Delete the tournament
-        db.session.delete(tournament)
+        # Delete the tournament and everything attached to it, one statement per table
+        delete_tournament_cascade(tournament_id)
         
         db.session.commit()
         
@@ -1225,41 +664,147 @@ def delete_tournament(tournament_id):
         return jsonify({'error': str(e)}), 500
 
 # Team Management Endpoints
+@main_bp.route('/api/tournament/<int:tournament_id>/snapshot', methods=['GET'])
+@login_required
+def get_tournament_snapshot(tournament_id):
+    """Everything the editor works with for a tournament, in one response.
+
+    Teams, players and matches are keyed by id and stats by match id then
+    player id; names are not repeated, the client joins them from the maps.
+    One query each for the tournament, teams, players, matches with their
+    scores, and stats.
+    """
+    access = tournament_access()
+    if not access.can_edit(tournament_id):
+        return access_denied(tournament_id)
+    
+    etag = make_etag(access.version(tournament_id))
+    unchanged = not_modified(etag)
+    if unchanged:
+        return unchanged
+    
+    tournament = db.session.get(Tournament, tournament_id)
+    teams = Team.query.filter_by(tournament_id=tournament_id).all()
+    players = Player.query.join(Team, Player.team_id == Team.id)\
+        .filter(Team.tournament_id == tournament_id).all()
+    matches = Match.query.outerjoin(MatchScore)\
+        .options(contains_eager(Match.score))\
+        .filter(Match.tournament_id == tournament_id).all()
+    stats = PlayerStats.query.join(Match, PlayerStats.match_id == Match.id)\
+        .filter(Match.tournament_id == tournament_id).all()
+    
+    result = {
+        'version': access.versions[tournament_id],
+        'tournament': {
+            'id': tournament.id,
+            'name': tournament.name,
+            'description': tournament.description or '',
+            'year': tournament.year,
+            'start_date': tournament.start_date.isoformat() if tournament.start_date else None,
+            'end_date': tournament.end_date.isoformat() if tournament.end_date else None
+        },
+        'teams': {
+            team.id: {
+                'name': team.name,
+                'created_year': team.created_year,
+                'logo_shape_type': team.logo_shape_type,
+                'primary_color': team.primary_color,
+                'secondary_color': team.secondary_color,
+                'wins': team.wins,
+                'losses': team.losses,
+                'points': team.points
+            } for team in teams
+        },
+        'players': {
+            player.id: {
+                'name': player.name,
+                'height': player.height,
+                'weight': player.weight,
+                'position': player.position,
+                'jersey_number': player.jersey_number,
+                'team_id': player.team_id
+            } for player in players
+        },
+        'matches': {
+            match.id: {
+                'team1_id': match.team1_id,
+                'team2_id': match.team2_id,
+                'venue_name': match.venue_name,
+                'match_date': match.match_date.isoformat(),
+                'team1_score': match.score.team1_score if match.score else None,
+                'team2_score': match.score.team2_score if match.score else None
+            } for match in matches
+        },
+        'stats': {}
+    }
+    
+    for stat in stats:
+        stat_data = {field: getattr(stat, field) for field in BOX_SCORE_FIELDS}
+        stat_data.update({
+            'id': stat.id,
+            'efficiency': stat.efficiency,
+            'double_double': stat.double_double,
+            'triple_double': stat.triple_double
+        })
+        result['stats'].setdefault(stat.match_id, {})[stat.player_id] = stat_data
+    
+    return with_etag(jsonify(result), etag)
+
+# Orderings offered by the editor listings (?sort=key or ?sort=-key). Each
+# ends with the id so the order is total for the cursor, and each has an
+# index that starts with the listing's filter column
+TEAM_SORTS = {'name': [Team.name, Team.id]}
+PLAYER_SORTS = {'name': [Player.name, Player.id], 'jersey': [Player.jersey_number, Player.id]}
+MATCH_SORTS = {'date': [Match.match_date, Match.id]}
+
 @main_bp.route('/api/tournament/<int:tournament_id>/teams', methods=['GET'])
 @login_required
 def get_teams_for_tournament(tournament_id):
-    """Get all teams for a tournament"""
-    tournament = Tournament.query.get_or_404(tournament_id)
+    """Get the teams of a tournament, by name.
+
+    Supports ?sort=name|-name and keyset pagination through ?limit= and
+    ?cursor= (see app/services/pagination.py).
+    """
+    access = tournament_access()
+    if not access.can_edit(tournament_id):
+        return access_denied(tournament_id)
     
-    if tournament.creator_id != current_user.id:
-        return jsonify({'error': 'Access denied'}), 403
+    etag = make_etag(access.version(tournament_id))
+    unchanged = not_modified(etag)
+    if unchanged:
+        return unchanged
     
-    teams = Team.query.filter_by(tournament_id=tournament_id).all()
+    query = select(
+        Team.id, Team.name, Team.created_year, Team.logo_shape_type, Team.primary_color,
+        Team.secondary_color, Team.wins, Team.losses, Team.points
+    ).where(Team.tournament_id == tournament_id)
     
-    result = []
-    for team in teams:
-        result.append({
-            'id': team.id,
-            'name': team.name,
-            'created_year': team.created_year,
-            'logo_shape_type': team.logo_shape_type,
-            'primary_color': team.primary_color,
-            'secondary_color': team.secondary_color,
-            'wins': team.wins,
-            'losses': team.losses,
-            'points': team.points
-        })
-    
-    return jsonify(result)
+    try:
+        rows, next_cursor = fetch_page(query, sort_order(TEAM_SORTS, 'name'))
+    except InvalidCursor as e:
+        return jsonify({'error': str(e)}), 400
+    
+    result = [{
+        'id': row.id,
+        'name': row.name,
+        'created_year': row.created_year,
+        'logo_shape_type': row.logo_shape_type,
+        'primary_color': row.primary_color,
+        'secondary_color': row.secondary_color,
+        'wins': row.wins,
+        'losses': row.losses,
+        'points': row.points
+    } for row in rows]
+    
+    return with_next_cursor(with_etag(jsonify(result), etag), next_cursor)
 
 @main_bp.route('/api/tournament/<int:tournament_id>/teams', methods=['POST'])
 @login_required
 def create_team(tournament_id):
     """Create a new team in a tournament"""
-    tournament = Tournament.query.get_or_404(tournament_id)
-    
-    if tournament.creator_id != current_user.id:
-        return jsonify({'error': 'Access denied'}), 403
+    access = tournament_access()
+    if not access.can_edit(tournament_id):
+        return access_denied(tournament_id)
     
     data = request.json
     
@@ -1281,6 +826,7 @@ def create_team(tournament_id):
     )
     
     db.session.add(team)
+    bump_data_version(tournament_id)
     db.session.commit()
     
     return jsonify({
@@ -1296,9 +842,15 @@ def get_team(team_id):
     team = Team.query.get_or_404(team_id)
     
     # Check if user has access to the team's tournament
-    tournament = Tournament.query.get_or_404(team.tournament_id)
-    if tournament.creator_id != current_user.id:
-        return jsonify({'error': 'Access denied'}), 403
+    tournament_id = team.tournament_id
+    access = tournament_access()
+    if not access.can_edit(tournament_id):
+        return access_denied(tournament_id)
+    
+    etag = make_etag(access.version(tournament_id))
+    unchanged = not_modified(etag)
+    if unchanged:
+        return unchanged
     
     result = {
         'id': team.id,
@@ -1313,7 +865,7 @@ def get_team(team_id):
         'tournament_id': team.tournament_id
     }
     
-    return jsonify(result)
+    return with_etag(jsonify(result), etag)
 
 @main_bp.route('/api/team/<int:team_id>', methods=['PUT'])
 @login_required
@@ -1322,9 +874,10 @@ def update_team(team_id):
     team = Team.query.get_or_404(team_id)
     
     # Check if user has access to the team's tournament
-    tournament = Tournament.query.get_or_404(team.tournament_id)
-    if tournament.creator_id != current_user.id:
-        return jsonify({'error': 'Access denied'}), 403
+    tournament_id = team.tournament_id
+    access = tournament_access()
+    if not access.can_edit(tournament_id):
+        return access_denied(tournament_id)
     
     data = request.json
     
@@ -1350,6 +903,7 @@ def update_team(team_id):
     if 'points' in data:
         team.points = data['points']
     
+    bump_data_version(tournament_id)
     db.session.commit()
     
     return jsonify({'message': 'Team updated successfully'})
@@ -1361,48 +915,18 @@ def delete_team(team_id):
     team = Team.query.get_or_404(team_id)
     
     # Check if user has access to the team's tournament
-    tournament = Tournament.query.get_or_404(team.tournament_id)
-    if tournament.creator_id != current_user.id:
-        return jsonify({'error': 'Access denied'}), 403
+    tournament_id = team.tournament_id
+    access = tournament_access()
+    if not access.can_edit(tournament_id):
+        return access_denied(tournament_id)
     
     try:
         db.session.begin_nested()
         
-        # 1. Get all players for this team
-        players = Player.query.filter_by(team_id=team_id).all()
-        player_ids = [player.id for player in players]
-        
-        # 2. Delete player stats for players on this team
-        if player_ids:
-            PlayerStats.query.filter(PlayerStats.player_id.in_(player_ids)).delete(synchronize_session=False)
-        
-        # 3. Delete players
-        Player.query.filter_by(team_id=team_id).delete(synchronize_session=False)
-        
-        # 4. Get all matches involving this team
-        team_matches = Match.query.filter(
-            db.or_(
-                Match.team1_id == team_id,
-                Match.team2_id == team_id
-            )
-        ).all()
-        match_ids = [match.id for match in team_matches]
-        
-        # 5. Delete match scores for matches involving this team
-        if match_ids:
-            MatchScore.query.filter(MatchScore.match_id.in_(match_ids)).delete(synchronize_session=False)
-        
-        # 6. Delete player stats for matches involving this team
-        if match_ids:
-            PlayerStats.query.filter(PlayerStats.match_id.in_(match_ids)).delete(synchronize_session=False)
-        
-        # 7. Delete matches
-        for match_id in match_ids:
-            Match.query.filter_by(id=match_id).delete(synchronize_session=False)
-        
-        # 8. Delete the team
-        db.session.delete(team)
+        # Delete the team, its players and the matches it played, one statement per table
+        delete_team_cascade(team_id)
         
+        bump_data_version(tournament_id)
         db.session.commit()
         
         return jsonify({'message': 'Team deleted successfully'})
@@ -1420,9 +944,15 @@ def get_players_for_team(team_id):
     team = Team.query.get_or_404(team_id)
     
     # Check if user has access to the team's tournament
-    tournament = Tournament.query.get_or_404(team.tournament_id)
-    if tournament.creator_id != current_user.id:
-        return jsonify({'error': 'Access denied'}), 403
+    tournament_id = team.tournament_id
+    access = tournament_access()
+    if not access.can_edit(tournament_id):
+        return access_denied(tournament_id)
+    
+    etag = make_etag(access.version(tournament_id))
+    unchanged = not_modified(etag)
+    if unchanged:
+        return unchanged
     
     players = Player.query.filter_by(team_id=team_id).all()
     
@@ -1439,43 +969,55 @@ def get_players_for_team(team_id):
             'team_name': team.name
         })
     
-    return jsonify(result)
+    return with_etag(jsonify(result), etag)
 
 @main_bp.route('/api/tournament/<int:tournament_id>/players', methods=['GET'])
 @login_required
 def get_players_for_tournament(tournament_id):
-    """Get all players in a tournament"""
-    tournament = Tournament.query.get_or_404(tournament_id)
-    
-    if tournament.creator_id != current_user.id:
-        return jsonify({'error': 'Access denied'}), 403
-    
-    # Get all team IDs for this tournament
-    team_ids = [team.id for team in Team.query.filter_by(tournament_id=tournament_id).all()]
-    
-    if not team_ids:
-        return jsonify([])
-    
-    # Get all players for these teams
-    players = Player.query.filter(Player.team_id.in_(team_ids)).all()
-    
-    # Create a mapping of team_id to team_name for efficient lookup
-    teams = {team.id: team.name for team in Team.query.filter_by(tournament_id=tournament_id).all()}
-    
-    result = []
-    for player in players:
-        result.append({
-            'id': player.id,
-            'name': player.name,
-            'height': player.height,
-            'weight': player.weight,
-            'position': player.position,
-            'jersey_number': player.jersey_number,
-            'team_id': player.team_id,
-            'team_name': teams.get(player.team_id, 'Unknown')
-        })
+    """Get the players of a tournament, by name.
+
+    Filters: ?team_id= and ?position=. Supports ?sort=name|jersey (or -name,
+    -jersey) and keyset pagination through ?limit= and ?cursor=. Pages of one
+    team's players are read straight from the (team_id, name/jersey) indexes.
+    """
+    access = tournament_access()
+    if not access.can_edit(tournament_id):
+        return access_denied(tournament_id)
+    
+    etag = make_etag(access.version(tournament_id))
+    unchanged = not_modified(etag)
+    if unchanged:
+        return unchanged
+    
+    query = select(
+        Player.id, Player.name, Player.height, Player.weight, Player.position,
+        Player.jersey_number, Player.team_id, Team.name.label('team_name')
+    ).join(Team, Player.team_id == Team.id).where(Team.tournament_id == tournament_id)
+    
+    team_id = request.args.get('team_id', type=int)
+    if team_id is not None:
+        query = query.where(Player.team_id == team_id)
+    position = request.args.get('position')
+    if position:
+        query = query.where(Player.position == position)
     
-    return jsonify(result)
+    try:
+        rows, next_cursor = fetch_page(query, sort_order(PLAYER_SORTS, 'name'))
+    except InvalidCursor as e:
+        return jsonify({'error': str(e)}), 400
+    
+    result = [{
+        'id': row.id,
+        'name': row.name,
+        'height': row.height,
+        'weight': row.weight,
+        'position': row.position,
+        'jersey_number': row.jersey_number,
+        'team_id': row.team_id,
+        'team_name': row.team_name
+    } for row in rows]
+    
+    return with_next_cursor(with_etag(jsonify(result), etag), next_cursor)
 
 @main_bp.route('/api/team/<int:team_id>/players', methods=['POST'])
 @login_required
@@ -1484,9 +1026,10 @@ def create_player(team_id):
     team = Team.query.get_or_404(team_id)
     
     # Check if user has access to the team's tournament
-    tournament = Tournament.query.get_or_404(team.tournament_id)
-    if tournament.creator_id != current_user.id:
-        return jsonify({'error': 'Access denied'}), 403
+    tournament_id = team.tournament_id
+    access = tournament_access()
+    if not access.can_edit(tournament_id):
+        return access_denied(tournament_id)
     
     data = request.json
     
@@ -1506,6 +1049,7 @@ def create_player(team_id):
     )
     
     db.session.add(player)
+    bump_data_version(tournament_id)
     db.session.commit()
     
     return jsonify({
@@ -1518,13 +1062,18 @@ def create_player(team_id):
 @login_required
 def get_player(player_id):
     """Get details for a specific player"""
-    player = Player.query.get_or_404(player_id)
+    player, team = player_with_team_or_404(player_id)
     
     # Check if user has access to the player's team's tournament
-    team = Team.query.get_or_404(player.team_id)
-    tournament = Tournament.query.get_or_404(team.tournament_id)
-    if tournament.creator_id != current_user.id:
-        return jsonify({'error': 'Access denied'}), 403
+    tournament_id = team.tournament_id
+    access = tournament_access()
+    if not access.can_edit(tournament_id):
+        return access_denied(tournament_id)
+    
+    etag = make_etag(access.version(tournament_id))
+    unchanged = not_modified(etag)
+    if unchanged:
+        return unchanged
     
     result = {
         'id': player.id,
@@ -1537,19 +1086,19 @@ def get_player(player_id):
         'team_name': team.name
     }
     
-    return jsonify(result)
+    return with_etag(jsonify(result), etag)
 
 @main_bp.route('/api/player/<int:player_id>', methods=['PUT'])
 @login_required
 def update_player(player_id):
     """Update player details"""
-    player = Player.query.get_or_404(player_id)
+    player, team = player_with_team_or_404(player_id)
     
     # Check if user has access to the player's team's tournament
-    team = Team.query.get_or_404(player.team_id)
-    tournament = Tournament.query.get_or_404(team.tournament_id)
-    if tournament.creator_id != current_user.id:
-        return jsonify({'error': 'Access denied'}), 403
+    tournament_id = team.tournament_id
+    access = tournament_access()
+    if not access.can_edit(tournament_id):
+        return access_denied(tournament_id)
     
     data = request.json
     
@@ -1564,7 +1113,7 @@ def update_player(player_id):
     # If changing teams, ensure the new team is in the same tournament
     if 'team_id' in data:
         new_team = Team.query.get_or_404(data['team_id'])
-        if new_team.tournament_id != tournament.id:
+        if new_team.tournament_id != tournament_id:
             return jsonify({'error': 'Cannot move player to a team in a different tournament'}), 400
     
     # Update fields
@@ -1581,6 +1130,7 @@ def update_player(player_id):
     if 'team_id' in data:
         player.team_id = data['team_id']
     
+    bump_data_version(tournament_id)
     db.session.commit()
     
     return jsonify({'message': 'Player updated successfully'})
@@ -1589,13 +1139,13 @@ def update_player(player_id):
 @login_required
 def delete_player(player_id):
     """Delete a player and all associated data"""
-    player = Player.query.get_or_404(player_id)
+    player, team = player_with_team_or_404(player_id)
     
     # Check if user has access to the player's team's tournament
-    team = Team.query.get_or_404(player.team_id)
-    tournament = Tournament.query.get_or_404(team.tournament_id)
-    if tournament.creator_id != current_user.id:
-        return jsonify({'error': 'Access denied'}), 403
+    tournament_id = team.tournament_id
+    access = tournament_access()
+    if not access.can_edit(tournament_id):
+        return access_denied(tournament_id)
     
     try:
         db.session.begin_nested()
@@ -1606,6 +1156,7 @@ def delete_player(player_id):
         # 2. Delete the player
         db.session.delete(player)
         
+        bump_data_version(tournament_id)
         db.session.commit()
         
         return jsonify({'message': 'Player deleted successfully'})
@@ -1619,55 +1170,75 @@ def delete_player(player_id):
 @main_bp.route('/api/tournament/<int:tournament_id>/matches', methods=['GET'])
 @login_required
 def get_matches_for_tournament(tournament_id):
-    """Get all matches for a tournament"""
-    tournament = Tournament.query.get_or_404(tournament_id)
-    
-    if tournament.creator_id != current_user.id:
-        return jsonify({'error': 'Access denied'}), 403
-    
-    matches = Match.query.filter_by(tournament_id=tournament_id).order_by(Match.match_date).all()
-    
-    # Create mappings for team lookups
-    team_map = {team.id: team.name for team in Team.query.filter_by(tournament_id=tournament_id).all()}
+    """Get the matches of a tournament, by date.
+
+    Filters: ?team_id= (either side) and ?played=true|false. Supports
+    ?sort=date|-date and keyset pagination through ?limit= and ?cursor=.
+    """
+    access = tournament_access()
+    if not access.can_edit(tournament_id):
+        return access_denied(tournament_id)
+    
+    etag = make_etag(access.version(tournament_id))
+    unchanged = not_modified(etag)
+    if unchanged:
+        return unchanged
+    
+    team1 = aliased(Team)
+    team2 = aliased(Team)
+    query = select(
+        Match.id, Match.team1_id, team1.name.label('team1_name'), Match.team2_id,
+        team2.name.label('team2_name'), Match.venue_name, Match.match_date,
+        MatchScore.id.label('score_id'), MatchScore.team1_score, MatchScore.team2_score
+    ).join(team1, Match.team1_id == team1.id)\
+        .join(team2, Match.team2_id == team2.id)\
+        .outerjoin(MatchScore, MatchScore.match_id == Match.id)\
+        .where(Match.tournament_id == tournament_id)
+    
+    team_id = request.args.get('team_id', type=int)
+    if team_id is not None:
+        query = query.where(db.or_(Match.team1_id == team_id, Match.team2_id == team_id))
+    played = request.args.get('played')
+    if played:
+        if played not in ('true', 'false'):
+            return jsonify({'error': 'played must be true or false'}), 400
+        query = query.where(MatchScore.id.isnot(None) if played == 'true' else MatchScore.id.is_(None))
     
-    # Create mapping for match scores
-    match_ids = [match.id for match in matches]
-    scores = MatchScore.query.filter(MatchScore.match_id.in_(match_ids)).all()
-    score_map = {score.match_id: score for score in scores}
+    try:
+        rows, next_cursor = fetch_page(query, sort_order(MATCH_SORTS, 'date'))
+    except InvalidCursor as e:
+        return jsonify({'error': str(e)}), 400
     
     result = []
-    for match in matches:
-        score = score_map.get(match.id)
-        
+    for row in rows:
         match_data = {
-            'id': match.id,
-            'team1_id': match.team1_id,
-            'team1_name': team_map.get(match.team1_id, 'Unknown'),
-            'team2_id': match.team2_id,
-            'team2_name': team_map.get(match.team2_id, 'Unknown'),
-            'venue_name': match.venue_name,
-            'match_date': match.match_date.isoformat(),
-            'has_score': score is not None
+            'id': row.id,
+            'team1_id': row.team1_id,
+            'team1_name': row.team1_name,
+            'team2_id': row.team2_id,
+            'team2_name': row.team2_name,
+            'venue_name': row.venue_name,
+            'match_date': row.match_date.isoformat(),
+            'has_score': row.score_id is not None
         }
         
-        if score:
+        if row.score_id is not None:
             match_data.update({
-                'team1_score': score.team1_score,
-                'team2_score': score.team2_score
+                'team1_score': row.team1_score,
+                'team2_score': row.team2_score
             })
         
         result.append(match_data)
     
-    return jsonify(result)
+    return with_next_cursor(with_etag(jsonify(result), etag), next_cursor)
 
 @main_bp.route('/api/tournament/<int:tournament_id>/matches', methods=['POST'])
 @login_required
 def create_match(tournament_id):
     """Create a new match in a tournament"""
-    tournament = Tournament.query.get_or_404(tournament_id)
-    
-    if tournament.creator_id != current_user.id:
-        return jsonify({'error': 'Access denied'}), 403
+    access = tournament_access()
+    if not access.can_edit(tournament_id):
+        return access_denied(tournament_id)
     
     data = request.json
     
@@ -1714,9 +1285,10 @@ def create_match(tournament_id):
         )
         db.session.add(score)
         
-        # Update team statistics (wins, losses, points)
-        update_team_statistics(tournament_id)
+        # Add the new result to the team statistics (wins, losses, points)
+        apply_result_change(None, match_result(match.team1_id, match.team2_id, score))
     
+    bump_data_version(tournament_id)
     db.session.commit()
     
     return jsonify({
@@ -1731,9 +1303,15 @@ def get_match(match_id):
     match = Match.query.get_or_404(match_id)
     
     # Check if user has access to the match's tournament
-    tournament = Tournament.query.get_or_404(match.tournament_id)
-    if tournament.creator_id != current_user.id:
-        return jsonify({'error': 'Access denied'}), 403
+    tournament_id = match.tournament_id
+    access = tournament_access()
+    if not access.can_edit(tournament_id):
+        return access_denied(tournament_id)
+    
+    etag = make_etag(access.version(tournament_id))
+    unchanged = not_modified(etag)
+    if unchanged:
+        return unchanged
     
     # Get score if available
     score = MatchScore.query.filter_by(match_id=match_id).first()
@@ -1760,7 +1338,7 @@ def get_match(match_id):
             'team2_score': score.team2_score
         })
     
-    return jsonify(result)
+    return with_etag(jsonify(result), etag)
 
 @main_bp.route('/api/match/<int:match_id>', methods=['PUT'])
 @login_required
@@ -1769,12 +1347,17 @@ def update_match(match_id):
     match = Match.query.get_or_404(match_id)
     
     # Check if user has access to the match's tournament
-    tournament = Tournament.query.get_or_404(match.tournament_id)
-    if tournament.creator_id != current_user.id:
-        return jsonify({'error': 'Access denied'}), 403
+    tournament_id = match.tournament_id
+    access = tournament_access()
+    if not access.can_edit(tournament_id):
+        return access_denied(tournament_id)
     
     data = request.json
     
+    # Remember the current result so standings can be updated as a delta
+    score = MatchScore.query.filter_by(match_id=match_id).first()
+    old_result = match_result(match.team1_id, match.team2_id, score)
+    
     # Validate teams if changing
     if 'team1_id' in data or 'team2_id' in data:
         team1_id = data.get('team1_id', match.team1_id)
@@ -1784,7 +1367,7 @@ def update_match(match_id):
         team1 = Team.query.get_or_404(team1_id)
         team2 = Team.query.get_or_404(team2_id)
         
-        if team1.tournament_id != tournament.id or team2.tournament_id != tournament.id:
+        if team1.tournament_id != tournament_id or team2.tournament_id != tournament_id:
             return jsonify({'error': 'Teams must belong to this tournament'}), 400
         
         if team1_id == team2_id:
@@ -1807,7 +1390,6 @@ def update_match(match_id):
     
     # Handle score update
     has_score = 'team1_score' in data and 'team2_score' in data
-    score = MatchScore.query.filter_by(match_id=match_id).first()
     
     if has_score:
         # Create or update score
@@ -1824,12 +1406,13 @@ def update_match(match_id):
     elif 'remove_score' in data and data['remove_score'] and score:
         # Remove score if requested
         db.session.delete(score)
+        score = None
     
-    db.session.commit()
+    # Swap the old result for the new one (covers score and team changes)
+    apply_result_change(old_result, match_result(match.team1_id, match.team2_id, score))
     
-    # Update team statistics if scores were changed
-    if has_score or ('remove_score' in data and data['remove_score']):
-        update_team_statistics(tournament.id)
+    bump_data_version(tournament_id)
+    db.session.commit()
     
     return jsonify({'message': 'Match updated successfully'})
 
@@ -1840,15 +1423,24 @@ def delete_match(match_id):
     match = Match.query.get_or_404(match_id)
     
     # Check if user has access to the match's tournament
-    tournament = Tournament.query.get_or_404(match.tournament_id)
-    if tournament.creator_id != current_user.id:
-        return jsonify({'error': 'Access denied'}), 403
+    tournament_id = match.tournament_id
+    access = tournament_access()
+    if not access.can_edit(tournament_id):
+        return access_denied(tournament_id)
     
     try:
         db.session.begin_nested()
         
-        # 1. Delete player stats for this match
+        # Take the match result out of the team statistics
+        score = MatchScore.query.filter_by(match_id=match_id).first()
+        apply_result_change(match_result(match.team1_id, match.team2_id, score), None)
+        
+        # 1. Delete player stats for this match, then recount the season totals of the
+        # players who had a line in it, wherever they play now
+        player_ids = db.session.scalars(
+            select(PlayerStats.player_id).where(PlayerStats.match_id == match_id)).all()
         PlayerStats.query.filter_by(match_id=match_id).delete(synchronize_session=False)
+        refresh_season_totals(db.session.connection(), player_ids)
         
         # 2. Delete match score
         MatchScore.query.filter_by(match_id=match_id).delete(synchronize_session=False)
@@ -1856,11 +1448,9 @@ def delete_match(match_id):
         # 3. Delete the match
         db.session.delete(match)
         
+        bump_data_version(tournament_id)
         db.session.commit()
         
-        # Update team statistics
-        update_team_statistics(tournament.id)
-        
         return jsonify({'message': 'Match deleted successfully'})
     
     except Exception as e:
@@ -1876,9 +1466,15 @@ def get_stats_for_match(match_id):
     match = Match.query.get_or_404(match_id)
     
     # Check if user has access to the match's tournament
-    tournament = Tournament.query.get_or_404(match.tournament_id)
-    if tournament.creator_id != current_user.id:
-        return jsonify({'error': 'Access denied'}), 403
+    tournament_id = match.tournament_id
+    access = tournament_access()
+    if not access.can_edit(tournament_id):
+        return access_denied(tournament_id)
+    
+    etag = make_etag(access.version(tournament_id))
+    unchanged = not_modified(etag)
+    if unchanged:
+        return unchanged
     
     # Get all stats for this match
     stats = PlayerStats.query.filter_by(match_id=match_id).all()
@@ -1919,7 +1515,7 @@ def get_stats_for_match(match_id):
         
         result.append(stat_data)
     
-    return jsonify(result)
+    return with_etag(jsonify(result), etag)
 
 @main_bp.route('/api/match/<int:match_id>/stats', methods=['POST'])
 @login_required
@@ -1928,9 +1524,10 @@ def create_player_stat(match_id):
     match = Match.query.get_or_404(match_id)
     
     # Check if user has access to the match's tournament
-    tournament = Tournament.query.get_or_404(match.tournament_id)
-    if tournament.creator_id != current_user.id:
-        return jsonify({'error': 'Access denied'}), 403
+    tournament_id = match.tournament_id
+    access = tournament_access()
+    if not access.can_edit(tournament_id):
+        return access_denied(tournament_id)
     
     data = request.json
     
@@ -1962,6 +1559,7 @@ def create_player_stat(match_id):
         existing_stat.turnovers = data.get('turnovers', 0)
         existing_stat.three_pointers = data.get('three_pointers', 0)
         
+        bump_data_version(tournament_id)
         db.session.commit()
         
         return jsonify({
@@ -1983,6 +1581,7 @@ def create_player_stat(match_id):
         )
         
         db.session.add(stat)
+        bump_data_version(tournament_id)
         db.session.commit()
         
         return jsonify({
@@ -1990,6 +1589,78 @@ def create_player_stat(match_id):
             'message': 'Player statistics created successfully'
         }), 201
 
+BOX_SCORE_FIELDS = ['points', 'rebounds', 'assists', 'steals', 'blocks', 'turnovers', 'three_pointers']
+
+@main_bp.route('/api/match/<int:match_id>/stats/bulk', methods=['POST'])
+@login_required
+def save_box_score(match_id):
+    """Create or update the statistics of several players in a match at once"""
+    match = Match.query.get_or_404(match_id)
+    
+    # Check if user has access to the match's tournament
+    tournament_id = match.tournament_id
+    access = tournament_access()
+    if not access.can_edit(tournament_id):
+        return access_denied(tournament_id)
+    
+    data = request.json
+    rows = data.get('stats') if isinstance(data, dict) else None
+    if not isinstance(rows, list) or not rows:
+        return jsonify({'error': 'stats must be a non-empty list'}), 400
+    
+    # Validate every row before touching the database
+    entries = {}
+    for i, row in enumerate(rows):
+        if not isinstance(row, dict):
+            return jsonify({'error': f'Row {i + 1}: expected an object'}), 400
+        for field in ['player_id', 'points', 'rebounds', 'assists']:
+            if field not in row:
+                return jsonify({'error': f'Row {i + 1}: {field} is required'}), 400
+        try:
+            player_id = int(row['player_id'])
+            values = {field: int(row.get(field, 0)) for field in BOX_SCORE_FIELDS}
+        except (TypeError, ValueError):
+            return jsonify({'error': f'Row {i + 1}: statistics must be whole numbers'}), 400
+        if player_id in entries:
+            return jsonify({'error': f'Row {i + 1}: player {player_id} appears more than once'}), 400
+        entries[player_id] = values
+    
+    # Every player must belong to one of the two teams in this match
+    valid_ids = set(db.session.scalars(
+        select(Player.id).where(Player.id.in_(entries),
+                                Player.team_id.in_([match.team1_id, match.team2_id]))
+    ))
+    invalid_ids = [player_id for player_id in entries if player_id not in valid_ids]
+    if invalid_ids:
+        return jsonify({
+            'error': 'Player must belong to a team in this match',
+            'player_ids': invalid_ids
+        }), 400
+    
+    existing = {stat.player_id: stat for stat in db.session.scalars(
+        select(PlayerStats).where(PlayerStats.match_id == match_id, PlayerStats.player_id.in_(entries))
+    )}
+    
+    created = updated = 0
+    for player_id, values in entries.items():
+        stat = existing.get(player_id)
+        if stat:
+            for field, value in values.items():
+                setattr(stat, field, value)
+            updated += 1
+        else:
+            db.session.add(PlayerStats(match_id=match_id, player_id=player_id, **values))
+            created += 1
+    
+    bump_data_version(tournament_id)
+    db.session.commit()
+    
+    return jsonify({
+        'created': created,
+        'updated': updated,
+        'message': 'Player statistics saved successfully'
+    })
+
 @main_bp.route('/api/player/<int:player_id>/stats/<int:match_id>', methods=['PUT'])
 @login_required
 def update_player_stats(player_id, match_id):
@@ -1998,9 +1669,10 @@ def update_player_stats(player_id, match_id):
     match = Match.query.get_or_404(match_id)
     
     # Check if user has access to the match's tournament
-    tournament = Tournament.query.get_or_404(match.tournament_id)
-    if tournament.creator_id != current_user.id:
-        return jsonify({'error': 'Access denied'}), 403
+    tournament_id = match.tournament_id
+    access = tournament_access()
+    if not access.can_edit(tournament_id):
+        return access_denied(tournament_id)
     
     # Get player stats
     stats = PlayerStats.query.filter_by(
@@ -2029,6 +1701,7 @@ def update_player_stats(player_id, match_id):
     if 'three_pointers' in data:
         stats.three_pointers = data['three_pointers']
     
+    bump_data_version(tournament_id)
     db.session.commit()
     
     return jsonify({'message': 'Player statistics updated successfully'})
@@ -2041,9 +1714,10 @@ def delete_player_stats(player_id, match_id):
     match = Match.query.get_or_404(match_id)
     
     # Check if user has access to the match's tournament
-    tournament = Tournament.query.get_or_404(match.tournament_id)
-    if tournament.creator_id != current_user.id:
-        return jsonify({'error': 'Access denied'}), 403
+    tournament_id = match.tournament_id
+    access = tournament_access()
+    if not access.can_edit(tournament_id):
+        return access_denied(tournament_id)
     
     # Get player stats
     stats = PlayerStats.query.filter_by(
@@ -2055,6 +1729,7 @@ def delete_player_stats(player_id, match_id):
         return jsonify({'error': 'Statistics not found for this player and match'}), 404
     
     db.session.delete(stats)
+    bump_data_version(tournament_id)
     db.session.commit()
     
     return jsonify({'message': 'Player statistics deleted successfully'})
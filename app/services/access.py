@@ -0,0 +1,71 @@
+from flask import abort, g, jsonify
+from flask_login import current_user
+from sqlalchemy import or_, select
+from app.models.models import Tournament, TournamentAccess, Team, Player, db
+
+# Request-scoped authorization: the tournaments the current user owns or has
+# been shared are loaded with one query the first time a handler asks, and
+# every later check in the same request is a set lookup. Because the scope
+# lives for a single request, grants and revocations apply from the next one.
+
+
+class TournamentScope:
+    """Tournament ids the current user can read and edit, with their data versions"""
+
+    def __init__(self, rows, user_id):
+        self.versions = {}
+        self.owned = set()
+        for tournament_id, creator_id, data_version in rows:
+            self.versions[tournament_id] = data_version
+            if creator_id == user_id:
+                self.owned.add(tournament_id)
+
+    @property
+    def readable(self):
+        return set(self.versions)
+
+    def can_view(self, tournament_id):
+        """Owner or shared with the user"""
+        return tournament_id in self.versions
+
+    def can_edit(self, tournament_id):
+        """Owner only"""
+        return tournament_id in self.owned
+
+    def version(self, tournament_id):
+        """Data version keyed the way make_etag expects"""
+        return {tournament_id: self.versions[tournament_id]}
+
+
+def tournament_access():
+    """The current user's TournamentScope, loaded once per request"""
+    scope = g.get('_tournament_scope')
+    if scope is None:
+        shared_ids = select(TournamentAccess.tournament_id).where(TournamentAccess.user_id == current_user.id)
+        rows = db.session.execute(
+            select(Tournament.id, Tournament.creator_id, Tournament.data_version)
+            .where(or_(Tournament.creator_id == current_user.id, Tournament.id.in_(shared_ids)))
+        ).all()
+        scope = TournamentScope(rows, current_user.id)
+        g._tournament_scope = scope
+    return scope
+
+
+def reset_tournament_access():
+    g.pop('_tournament_scope', None)
+
+
+def access_denied(tournament_id):
+    """Response for a tournament outside the user's scope: 404 if it does not exist, 403 otherwise"""
+    Tournament.query.get_or_404(tournament_id)
+    return jsonify({'error': 'Access denied'}), 403
+
+
+def player_with_team_or_404(player_id):
+    """Load a player and its team with one joined query"""
+    row = db.session.execute(
+        select(Player, Team).join(Team, Team.id == Player.team_id).where(Player.id == player_id)
+    ).first()
+    if row is None:
+        abort(404)
+    return row
@@ -0,0 +1,273 @@
+from collections import namedtuple
+import numpy as np
+import pandas as pd
+from sqlalchemy import func, select
+from app.models.models import Team, Player, Match, MatchScore, PlayerSeasonTotals, db
+from app.services.cache import frames_cache
+
+# Column store behind /api/tournament_data. A tournament's teams, players (with
+# their season totals) and matches (with their scores) are read into pandas
+# frames once per data version; the group-bys and per-game arithmetic that do
+# not depend on the team/player filter run right then, and the result is kept
+# in frames_cache(). A request then only masks and sorts those columns with
+# numpy, so changing the filter, or comparing several tournaments, reads
+# nothing from the database until one of them changes.
+#
+# The route imports this module on first use, so workers that never serve the
+# visualise page don't load pandas.
+
+# teams, players, trends: DataFrames; the rest are match totals
+TournamentFrames = namedtuple('TournamentFrames',
+                              ['teams', 'players', 'trends', 'matches_count', 'scored_count', 'total_points'])
+
+TEAM_COLUMNS = {'id': 'int64', 'tournament_id': 'int64', 'name': 'object', 'wins': 'int64', 'losses': 'int64'}
+PLAYER_COLUMNS = {'id': 'int64', 'tournament_id': 'int64', 'name': 'object', 'team_id': 'int64',
+                  'team_name': 'object', 'games_played': 'int64', 'total_points': 'int64',
+                  'total_efficiency': 'int64', 'double_doubles': 'int64', 'triple_doubles': 'int64'}
+# Scores are NaN for unplayed matches
+MATCH_COLUMNS = {'id': 'int64', 'tournament_id': 'int64', 'match_date': 'datetime64[ns]', 'team1_id': 'int64',
+                 'team2_id': 'int64', 'team1_score': 'float64', 'team2_score': 'float64'}
+
+TOP_PLAYERS = 5
+TREND_MATCHES = 10
+
+
+def _frame(rows, columns):
+    return pd.DataFrame.from_records(rows, columns=list(columns)).astype(columns)
+
+
+def _ratio(numerator, denominator, scale=1):
+    """numerator / denominator * scale to one decimal, 0 where the denominator is 0"""
+    return np.where(denominator > 0, numerator / denominator.where(denominator > 0, 1) * scale, 0).round(1)
+
+
+def _team_figures(teams, matches):
+    """Teams with games played, per-game scoring and record columns from the scored matches"""
+    scored = matches.dropna(subset=['team1_score'])
+    sides = pd.concat([
+        pd.DataFrame({'team_id': scored['team1_id'], 'scored': scored['team1_score'],
+                      'conceded': scored['team2_score']}),
+        pd.DataFrame({'team_id': scored['team2_id'], 'scored': scored['team2_score'],
+                      'conceded': scored['team1_score']})
+    ])
+    totals = sides.groupby('team_id').agg(games_played=('scored', 'size'), scored=('scored', 'sum'),
+                                          conceded=('conceded', 'sum'))
+
+    teams = teams.join(totals, on='id')
+    games = teams['games_played'].fillna(0).astype('int64')
+    teams = teams.assign(
+        games_played=games,
+        points_scored=_ratio(teams['scored'].fillna(0), games),
+        points_conceded=_ratio(teams['conceded'].fillna(0), games),
+        win_pct=_ratio(teams['wins'], teams['wins'] + teams['losses'], 100)
+    ).drop(columns=['scored', 'conceded'])
+    return teams.assign(diff=(teams['points_scored'] - teams['points_conceded']).round(1))
+
+
+def _player_figures(players):
+    """Players with chart labels and per-game points and efficiency"""
+    parts = players['name'].str.split(' ')
+    return players.assign(
+        # Abbreviated for chart labels (e.g. 'L. James')
+        label=(parts.str[0].str[0] + '. ' + parts.str[-1]).astype('object'),
+        ppg=_ratio(players['total_points'], players['games_played']),
+        avg_efficiency=_ratio(players['total_efficiency'], players['games_played'])
+    )
+
+
+def _trends(matches):
+    """The first scored matches in date order with their winning, losing and average scores"""
+    scored = matches.dropna(subset=['team1_score'])
+    scored = scored.sort_values(['match_date', 'id'], kind='stable').head(TREND_MATCHES)
+    scores = scored[['team1_score', 'team2_score']]
+    return pd.DataFrame({
+        'id': scored['id'],
+        'match_date': scored['match_date'],
+        'winning': scores.max(axis=1).astype('int64'),
+        'losing': scores.min(axis=1).astype('int64'),
+        'average': scores.mean(axis=1).round(1)
+    }).reset_index(drop=True)
+
+
+def _summarise(teams, players, matches):
+    scored = matches.dropna(subset=['team1_score'])
+    return TournamentFrames(
+        _team_figures(teams, matches).reset_index(drop=True),
+        _player_figures(players).reset_index(drop=True),
+        _trends(matches),
+        len(matches),
+        len(scored),
+        int((scored['team1_score'] + scored['team2_score']).sum())
+    )
+
+
+def _load_frames(tournament_ids):
+    """Summarised frames for each of the tournaments, read with one query per table"""
+    teams = _frame(db.session.execute(
+        select(Team.id, Team.tournament_id, Team.name,
+               func.coalesce(Team.wins, 0), func.coalesce(Team.losses, 0))
+        .where(Team.tournament_id.in_(tournament_ids))
+        .order_by(Team.id)
+    ).all(), TEAM_COLUMNS)
+
+    totals = PlayerSeasonTotals
+    players = _frame(db.session.execute(
+        select(Player.id, Team.tournament_id, Player.name, Team.id, Team.name,
+               func.coalesce(totals.games, 0), func.coalesce(totals.points, 0),
+               func.coalesce(totals.efficiency, 0), func.coalesce(totals.double_doubles, 0),
+               func.coalesce(totals.triple_doubles, 0))
+        .join(Team, Team.id == Player.team_id)
+        .outerjoin(totals, totals.player_id == Player.id)
+        .where(Team.tournament_id.in_(tournament_ids))
+        .order_by(Player.id)
+    ).all(), PLAYER_COLUMNS)
+
+    matches = _frame(db.session.execute(
+        select(Match.id, Match.tournament_id, Match.match_date, Match.team1_id, Match.team2_id,
+               MatchScore.team1_score, MatchScore.team2_score)
+        .outerjoin(MatchScore, MatchScore.match_id == Match.id)
+        .where(Match.tournament_id.in_(tournament_ids))
+        .order_by(Match.id)
+    ).all(), MATCH_COLUMNS)
+
+    return {
+        tournament_id: _summarise(teams[teams['tournament_id'] == tournament_id],
+                                  players[players['tournament_id'] == tournament_id],
+                                  matches[matches['tournament_id'] == tournament_id])
+        for tournament_id in tournament_ids
+    }
+
+
+def tournament_frames(versions):
+    """The summarised frames of the tournaments in {tournament_id: data_version}, combined.
+
+    Tournaments already cached at their current version are reused; the rest
+    are loaded together. Cached frames are shared, so callers must not modify
+    them in place.
+    """
+    cache = frames_cache()
+    frames = {tournament_id: cache.get((tournament_id, version)) for tournament_id, version in versions.items()}
+    missing = sorted(tournament_id for tournament_id, cached in frames.items() if cached is None)
+    if missing:
+        for tournament_id, loaded in _load_frames(missing).items():
+            cache.set((tournament_id, versions[tournament_id]), loaded)
+            frames[tournament_id] = loaded
+
+    if not frames:
+        return _summarise(_frame([], TEAM_COLUMNS), _frame([], PLAYER_COLUMNS), _frame([], MATCH_COLUMNS))
+    if len(frames) == 1:
+        return next(iter(frames.values()))
+
+    # Teams and players in id order across the tournaments, so ties sort the same
+    # way for any selection; the earliest scored matches of all of them
+    parts = [frames[tournament_id] for tournament_id in sorted(frames)]
+    return TournamentFrames(
+        pd.concat([part.teams for part in parts]).sort_values('id', kind='stable', ignore_index=True),
+        pd.concat([part.players for part in parts]).sort_values('id', kind='stable', ignore_index=True),
+        pd.concat([part.trends for part in parts]).sort_values(['match_date', 'id'], kind='stable',
+                                                               ignore_index=True).head(TREND_MATCHES),
+        sum(part.matches_count for part in parts),
+        sum(part.scored_count for part in parts),
+        sum(part.total_points for part in parts)
+    )
+
+
+def _columns(frame, mask=None):
+    """The frame's columns as numpy arrays, optionally masked"""
+    if mask is None:
+        return {name: frame[name].to_numpy() for name in frame.columns}
+    return {name: frame[name].to_numpy()[mask] for name in frame.columns}
+
+
+def _descending(values):
+    """Stable descending order of an array: ties keep their id order"""
+    return np.argsort(-values, kind='stable')
+
+
+def chart_data(frames, team_id=None, player_id=None):
+    """Every series of the visualise page for the selected team/player"""
+    team_mask = None if team_id is None else frames.teams['id'].to_numpy() == team_id
+    teams = _columns(frames.teams, team_mask)
+
+    player_mask = None
+    if team_id is not None or player_id is not None:
+        player_mask = np.ones(len(frames.players), dtype=bool)
+        if team_id is not None:
+            player_mask &= frames.players['team_id'].to_numpy() == team_id
+        if player_id is not None:
+            player_mask &= frames.players['id'].to_numpy() == player_id
+    players = _columns(frames.players, player_mask)
+
+    has_scores = frames.scored_count > 0
+    has_player_stats = bool((players['games_played'] > 0).any())
+    response = {
+        'summary': {
+            'teams_count': len(teams['id']),
+            'players_count': len(players['id']),
+            'matches_count': frames.matches_count,
+            # Divide by 2 teams per match
+            'avg_points_per_game': round(frames.total_points / (frames.scored_count * 2), 1) if has_scores else 0
+        }
+    }
+
+    order = _descending(teams['wins'])
+    response['team_standings'] = {
+        'labels': teams['name'][order].tolist(),
+        'wins': teams['wins'][order].tolist(),
+        'losses': teams['losses'][order].tolist()
+    }
+
+    order = _descending(teams['points_scored'])[:len(teams['id']) if has_scores else 0]
+    response['points_distribution'] = {
+        'labels': teams['name'][order].tolist(),
+        'points_scored': teams['points_scored'][order].tolist(),
+        'points_conceded': teams['points_conceded'][order].tolist()
+    }
+
+    top = TOP_PLAYERS if has_player_stats else 0
+    order = _descending(players['ppg'])[:top]
+    response['top_scorers'] = {
+        'labels': players['label'][order].tolist(),
+        'points': players['ppg'][order].tolist(),
+        'teams': players['team_name'][order].tolist()
+    }
+
+    order = _descending(players['avg_efficiency'])[:top]
+    response['player_efficiency'] = {
+        'labels': players['label'][order].tolist(),
+        'efficiency': players['avg_efficiency'][order].tolist(),
+        'teams': players['team_name'][order].tolist()
+    }
+
+    # Triple-doubles first, then double-doubles; lexsort is stable too
+    order = np.lexsort((-players['double_doubles'], -players['triple_doubles']))[:top]
+    response['double_triple_leaders'] = {
+        'labels': players['label'][order].tolist(),
+        'double_doubles': players['double_doubles'][order].tolist(),
+        'triple_doubles': players['triple_doubles'][order].tolist()
+    }
+
+    trends = frames.trends
+    response['match_score_trends'] = {
+        'labels': [f"Game {i + 1}" for i in range(len(trends))],
+        'winning_scores': trends['winning'].tolist(),
+        'losing_scores': trends['losing'].tolist(),
+        'avg_scores': trends['average'].tolist()
+    }
+
+    order = _descending(teams['win_pct'])[:len(teams['id']) if has_scores else 0]
+    response['team_records'] = [{
+        'team': name,
+        'wins': wins,
+        'losses': losses,
+        'win_pct': win_pct,
+        'games_played': games_played,
+        'pts_scored': pts_scored,
+        'pts_allowed': pts_allowed,
+        'diff': diff
+    } for name, wins, losses, win_pct, games_played, pts_scored, pts_allowed, diff in zip(
+        *(teams[column][order].tolist() for column in
+          ['name', 'wins', 'losses', 'win_pct', 'games_played', 'points_scored', 'points_conceded', 'diff'])
+    )]
+
+    return response
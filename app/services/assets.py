@@ -0,0 +1,109 @@
+import gzip
+import hashlib
+import json
+import mimetypes
+import os
+import shutil
+from flask import request, send_from_directory
+from app.services.downloads import IMMUTABLE_MAX_AGE
+
+try:
+    import brotli
+except ImportError:  # optional; without it only gzip copies are built
+    brotli = None
+
+# `python manage.py assets` copies every script and stylesheet under app/static
+# into app/static/dist with a content hash in its name, writes gzip (and, when
+# the brotli package is installed, brotli) copies next to it, and records the
+# original -> hashed names in dist/manifest.json. With FINGERPRINT_ASSETS on and
+# a manifest present, url_for('static', filename=...) points at the hashed copy,
+# whose URL changes with its content, so it is served as immutable for a year.
+
+DIST_DIR = 'dist'
+MANIFEST = 'manifest.json'
+ASSET_EXTENSIONS = ('.css', '.js')
+# Preferred first
+ENCODINGS = (('br', '.br'), ('gzip', '.gz'))
+
+
+def build_assets(static_folder):
+    """Fingerprint and precompress the static scripts and stylesheets; returns the manifest"""
+    dist = os.path.join(static_folder, DIST_DIR)
+    shutil.rmtree(dist, ignore_errors=True)
+
+    manifest = {}
+    for root, dirs, files in os.walk(static_folder):
+        dirs[:] = sorted(d for d in dirs if os.path.join(root, d) != dist)
+        for name in sorted(files):
+            if not name.endswith(ASSET_EXTENSIONS):
+                continue
+            source = os.path.join(root, name)
+            filename = os.path.relpath(source, static_folder).replace(os.sep, '/')
+            with open(source, 'rb') as f:
+                data = f.read()
+
+            stem, ext = os.path.splitext(filename)
+            hashed = f'{stem}.{hashlib.sha256(data).hexdigest()[:12]}{ext}'
+            target = os.path.join(dist, hashed)
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            with open(target, 'wb') as f:
+                f.write(data)
+            # mtime=0 keeps the gzip bytes identical across builds
+            with open(target + '.gz', 'wb') as f:
+                f.write(gzip.compress(data, compresslevel=9, mtime=0))
+            if brotli is not None:
+                with open(target + '.br', 'wb') as f:
+                    f.write(brotli.compress(data, quality=11))
+            manifest[filename] = hashed
+
+    os.makedirs(dist, exist_ok=True)
+    with open(os.path.join(dist, MANIFEST), 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    return manifest
+
+
+def init_assets(app):
+    """Route url_for('static') to the fingerprinted copies from the last build, if any"""
+    if not app.config.get('FINGERPRINT_ASSETS'):
+        return
+    try:
+        with open(os.path.join(app.static_folder, DIST_DIR, MANIFEST)) as f:
+            manifest = json.load(f)
+    except FileNotFoundError:
+        print("No static asset manifest found; run `python manage.py assets` to build one")
+        return
+    app.extensions['asset_manifest'] = manifest
+    fingerprinted = {f'{DIST_DIR}/{hashed}' for hashed in manifest.values()}
+
+    @app.url_defaults
+    def fingerprint_static_urls(endpoint, values):
+        if endpoint == 'static' and values.get('filename') in manifest:
+            values['filename'] = f"{DIST_DIR}/{manifest[values['filename']]}"
+
+    send_static_file = app.view_functions['static']
+
+    def static(filename):
+        if filename in fingerprinted:
+            return send_fingerprinted(app.static_folder, filename)
+        return send_static_file(filename=filename)
+
+    app.view_functions['static'] = static
+
+
+def send_fingerprinted(static_folder, filename):
+    """A hashed asset, precompressed when the client accepts it, cached for a year"""
+    mimetype = mimetypes.guess_type(filename)[0]
+    for encoding, suffix in ENCODINGS:
+        if encoding in request.accept_encodings and os.path.exists(os.path.join(static_folder, filename + suffix)):
+            response = send_from_directory(static_folder, filename + suffix, mimetype=mimetype)
+            response.headers['Content-Encoding'] = encoding
+            break
+    else:
+        response = send_from_directory(static_folder, filename, mimetype=mimetype)
+
+    response.vary.add('Accept-Encoding')
+    response.cache_control.no_cache = None
+    response.cache_control.public = True
+    response.cache_control.max_age = IMMUTABLE_MAX_AGE
+    response.cache_control.immutable = True
+    return response
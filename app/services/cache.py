@@ -0,0 +1,148 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from flask import current_app, request
+from sqlalchemy import func, select, update
+from app.models.models import Tournament, db
+
+# Core table so versions can be bumped without loading Tournament rows
+tournament_table = Tournament.__table__
+
+
+class LRUCache:
+    """Small thread-safe least-recently-used cache with a fixed number of entries.
+
+    With `ttl` (seconds) entries also expire after that long, for content that
+    goes stale with time as well as with writes.
+    """
+
+    def __init__(self, maxsize=256, ttl=None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            value, expires = entry
+            if expires is not None and expires <= time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        if self.maxsize <= 0:
+            return
+        expires = time.monotonic() + self.ttl if self.ttl else None
+        with self._lock:
+            self._data[key] = (value, expires)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+def _app_cache(name, maxsize, ttl=None):
+    cache = current_app.extensions.get(name)
+    if cache is None:
+        cache = LRUCache(maxsize, ttl)
+        current_app.extensions[name] = cache
+    return cache
+
+
+def analytics_cache():
+    """The per-app cache for /api/tournament_data payloads"""
+    return _app_cache('analytics_cache', current_app.config.get('ANALYTICS_CACHE_SIZE', 256))
+
+
+def frames_cache():
+    """The per-app cache of tournament column frames, keyed by (tournament id, data version)"""
+    return _app_cache('analytics_frames', current_app.config.get('ANALYTICS_FRAMES_CACHE_SIZE', 64))
+
+
+def page_cache():
+    """The per-app cache for rendered home page fragments and anonymous pages"""
+    return _app_cache('page_cache', current_app.config.get('PAGE_CACHE_SIZE', 64),
+                      current_app.config.get('PAGE_CACHE_TTL', 60))
+
+
+def bump_data_version(*tournament_ids):
+    """Mark tournament data as changed so cached responses for it stop matching.
+
+    Runs inside the caller's transaction, so the new version becomes visible
+    together with the write that caused it.
+    """
+    ids = [int(tid) for tid in tournament_ids if tid is not None]
+    if not ids:
+        return
+    db.session.execute(
+        update(tournament_table)
+        .where(tournament_table.c.id.in_(ids))
+        .values(data_version=tournament_table.c.data_version + 1)
+    )
+
+
+def data_versions(tournament_ids):
+    """Map of tournament id -> data version for the given tournaments"""
+    if not tournament_ids:
+        return {}
+    rows = db.session.execute(
+        select(Tournament.id, Tournament.data_version).where(Tournament.id.in_(tournament_ids))
+    ).all()
+    return {tid: version for tid, version in rows}
+
+
+def tournaments_fingerprint(*criteria):
+    """Value that changes whenever data of any matching tournament changes.
+
+    Sums the data versions, which every write bumps, and adds the count and
+    highest id so tournaments being created or deleted change it too. One
+    aggregate query, for caches that span many tournaments.
+    """
+    row = db.session.execute(
+        select(
+            func.count(Tournament.id),
+            func.coalesce(func.sum(Tournament.data_version), 0),
+            func.max(Tournament.id)
+        ).where(*criteria)
+    ).one()
+    return tuple(row)
+
+
+def versioned_key(name, versions, *params):
+    """Cache key built from a name, the (id, version) pairs and request parameters"""
+    return (name, tuple(sorted(versions.items())), params)
+
+
+# Conditional GET support: ETags are derived from the request URL and the data
+# versions of the tournaments behind it, so checking one costs no serialization.
+
+def make_etag(versions, *parts):
+    """Strong ETag for the current URL at the given tournament data versions"""
+    raw = repr((request.full_path, tuple(sorted(versions.items())), parts))
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+
+def with_etag(response, etag):
+    """Attach the ETag and make clients revalidate before reusing the body"""
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'private, no-cache'
+    return response
+
+
+def not_modified(etag):
+    """A 304 response if the client already holds this version, otherwise None"""
+    if etag in request.if_none_match:
+        return with_etag(current_app.response_class(status=304), etag)
+    return None
@@ -0,0 +1,56 @@
+from sqlalchemy import delete, or_, select, update
+from app.models.models import (Tournament, TournamentAccess, Team, Player, Match, MatchScore, PlayerStats, UploadJob, db,
+                               refresh_season_totals)
+from app.services.standings import recalculate_standings
+
+# Bulk removal of a tournament or a team and everything below it. Each level is
+# one DELETE whose WHERE clause is a subquery on its parent, so no id lists are
+# pulled into Python and the statement count does not grow with the data. The
+# foreign keys also declare ON DELETE CASCADE; deleting children first keeps
+# this working on databases created before those constraints existed.
+# player_season_totals rows go with their player through ON DELETE CASCADE.
+
+
+def _execute(statement):
+    db.session.execute(statement.execution_options(synchronize_session=False))
+
+
+def _delete_matches(condition):
+    match_ids = select(Match.id).where(condition)
+    _execute(delete(PlayerStats).where(PlayerStats.match_id.in_(match_ids)))
+    _execute(delete(MatchScore).where(MatchScore.match_id.in_(match_ids)))
+    _execute(delete(Match).where(condition))
+
+
+def _delete_players(condition):
+    player_ids = select(Player.id).where(condition)
+    _execute(delete(PlayerStats).where(PlayerStats.player_id.in_(player_ids)))
+    _execute(delete(Player).where(condition))
+
+
+def delete_tournament_cascade(tournament_id):
+    """Delete a tournament with its teams, players, matches, scores, stats and shares.
+
+    Runs in the caller's transaction; the caller commits.
+    """
+    _delete_matches(Match.tournament_id == tournament_id)
+    _delete_players(Player.team_id.in_(select(Team.id).where(Team.tournament_id == tournament_id)))
+    _execute(delete(Team).where(Team.tournament_id == tournament_id))
+    _execute(delete(TournamentAccess).where(TournamentAccess.tournament_id == tournament_id))
+    _execute(update(UploadJob).where(UploadJob.tournament_id == tournament_id).values(tournament_id=None))
+    _execute(delete(Tournament).where(Tournament.id == tournament_id))
+
+
+def delete_team_cascade(team_id):
+    """Delete a team with its players, the matches it played and their scores and stats.
+
+    Runs in the caller's transaction; the caller commits.
+    """
+    tournament_id = db.session.scalar(select(Team.tournament_id).where(Team.id == team_id))
+    _delete_matches(or_(Match.team1_id == team_id, Match.team2_id == team_id))
+    _delete_players(Player.team_id == team_id)
+    # The opponents lost the stat lines and the results of those matches
+    refresh_season_totals(db.session.connection(),
+                          select(Player.id).join(Team).where(Team.tournament_id == tournament_id))
+    _execute(delete(Team).where(Team.id == team_id))
+    recalculate_standings(tournament_id)
@@ -0,0 +1,64 @@
+import hashlib
+import os
+from urllib.parse import quote
+from flask import current_app, request, send_file
+
+# Static downloads (the upload template) are identified by a hash of their
+# content, computed once per process and again only if the file changes on
+# disk. The hash is the ETag, and a prefix of it is the ?v= version put in
+# links, so a versioned link can be cached for a year while a bare one is
+# revalidated with a cheap 304.
+
+UPLOAD_TEMPLATE = os.path.join('templates', 'Tournament Upload Template.xlsx')
+IMMUTABLE_MAX_AGE = 365 * 24 * 3600
+
+_digests = {}
+
+
+def static_file_digest(filename):
+    """SHA-256 of a file under the static folder, or None if it does not exist"""
+    path = os.path.join(current_app.static_folder, filename)
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    key = (stat.st_mtime_ns, stat.st_size)
+    cached = _digests.get(path)
+    if cached is None or cached[0] != key:
+        with open(path, 'rb') as f:
+            cached = (key, hashlib.sha256(f.read()).hexdigest())
+        _digests[path] = cached
+    return cached[1]
+
+
+def static_file_version(filename):
+    """Short content version for links to a static download"""
+    digest = static_file_digest(filename)
+    return digest[:12] if digest else None
+
+
+def send_static_download(filename, digest):
+    """Send a static file as an attachment, with conditional and range request support.
+
+    With X_ACCEL_REDIRECT_PREFIX set, nginx sends the bytes from the internal
+    location at that prefix (aliased to the static folder); with USE_X_SENDFILE,
+    Apache or lighttpd do. Either way the worker only writes headers.
+    """
+    accel_prefix = current_app.config.get('X_ACCEL_REDIRECT_PREFIX')
+    if accel_prefix:
+        response = current_app.response_class(mimetype='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet')
+        response.headers['X-Accel-Redirect'] = accel_prefix.rstrip('/') + '/' + quote(filename.replace(os.sep, '/'))
+        response.headers.set('Content-Disposition', 'attachment', filename=os.path.basename(filename))
+        response.set_etag(digest)
+        response.make_conditional(request)
+    else:
+        response = send_file(os.path.join(current_app.static_folder, filename), as_attachment=True,
+                             etag=digest, conditional=True)
+
+    # Links carry ?v=<version>; a matching request can never change under its URL
+    versioned = request.args.get('v') == digest[:12]
+    response.cache_control.no_cache = None
+    response.cache_control.public = True
+    response.cache_control.max_age = IMMUTABLE_MAX_AGE if versioned else current_app.config['STATIC_DOWNLOAD_MAX_AGE']
+    response.cache_control.immutable = versioned
+    return response
@@ -0,0 +1,453 @@
+import re
+from itertools import islice
+import pandas as pd
+from flask import current_app
+from openpyxl import load_workbook
+from sqlalchemy import delete, insert, select, tuple_
+from app.models.models import Tournament, Team, Player, Match, MatchScore, PlayerStats, db, refresh_season_totals
+from app.services.standings import recalculate_standings
+from app.services.cascade import delete_tournament_cascade
+
+# Map expected sheet names to actual sheet names for flexibility
+SHEET_MAPPING = {
+    "Tournament Details": ["Tournament Details", "Tournament"],
+    "Teams": ["Teams"],
+    "Players": ["Players"],
+    "Matches": ["Matches"],
+    "Match Scores": ["Match Scores"],
+    "Player Stats": ["Player Stats"]
+}
+
+
+class TournamentImportError(Exception):
+    """Raised when a workbook fails validation; the message is shown to the user"""
+
+
+# Helper function to normalize column names (strips asterisks)
+def normalize_columns(df):
+    # Create a mapping of original column names to normalized ones
+    column_map = {col: re.sub(r'[*]', '', str(col)) for col in df.columns}
+    # Rename columns
+    return df.rename(columns=column_map), column_map
+
+
+def resolve_sheet_names(sheet_names):
+    """Match the workbook's sheets against SHEET_MAPPING, raising if any are missing"""
+    actual_sheet_names = {}
+    missing_sheets = []
+
+    for expected_sheet, alternatives in SHEET_MAPPING.items():
+        for alt in alternatives:
+            if alt in sheet_names:
+                actual_sheet_names[expected_sheet] = alt
+                break
+        else:
+            missing_sheets.append(expected_sheet)
+
+    if missing_sheets:
+        raise TournamentImportError(f'Missing required sheets: {", ".join(missing_sheets)}')
+    return actual_sheet_names
+
+
+def _require_columns(df, sheet, required_fields):
+    missing_fields = [field for field in required_fields if field not in df.columns]
+    if missing_fields:
+        raise TournamentImportError(f'Missing required fields in {sheet} sheet: {", ".join(missing_fields)}')
+
+
+def _constant_column(df, value):
+    # pd.Series(None, dtype='object') holds NaN, which SQLite stores as NULL but
+    # other databases reject; a list keeps a real None
+    return pd.Series([value] * len(df), index=df.index, dtype='object')
+
+
+def _int_column(df, column, sheet, default=None):
+    """Column converted to ints; missing cells take `default`, bad values are rejected"""
+    if column not in df.columns:
+        return _constant_column(df, default)
+
+    values = pd.to_numeric(df[column], errors='coerce')
+    invalid = values.isna() & df[column].notna()
+    if invalid.any():
+        raise TournamentImportError(
+            f'Invalid number in {sheet} sheet, column {column}: {df[column][invalid].iloc[0]!r}')
+
+    if default is None:
+        # Keep missing values as None rather than NaN
+        result = _constant_column(df, None)
+        present = values.notna()
+        result[present] = values[present].astype('int64').astype('object')
+        return result
+    return values.fillna(default).astype('int64')
+
+
+def _text_column(df, column, default=None):
+    if column not in df.columns:
+        return _constant_column(df, default)
+    return df[column].astype('object').where(df[column].notna(), default)
+
+
+def _map_ids(df, column, sheet, id_map):
+    """Translate template ids into database ids; unknown ids become NaN"""
+    return _int_column(df, column, sheet).map(id_map)
+
+
+def _insert_returning_ids(model, records):
+    """Insert all records with one executemany and return their new ids in order"""
+    if not records:
+        return []
+    result = db.session.execute(
+        insert(model).returning(model.id, sort_by_parameter_order=True),
+        records
+    )
+    return list(result.scalars())
+
+
+def _insert(model, records):
+    if records:
+        db.session.execute(insert(model), records)
+
+
+def prepare_tournament(df, creator_id):
+    df, _ = normalize_columns(df)
+
+    if df.empty:
+        raise TournamentImportError('Tournament sheet is empty')
+
+    t_row = df.iloc[0]  # Get first row
+
+    # Check required fields (now without asterisks)
+    required_fields = ['name', 'year', 'start_date', 'end_date']
+    missing_fields = [field for field in required_fields if field not in df.columns or pd.isna(t_row[field])]
+    if missing_fields:
+        raise TournamentImportError(f'Missing required fields in Tournament sheet: {", ".join(missing_fields)}')
+
+    # Convert dates properly - handle different formats
+    try:
+        start_date = pd.to_datetime(t_row['start_date']).date()
+        end_date = pd.to_datetime(t_row['end_date']).date()
+    except Exception as e:
+        raise TournamentImportError(
+            f'Error parsing dates: {str(e)}. Please ensure dates are in a valid format (e.g., DD/MM/YYYY).')
+
+    description = t_row.get('description', '')
+    return {
+        'name': t_row['name'],
+        'description': '' if pd.isna(description) else description,
+        'year': int(t_row['year']),
+        'start_date': start_date,
+        'end_date': end_date,
+        'creator_id': creator_id
+    }
+
+
+def prepare_teams(df, creator_id, tournament_id):
+    """Validated team records plus the template team_id of each record"""
+    df, _ = normalize_columns(df)
+
+    if df.empty:
+        raise TournamentImportError('Teams sheet is empty')
+    _require_columns(df, 'Teams', ['team_id', 'name'])
+
+    # Skip rows with missing required values
+    df = df.dropna(subset=['team_id', 'name'])
+
+    teams = pd.DataFrame({
+        'name': df['name'],
+        'created_year': _int_column(df, 'created_year', 'Teams'),
+        'logo_shape_type': _int_column(df, 'logo_shape_type', 'Teams', 1),
+        'primary_color': _text_column(df, 'primary_color', '#000000'),
+        'secondary_color': _text_column(df, 'secondary_color', '#FFFFFF'),
+        'wins': _int_column(df, 'wins', 'Teams', 0),
+        'losses': _int_column(df, 'losses', 'Teams', 0),
+        'points': _int_column(df, 'points', 'Teams', 0),
+        'creator_id': creator_id,
+        'tournament_id': tournament_id
+    })
+    return teams.to_dict('records'), _int_column(df, 'team_id', 'Teams').tolist()
+
+
+def prepare_players(df, creator_id, team_map):
+    df, _ = normalize_columns(df)
+
+    if df.empty:
+        raise TournamentImportError('Players sheet is empty')
+    required_fields = ['player_id', 'name', 'position', 'jersey_number', 'team_id']
+    _require_columns(df, 'Players', required_fields)
+
+    # Skip rows with missing required values or unknown teams
+    df = df.dropna(subset=required_fields)
+    team_ids = _map_ids(df, 'team_id', 'Players', team_map)
+    df, team_ids = df[team_ids.notna()], team_ids[team_ids.notna()]
+
+    players = pd.DataFrame({
+        'name': df['name'],
+        'height': _int_column(df, 'height', 'Players'),
+        'weight': _int_column(df, 'weight', 'Players'),
+        'position': df['position'],
+        'jersey_number': _int_column(df, 'jersey_number', 'Players'),
+        'team_id': team_ids.astype('int64'),
+        'creator_id': creator_id
+    })
+    return players.to_dict('records'), _int_column(df, 'player_id', 'Players').tolist()
+
+
+def prepare_matches(df, creator_id, tournament_id, team_map):
+    df, _ = normalize_columns(df)
+
+    if df.empty:
+        raise TournamentImportError('Matches sheet is empty')
+    required_fields = ['match_id', 'team1_id', 'team2_id', 'match_date']
+    _require_columns(df, 'Matches', required_fields)
+
+    # Skip rows with missing required values or unknown teams
+    df = df.dropna(subset=required_fields)
+    team1_ids = _map_ids(df, 'team1_id', 'Matches', team_map)
+    team2_ids = _map_ids(df, 'team2_id', 'Matches', team_map)
+    known = team1_ids.notna() & team2_ids.notna()
+    df, team1_ids, team2_ids = df[known], team1_ids[known], team2_ids[known]
+
+    # Handle different date formats
+    match_dates = pd.to_datetime(df['match_date'], errors='coerce', format='mixed')
+    if match_dates.isna().any():
+        bad = df[match_dates.isna()].iloc[0]
+        raise TournamentImportError(
+            f'Error parsing match date: {bad["match_date"]!r}. Row with match_id={bad["match_id"]}')
+
+    matches = pd.DataFrame({
+        'tournament_id': tournament_id,
+        'team1_id': team1_ids.astype('int64'),
+        'team2_id': team2_ids.astype('int64'),
+        'venue_name': _text_column(df, 'venue_name'),
+        'match_date': match_dates.astype('object'),
+        'creator_id': creator_id
+    })
+    return matches.to_dict('records'), _int_column(df, 'match_id', 'Matches').tolist()
+
+
+def prepare_scores(df, match_map):
+    df, _ = normalize_columns(df)
+
+    if df.empty:
+        return []
+    required_fields = ['match_id', 'team1_score', 'team2_score']
+    _require_columns(df, 'Match Scores', required_fields)
+
+    # Skip rows with missing required values or unknown matches
+    df = df.dropna(subset=required_fields)
+    match_ids = _map_ids(df, 'match_id', 'Match Scores', match_map)
+    df, match_ids = df[match_ids.notna()], match_ids[match_ids.notna()]
+
+    scores = pd.DataFrame({
+        'match_id': match_ids.astype('int64'),
+        'team1_score': _int_column(df, 'team1_score', 'Match Scores'),
+        'team2_score': _int_column(df, 'team2_score', 'Match Scores')
+    })
+    # A match has at most one score; the last row wins
+    scores = scores.drop_duplicates(subset=['match_id'], keep='last')
+    return scores.to_dict('records')
+
+
+def prepare_player_stats(df, match_map, player_map):
+    """Validated stat lines with the calculated fields filled in column-wise.
+
+    Bulk inserts bypass the ORM, so efficiency and double/triple-doubles are
+    computed here with the same rules as models.set_calculated_fields.
+    """
+    df, _ = normalize_columns(df)
+
+    if df.empty:
+        return []
+    required_fields = ['match_id', 'player_id', 'points', 'rebounds', 'assists']
+    _require_columns(df, 'Player Stats', required_fields)
+
+    # Skip rows with missing required values or unknown matches/players
+    df = df.dropna(subset=required_fields)
+    match_ids = _map_ids(df, 'match_id', 'Player Stats', match_map)
+    player_ids = _map_ids(df, 'player_id', 'Player Stats', player_map)
+    known = match_ids.notna() & player_ids.notna()
+    df, match_ids, player_ids = df[known], match_ids[known], player_ids[known]
+
+    stats = pd.DataFrame({
+        'match_id': match_ids.astype('int64'),
+        'player_id': player_ids.astype('int64'),
+        'points': _int_column(df, 'points', 'Player Stats'),
+        'rebounds': _int_column(df, 'rebounds', 'Player Stats'),
+        'assists': _int_column(df, 'assists', 'Player Stats'),
+        'steals': _int_column(df, 'steals', 'Player Stats', 0),
+        'blocks': _int_column(df, 'blocks', 'Player Stats', 0),
+        'turnovers': _int_column(df, 'turnovers', 'Player Stats', 0),
+        'three_pointers': _int_column(df, 'three_pointers', 'Player Stats', 0)
+    })
+
+    categories = stats[['points', 'rebounds', 'assists', 'steals', 'blocks']]
+    tens = (categories >= 10).sum(axis=1)
+    stats['efficiency'] = categories.sum(axis=1) - stats['turnovers']
+    stats['double_double'] = tens >= 2
+    stats['triple_double'] = tens >= 3
+
+    # One stat line per player per match; the last row wins
+    stats = stats.drop_duplicates(subset=['match_id', 'player_id'], keep='last')
+    return stats.to_dict('records')
+
+
+def _discard_tournament(tournament_id):
+    """Remove a partially imported tournament and everything attached to it"""
+    delete_tournament_cascade(tournament_id)
+    db.session.commit()
+
+
+def _file_size(file):
+    position = file.tell()
+    file.seek(0, 2)
+    size = file.tell()
+    file.seek(position)
+    return size
+
+
+def _non_empty_rows(rows):
+    return (row for row in rows if any(value is not None for value in row))
+
+
+def _sheet_frame(ws):
+    """Whole worksheet as a DataFrame, header taken from the first row"""
+    rows = _non_empty_rows(ws.iter_rows(values_only=True))
+    header = next(rows, None)
+    if header is None:
+        return pd.DataFrame()
+    return pd.DataFrame(list(rows), columns=list(header))
+
+
+def _sheet_chunks(ws, chunk_size):
+    """Yield the worksheet as DataFrames of at most `chunk_size` rows"""
+    rows = _non_empty_rows(ws.iter_rows(values_only=True))
+    header = next(rows, None)
+    if header is None:
+        return
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            break
+        yield pd.DataFrame(chunk, columns=list(header))
+
+
+def _report(progress, percent, message):
+    if progress is not None:
+        progress(percent, message)
+
+
+def _import_fixtures(read, creator_id):
+    """Import every sheet except Player Stats.
+
+    Returns the tournament and the template -> database id maps that the
+    player stats rows are translated with.
+    """
+    # 1. Tournament details
+    tournament = Tournament(**prepare_tournament(read("Tournament Details"), creator_id))
+    db.session.add(tournament)
+    db.session.flush()  # Get tournament ID
+
+    # 2. Teams
+    records, template_ids = prepare_teams(read("Teams"), creator_id, tournament.id)
+    team_map = dict(zip(template_ids, _insert_returning_ids(Team, records)))
+
+    # 3. Players
+    records, template_ids = prepare_players(read("Players"), creator_id, team_map)
+    player_map = dict(zip(template_ids, _insert_returning_ids(Player, records)))
+
+    # 4. Matches
+    records, template_ids = prepare_matches(read("Matches"), creator_id, tournament.id, team_map)
+    match_map = dict(zip(template_ids, _insert_returning_ids(Match, records)))
+
+    # 5. Match scores
+    _insert(MatchScore, prepare_scores(read("Match Scores"), match_map))
+
+    # Calculate team wins, losses, and points based on match scores
+    recalculate_standings(tournament.id)
+
+    return tournament, match_map, player_map
+
+
+def import_tournament(file, creator_id, progress=None):
+    """Import a tournament workbook inside the current transaction.
+
+    Each sheet is validated column-wise and written with a single executemany;
+    template ids are translated to database ids in bulk. The caller commits.
+    Workbooks larger than IMPORT_STREAMING_THRESHOLD bytes are handed to
+    import_tournament_streaming instead.
+
+    `progress`, if given, is passed on to the streaming import; the in-memory
+    import commits only once, so it has no progress to report.
+    """
+    if _file_size(file) > current_app.config['IMPORT_STREAMING_THRESHOLD']:
+        return import_tournament_streaming(file, creator_id, progress=progress)
+
+    xls = pd.ExcelFile(file)
+    actual_sheet_names = resolve_sheet_names(xls.sheet_names)
+
+    def read(sheet):
+        return pd.read_excel(xls, actual_sheet_names[sheet])
+
+    tournament, match_map, player_map = _import_fixtures(read, creator_id)
+
+    # 6. Player stats
+    records = prepare_player_stats(read("Player Stats"), match_map, player_map)
+    _insert(PlayerStats, records)
+    refresh_season_totals(db.session.connection(),
+                          select(Player.id).join(Team).where(Team.tournament_id == tournament.id))
+
+    return tournament
+
+
+def import_tournament_streaming(file, creator_id, chunk_size=None, progress=None):
+    """Import a workbook row-streamed through openpyxl's read-only mode.
+
+    The tournament, teams, players, matches and scores are committed first;
+    the Player Stats sheet, which holds nearly all rows of a multi-season
+    archive, is then read, inserted and committed IMPORT_CHUNK_SIZE rows at a
+    time so memory use does not grow with the file. If any chunk fails, the
+    partially imported tournament is deleted again before the error is raised.
+    `progress` is reported before every commit, so it is persisted with it.
+    """
+    chunk_size = chunk_size or current_app.config['IMPORT_CHUNK_SIZE']
+    wb = load_workbook(file, read_only=True, data_only=True)
+    tournament_id = None
+    try:
+        actual_sheet_names = resolve_sheet_names(wb.sheetnames)
+
+        def read(sheet):
+            return _sheet_frame(wb[actual_sheet_names[sheet]])
+
+        tournament, match_map, player_map = _import_fixtures(read, creator_id)
+        tournament_id = tournament.id
+        _report(progress, 25, 'Teams, players, matches and scores imported')
+        db.session.commit()
+
+        # 6. Player stats, one transaction per chunk
+        ws = wb[actual_sheet_names["Player Stats"]]
+        total_rows = max((ws.max_row or 0) - 1, 1)  # From the sheet dimension, excluding the header
+        rows_read = imported = 0
+        for chunk in _sheet_chunks(ws, chunk_size):
+            rows_read += len(chunk)
+            records = prepare_player_stats(chunk, match_map, player_map)
+            imported += len(records)
+            _report(progress, min(25 + 75 * rows_read // total_rows, 99),
+                    f'{imported} player stat lines imported')
+            if records:
+                # A stat line repeated from an earlier chunk replaces it, as in the in-memory import
+                pairs = [(record['match_id'], record['player_id']) for record in records]
+                db.session.execute(
+                    delete(PlayerStats).where(tuple_(PlayerStats.match_id, PlayerStats.player_id).in_(pairs))
+                )
+                _insert(PlayerStats, records)
+                refresh_season_totals(db.session.connection(), sorted({player_id for _, player_id in pairs}))
+            db.session.commit()
+    except Exception:
+        db.session.rollback()
+        if tournament_id is not None:
+            _discard_tournament(tournament_id)
+        raise
+    finally:
+        wb.close()
+
+    return tournament
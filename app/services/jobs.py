@@ -0,0 +1,129 @@
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from flask import current_app
+from app.models.models import UploadJob, db
+from app.services.cache import bump_data_version
+
+# Tournament uploads run on a small per-app thread pool so the request that
+# receives the file returns immediately. Job state lives in the upload_job
+# table, which /api/upload_jobs/<id> reads for progress polling. A job whose
+# process died mid-import (a restart, a recycled or killed worker) stops
+# updating its row; once that has lasted UPLOAD_JOB_TIMEOUT seconds, reading
+# the job marks it failed and deletes its workbook.
+#
+# The importer (and with it pandas, numpy and openpyxl) is imported inside
+# run_upload_job, so web workers that never receive an upload don't load it.
+
+FINISHED_STATUSES = ('succeeded', 'failed')
+
+
+def upload_executor():
+    """The per-app worker pool for upload jobs"""
+    executor = current_app.extensions.get('upload_executor')
+    if executor is None:
+        executor = ThreadPoolExecutor(max_workers=current_app.config.get('UPLOAD_WORKERS', 2),
+                                      thread_name_prefix='upload-job')
+        current_app.extensions['upload_executor'] = executor
+    return executor
+
+
+def _job_path(job_id):
+    """Where a job's workbook waits for its worker"""
+    directory = current_app.config.get('UPLOAD_JOB_DIR') or tempfile.gettempdir()
+    return os.path.join(directory, f'upload-job-{job_id}.xlsx')
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def enqueue_upload(file, user_id):
+    """Save the uploaded workbook to a temporary file and queue its import"""
+    job = UploadJob(user_id=user_id, filename=file.filename or 'upload.xlsx')
+    db.session.add(job)
+    db.session.flush()  # Get job ID for the file name
+
+    path = _job_path(job.id)
+    try:
+        file.save(path)
+    except Exception:
+        _remove(path)
+        raise
+    db.session.commit()
+
+    upload_executor().submit(run_upload_job, current_app._get_current_object(), job.id, path)
+    return job
+
+
+def fail_stale_job(job):
+    """Mark an unfinished job failed if it has not been updated for UPLOAD_JOB_TIMEOUT seconds"""
+    if job.status in FINISHED_STATUSES or job.updated_at is None:
+        return False
+    if datetime.utcnow() - job.updated_at < timedelta(seconds=current_app.config['UPLOAD_JOB_TIMEOUT']):
+        return False
+
+    job.status = 'failed'
+    job.message = 'The import stopped before it finished. Please upload the file again.'
+    db.session.commit()
+    _remove(_job_path(job.id))
+    return True
+
+
+def run_upload_job(app, job_id, path):
+    """Import a saved workbook for the given job; runs on a worker thread.
+
+    Progress is set on the job row and saved by the importer's own commits, so
+    a failed in-memory import never leaves a half-written job behind. Only the
+    streaming import commits before it is done, so smaller workbooks go from 0
+    to 100 in one step.
+    """
+    from app.services.importer import import_tournament, TournamentImportError
+
+    with app.app_context():
+        try:
+            job = db.session.get(UploadJob, job_id)
+            if job.status != 'queued':
+                # Already given up on by fail_stale_job
+                return
+            job.status = 'running'
+            job.message = 'Reading workbook'
+            db.session.commit()
+
+            def progress(percent, message):
+                job.progress = percent
+                job.message = message
+
+            with open(path, 'rb') as file:
+                tournament = import_tournament(file, job.user_id, progress=progress)
+            bump_data_version(tournament.id)
+
+            job.status = 'succeeded'
+            job.progress = 100
+            job.message = 'Tournament uploaded successfully!'
+            job.tournament_id = tournament.id
+            db.session.commit()
+
+        except TournamentImportError as e:
+            db.session.rollback()
+            _fail(job_id, str(e))
+
+        except Exception as e:
+            db.session.rollback()
+            print(f"Error in upload job {job_id}: {str(e)}")
+            _fail(job_id, f'Error uploading tournament: {str(e)}')
+
+        finally:
+            db.session.remove()
+            _remove(path)
+
+
+def _fail(job_id, message):
+    job = db.session.get(UploadJob, job_id)
+    job.status = 'failed'
+    job.message = message
+    db.session.commit()
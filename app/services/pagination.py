@@ -0,0 +1,121 @@
+import base64
+import json
+from datetime import date, datetime
+from flask import current_app, request
+from sqlalchemy import and_, or_
+from app.models.models import db
+
+# Keyset pagination for the JSON listings. A page is requested with ?limit=N;
+# when more rows follow, the response carries an X-Next-Cursor header whose
+# value is passed back as ?cursor=... to fetch the next page. The cursor holds
+# the sort key of the last row returned, so each page is an index range scan
+# instead of an OFFSET that re-reads every earlier row. Listings that offer
+# several orderings take ?sort=key (or -key to reverse it), see sort_order.
+
+
+class InvalidCursor(ValueError):
+    """Raised when a cursor, limit or sort parameter cannot be used"""
+
+
+def encode_cursor(values):
+    raw = json.dumps([value.isoformat() if isinstance(value, (date, datetime)) else value
+                      for value in values], separators=(',', ':'))
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(token, order):
+    """Sort key values from a cursor produced by encode_cursor"""
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        if not isinstance(values, list) or len(values) != len(order):
+            raise ValueError
+        return [_from_json(column, value) for (column, _), value in zip(order, values)]
+    except (ValueError, TypeError, UnicodeError):
+        raise InvalidCursor('Invalid cursor')
+
+
+def _from_json(column, value):
+    if value is None:
+        return None
+    python_type = column.type.python_type
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type is date:
+        return date.fromisoformat(value)
+    if python_type in (int, str) and not isinstance(value, python_type):
+        raise ValueError
+    return value
+
+
+def page_params(order):
+    """(limit, last sort key) from the request; limit is None when not paginating"""
+    limit = request.args.get('limit')
+    cursor = request.args.get('cursor')
+    if limit is None:
+        if cursor:
+            raise InvalidCursor('cursor requires limit')
+        return None, None
+
+    try:
+        limit = int(limit)
+    except ValueError:
+        raise InvalidCursor('limit must be a number')
+    if limit < 1:
+        raise InvalidCursor('limit must be positive')
+    limit = min(limit, current_app.config.get('MAX_PAGE_SIZE', 200))
+
+    return limit, decode_cursor(cursor, order) if cursor else None
+
+
+def sort_order(sorts, default):
+    """(column, descending) ordering for the request's ?sort= key.
+
+    `sorts` maps each key to its columns, the last of them unique. A leading
+    '-' reverses every column, so the same index serves both directions.
+    """
+    sort = request.args.get('sort') or default
+    descending = sort.startswith('-')
+    columns = sorts.get(sort[1:] if descending else sort)
+    if columns is None:
+        raise InvalidCursor(f"sort must be one of {', '.join(sorted(sorts))}")
+    return [(column, descending) for column in columns]
+
+
+def keyset_filter(order, last):
+    """Rows strictly after `last` in the given (column, descending) ordering"""
+    clauses = []
+    for i, (column, descending) in enumerate(order):
+        earlier = [col == value for (col, _), value in zip(order[:i], last[:i])]
+        after = column < last[i] if descending else column > last[i]
+        clauses.append(and_(*earlier, after))
+    return or_(*clauses)
+
+
+def fetch_page(query, order):
+    """Run a select() in the given (column, descending) order for the requested page.
+
+    Returns the rows and the cursor of the next page, which is None on the last
+    page or when no limit was asked for. The sort key columns must be non-null
+    and selected under their own names, and the last one must be unique
+    (usually the id).
+    """
+    limit, last = page_params(order)
+    if last is not None:
+        query = query.where(keyset_filter(order, last))
+    query = query.order_by(*[column.desc() if descending else column.asc()
+                             for column, descending in order])
+    if limit is None:
+        return db.session.execute(query).all(), None
+
+    rows = db.session.execute(query.limit(limit + 1)).all()
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, encode_cursor(getattr(rows[-1], column.key) for column, _ in order)
+
+
+def with_next_cursor(response, next_cursor):
+    if next_cursor:
+        response.headers['X-Next-Cursor'] = next_cursor
+    return response
@@ -0,0 +1,129 @@
+from sqlalchemy import case, func, select, union_all, update, bindparam
+from app.models.models import Team, Match, MatchScore, db
+
+# Standings points awarded per result
+WIN_POINTS = 2
+DRAW_POINTS = 1
+
+# Core table used for arithmetic updates, so no Team rows need to be loaded
+team_table = Team.__table__
+
+
+def scored_sides(*criteria):
+    """Both sides of every scored match as (team_id, scored, conceded) rows.
+
+    Extra criteria (e.g. a tournament filter on Match) are applied to each side.
+    """
+    home = select(
+        Match.team1_id.label('team_id'),
+        MatchScore.team1_score.label('scored'),
+        MatchScore.team2_score.label('conceded')
+    ).join(MatchScore, MatchScore.match_id == Match.id).where(*criteria)
+
+    away = select(
+        Match.team2_id.label('team_id'),
+        MatchScore.team2_score.label('scored'),
+        MatchScore.team1_score.label('conceded')
+    ).join(MatchScore, MatchScore.match_id == Match.id).where(*criteria)
+
+    return union_all(home, away).subquery()
+
+
+def recalculate_standings(tournament_id):
+    """Recompute wins, losses and points for every team in a tournament.
+
+    Both sides of every scored match are folded into one GROUP BY query, so the
+    cost is a fixed number of statements regardless of how many matches exist.
+    """
+    # Make sure scores added earlier in this transaction are visible to the query
+    db.session.flush()
+
+    results = scored_sides(Match.tournament_id == tournament_id)
+
+    totals = db.session.execute(
+        select(
+            results.c.team_id,
+            func.sum(case((results.c.scored > results.c.conceded, 1), else_=0)),
+            func.sum(case((results.c.scored < results.c.conceded, 1), else_=0)),
+            func.sum(case(
+                (results.c.scored > results.c.conceded, WIN_POINTS),
+                (results.c.scored == results.c.conceded, DRAW_POINTS),
+                else_=0
+            ))
+        ).group_by(results.c.team_id)
+    ).all()
+
+    # Reset every team in the tournament, then write the aggregated totals
+    db.session.execute(
+        update(team_table)
+        .where(team_table.c.tournament_id == tournament_id)
+        .values(wins=0, losses=0, points=0)
+    )
+
+    if totals:
+        db.session.execute(
+            update(team_table)
+            .where(team_table.c.id == bindparam('team_id'))
+            .where(team_table.c.tournament_id == tournament_id)
+            .values(wins=bindparam('wins'), losses=bindparam('losses'), points=bindparam('points')),
+            [{'team_id': team_id, 'wins': wins, 'losses': losses, 'points': points}
+             for team_id, wins, losses, points in totals]
+        )
+
+
+def match_result(team1_id, team2_id, score):
+    """Snapshot of a match outcome that can later be passed to apply_result_change.
+
+    Returns None when the match has no score, so unscored matches contribute nothing.
+    """
+    if score is None:
+        return None
+    return (int(team1_id), int(team2_id), int(score.team1_score), int(score.team2_score))
+
+
+def _result_deltas(result, sign, deltas):
+    """Add (sign = 1) or remove (sign = -1) a single result from the per-team deltas"""
+    if result is None:
+        return
+    team1_id, team2_id, team1_score, team2_score = result
+
+    for team_id, scored, conceded in ((team1_id, team1_score, team2_score),
+                                      (team2_id, team2_score, team1_score)):
+        entry = deltas.setdefault(team_id, [0, 0, 0])
+        if scored > conceded:
+            entry[0] += sign
+            entry[2] += sign * WIN_POINTS
+        elif scored < conceded:
+            entry[1] += sign
+        else:
+            entry[2] += sign * DRAW_POINTS
+
+
+def apply_result_change(old_result, new_result):
+    """Move standings from old_result to new_result without rescanning the tournament.
+
+    Either side may be None (score created or removed). Only the teams involved in
+    the change are touched, using relative UPDATEs so no rows are loaded.
+    """
+    if old_result == new_result:
+        return
+
+    deltas = {}
+    _result_deltas(old_result, -1, deltas)
+    _result_deltas(new_result, 1, deltas)
+
+    params = [{'team_id': team_id, 'd_wins': d[0], 'd_losses': d[1], 'd_points': d[2]}
+              for team_id, d in deltas.items() if any(d)]
+    if not params:
+        return
+
+    db.session.execute(
+        update(team_table)
+        .where(team_table.c.id == bindparam('team_id'))
+        .values(
+            wins=team_table.c.wins + bindparam('d_wins'),
+            losses=team_table.c.losses + bindparam('d_losses'),
+            points=team_table.c.points + bindparam('d_points')
+        ),
+        params
+    )
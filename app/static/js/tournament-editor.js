@@ -11,6 +11,9 @@ document.addEventListener('DOMContentLoaded', function() {
     const noTournamentsMessage = document.getElementById('noTournamentsMessage');
     const deleteTournamentBtn = document.getElementById('deleteTournamentBtn');
     
+    // Tournaments fetched per request; further pages load on demand
+    const tournamentPageSize = 50;
+    
     // Editor elements
     const currentTournamentName = document.getElementById('currentTournamentName');
     const selectTournamentMessage = document.getElementById('selectTournamentMessage');
@@ -27,6 +30,13 @@ document.addEventListener('DOMContentLoaded', function() {
     // Current state
     let currentTournament = null;
     let allTeams = [];
+    let allPlayers = [];
+    let allMatches = [];
+    
+    // Local copy of the open tournament's teams, players, matches and stats,
+    // from /api/tournament/<id>/snapshot. Tabs and modals render from it, and
+    // it is fetched again after every change
+    let store = null;
     
     // Initialize the editor
     init();
@@ -93,6 +103,7 @@ document.addEventListener('DOMContentLoaded', function() {
         // Stats tab events
         document.getElementById('statMatchFilter')?.addEventListener('change', loadPlayerStats);
         document.getElementById('statTeamFilter')?.addEventListener('change', filterPlayerStats);
+        document.getElementById('saveAllStatsBtn')?.addEventListener('click', saveAllPlayerStats);
         
         // Delete confirmation
         document.getElementById('confirmDeleteBtn')?.addEventListener('click', confirmDelete);
@@ -118,45 +129,164 @@ document.addEventListener('DOMContentLoaded', function() {
         return null;
     }
     
+    // =============================================
+    // LOCAL STORE
+    // =============================================
+    
+    /**
+     * Fetch a tournament's whole editable data set into the store
+     * @param {number} id - Tournament ID
+     * @returns {Promise<Object>} The snapshot
+     */
+    function fetchSnapshot(id) {
+        return fetch(`/api/tournament/${id}/snapshot`)
+            .then(response => {
+                if (!response.ok) {
+                    throw new Error('Failed to load tournament details');
+                }
+                return response.json();
+            })
+            .then(snapshot => {
+                store = snapshot;
+                return snapshot;
+            });
+    }
+    
+    /**
+     * Fetch the open tournament again after a change and redraw the teams, players and matches
+     * @returns {Promise} Settles once the tabs are redrawn
+     */
+    function refreshTournament() {
+        return fetchSnapshot(currentTournament.id)
+            .then(() => {
+                renderTeams();
+                renderMatches();
+            })
+            .catch(error => {
+                console.error('Error reloading tournament:', error);
+                alert('Error reloading tournament: ' + error.message);
+            });
+    }
+    
+    /**
+     * Name of a team in the store
+     * @param {number} teamId - Team ID
+     * @returns {string} Team name, or 'Unknown'
+     */
+    function teamName(teamId) {
+        const team = store.teams[teamId];
+        return team ? team.name : 'Unknown';
+    }
+    
+    /**
+     * Teams in the store, by id
+     * @returns {Array} Team data
+     */
+    function teamList() {
+        return Object.entries(store.teams)
+            .map(([id, team]) => ({ id: Number(id), ...team }))
+            .sort((a, b) => a.id - b.id);
+    }
+    
+    /**
+     * Players in the store with their team names, by id
+     * @returns {Array} Player data
+     */
+    function playerList() {
+        return Object.entries(store.players)
+            .map(([id, player]) => ({ id: Number(id), ...player, team_name: teamName(player.team_id) }))
+            .sort((a, b) => a.id - b.id);
+    }
+    
     /**
-     * Load tournaments with optional search filter
+     * Matches in the store with their team names, by date
+     * @returns {Array} Match data
+     */
+    function matchList() {
+        return Object.entries(store.matches)
+            .map(([id, match]) => ({
+                id: Number(id),
+                ...match,
+                team1_name: teamName(match.team1_id),
+                team2_name: teamName(match.team2_id),
+                has_score: match.team1_score !== null
+            }))
+            .sort((a, b) => a.match_date.localeCompare(b.match_date));
+    }
+    
+    /**
+     * Player statistics recorded for a match, with player and team names
+     * @param {number} matchId - Match ID
+     * @returns {Array} Statistics data
+     */
+    function matchStats(matchId) {
+        return Object.entries(store.stats[matchId] || {})
+            .filter(([playerId]) => store.players[playerId])
+            .map(([playerId, stat]) => {
+                const player = store.players[playerId];
+                return {
+                    ...stat,
+                    match_id: Number(matchId),
+                    player_id: Number(playerId),
+                    player_name: player.name,
+                    team_id: player.team_id,
+                    team_name: teamName(player.team_id)
+                };
+            })
+            .sort((a, b) => a.id - b.id);
+    }
+    
+    /**
+     * Load tournaments with optional search filter, one page at a time
      * @param {string} searchQuery - Optional search term
+     * @param {string} cursor - Position to continue from; omitted for the first page
      */
-    function loadTournaments(searchQuery = '') {
+    function loadTournaments(searchQuery = '', cursor = null) {
         if (!tournamentList) return;
         
         // Show loading state
         loadingSpinner.classList.remove('d-none');
         noTournamentsMessage.classList.add('d-none');
-        tournamentList.innerHTML = '';
+        if (!cursor) {
+            tournamentList.innerHTML = '';
+        }
+        removeLoadMoreButton();
         
         // Build API URL
-        let url = '/api/tournaments';
+        const params = new URLSearchParams({ limit: tournamentPageSize });
         if (searchQuery) {
-            url += `?q=${encodeURIComponent(searchQuery)}`;
+            params.set('q', searchQuery);
+        }
+        if (cursor) {
+            params.set('cursor', cursor);
         }
         
         // Fetch tournaments
-        fetch(url)
+        fetch(`/api/tournaments?${params}`)
             .then(response => {
                 if (!response.ok) {
                     throw new Error('Failed to load tournaments');
                 }
-                return response.json();
+                const nextCursor = response.headers.get('X-Next-Cursor');
+                return response.json().then(tournaments => ({ tournaments, nextCursor }));
             })
-            .then(tournaments => {
+            .then(({ tournaments, nextCursor }) => {
                 // Hide loading spinner
                 loadingSpinner.classList.add('d-none');
                 
-                if (tournaments.length === 0) {
+                if (tournaments.length === 0 && !cursor) {
                     // Show no tournaments message
                     noTournamentsMessage.classList.remove('d-none');
                     return;
                 }
                 
-                // Create list group for tournaments
-                const listGroup = document.createElement('div');
-                listGroup.className = 'list-group';
+                // Create the list group on the first page, append to it afterwards
+                let listGroup = tournamentList.querySelector('.list-group');
+                if (!listGroup) {
+                    listGroup = document.createElement('div');
+                    listGroup.className = 'list-group';
+                    tournamentList.appendChild(listGroup);
+                }
                 
                 // Render each tournament
                 tournaments.forEach(tournament => {
@@ -164,7 +294,9 @@ document.addEventListener('DOMContentLoaded', function() {
                     listGroup.appendChild(item);
                 });
                 
-                tournamentList.appendChild(listGroup);
+                if (nextCursor) {
+                    addLoadMoreButton(() => loadTournaments(searchQuery, nextCursor));
+                }
             })
             .catch(error => {
                 console.error('Error loading tournaments:', error);
@@ -173,6 +305,27 @@ document.addEventListener('DOMContentLoaded', function() {
             });
     }
     
+    /**
+     * Show a button under the tournament list that loads the next page
+     * @param {Function} onClick - Loads the next page
+     */
+    function addLoadMoreButton(onClick) {
+        const button = document.createElement('button');
+        button.type = 'button';
+        button.id = 'loadMoreTournaments';
+        button.className = 'btn btn-outline-secondary btn-sm w-100 mt-2';
+        button.textContent = 'Load more tournaments';
+        button.addEventListener('click', onClick);
+        tournamentList.appendChild(button);
+    }
+    
+    function removeLoadMoreButton() {
+        const button = document.getElementById('loadMoreTournaments');
+        if (button) {
+            button.remove();
+        }
+    }
+    
     /**
      * Create a tournament list item
      * @param {Object} tournament - Tournament data
@@ -222,16 +375,11 @@ document.addEventListener('DOMContentLoaded', function() {
         // Show loading state in current tournament name
         currentTournamentName.innerHTML = '<span class="spinner-border spinner-border-sm me-2" role="status" aria-hidden="true"></span> Loading...';
         
-        // Fetch tournament details
-        fetch(`/api/tournament/${id}`)
-            .then(response => {
-                if (!response.ok) {
-                    throw new Error('Failed to load tournament details');
-                }
-                return response.json();
-            })
-            .then(tournament => {
+        // Fetch everything the editor shows in one request
+        fetchSnapshot(id)
+            .then(snapshot => {
                 // Store current tournament
+                const tournament = snapshot.tournament;
                 currentTournament = tournament;
                 
                 // Update UI
@@ -239,13 +387,13 @@ document.addEventListener('DOMContentLoaded', function() {
                 selectTournamentMessage.classList.add('d-none');
                 editorContent.classList.remove('d-none');
                 
-                // Load tabs data
-                populateTournamentDetailsForm(tournament);
-                loadTeams(tournament.id);
-                loadMatches(tournament.id);
-                
                 // Reset player stats tab
                 resetPlayerStatsTab();
+                
+                // Render tabs from the store
+                populateTournamentDetailsForm(tournament);
+                renderTeams();
+                renderMatches();
             })
             .catch(error => {
                 console.error('Error loading tournament:', error);
@@ -448,29 +596,20 @@ document.addEventListener('DOMContentLoaded', function() {
                     currentTournamentName.textContent = 'Select a Tournament';
                     selectTournamentMessage.classList.remove('d-none');
                     editorContent.classList.add('d-none');
-                } else if (type === 'team') {
-                    // Reload teams
-                    loadTeams(currentTournament.id);
-                    
-                    // Reload player team filter options
-                    updatePlayerTeamFilters();
-                    
-                    // Reload matches (as they reference teams)
-                    loadMatches(currentTournament.id);
-                } else if (type === 'player') {
-                    // Reload players
-                    loadPlayers(currentTournament.id);
+                } else if (type === 'team' || type === 'player') {
+                    // Reload teams, players and matches (which reference teams)
+                    refreshTournament();
                 } else if (type === 'match') {
                     // If we're deleting a match, we need to remove it from allMatches array
                     if (allMatches) {
                         allMatches = allMatches.filter(match => match.id != id);
                     }
                     
-                    // Reload matches
-                    loadMatches(currentTournament.id);
-                    
                     // Completely reset player stats tab (including dropdowns)
                     resetPlayerStatsTab();
+                    
+                    // Reload matches
+                    refreshTournament();
                 }
                 
                 // Show success message
@@ -492,10 +631,9 @@ document.addEventListener('DOMContentLoaded', function() {
     // =============================================
     
     /**
-     * Load teams for the tournament
-     * @param {number} tournamentId - Tournament ID
+     * Render the tournament's teams from the store
      */
-    function loadTeams(tournamentId) {
+    function renderTeams() {
         const teamsLoading = document.getElementById('teamsLoading');
         const noTeamsMessage = document.getElementById('noTeamsMessage');
         const teamsTable = document.getElementById('teamsTable');
@@ -503,54 +641,36 @@ document.addEventListener('DOMContentLoaded', function() {
         
         if (!teamsTableBody) return;
         
-        // Show loading state
-        teamsLoading.classList.remove('d-none');
+        teamsLoading.classList.add('d-none');
         noTeamsMessage.classList.add('d-none');
         teamsTableBody.innerHTML = '';
         
-        // Fetch teams
-        fetch(`/api/tournament/${tournamentId}/teams`)
-            .then(response => {
-                if (!response.ok) {
-                    throw new Error('Failed to load teams');
-                }
-                return response.json();
-            })
-            .then(teams => {
-                // Hide loading state
-                teamsLoading.classList.add('d-none');
-                
-                // Store for reference
-                allTeams = teams;
-                
-                // Update all team dropdowns
-                updatePlayerTeamFilters();
-                updateMatchTeamDropdowns();
-                
-                if (teams.length === 0) {
-                    noTeamsMessage.classList.remove('d-none');
-                    teamsTable.classList.add('d-none');
-                    return;
-                }
-                
-                // Show table
-                teamsTable.classList.remove('d-none');
-                
-                // Render teams
-                teams.forEach(team => {
-                    const row = createTeamRow(team);
-                    teamsTableBody.appendChild(row);
-                });
-                
-                // Load players after teams are loaded
-                loadPlayers(tournamentId);
-            })
-            .catch(error => {
-                console.error('Error loading teams:', error);
-                teamsLoading.classList.add('d-none');
-                noTeamsMessage.classList.remove('d-none');
-                noTeamsMessage.textContent = 'Error loading teams: ' + error.message;
-            });
+        const teams = teamList();
+        
+        // Store for reference
+        allTeams = teams;
+        
+        // Update all team dropdowns
+        updatePlayerTeamFilters();
+        updateMatchTeamDropdowns();
+        
+        if (teams.length === 0) {
+            noTeamsMessage.classList.remove('d-none');
+            teamsTable.classList.add('d-none');
+            return;
+        }
+        
+        // Show table
+        teamsTable.classList.remove('d-none');
+        
+        // Render teams
+        teams.forEach(team => {
+            const row = createTeamRow(team);
+            teamsTableBody.appendChild(row);
+        });
+        
+        // Render players once the team filters are in place
+        renderPlayers();
     }
     
     /**
@@ -616,36 +736,14 @@ document.addEventListener('DOMContentLoaded', function() {
             modalTitle.textContent = 'Edit Team';
             saveBtn.textContent = 'Update Team';
             
-            // Show loading state
-            saveBtn.disabled = true;
-            saveBtn.innerHTML = '<span class="spinner-border spinner-border-sm me-2" role="status" aria-hidden="true"></span> Loading...';
-            
-            // Fetch team details
-            fetch(`/api/team/${teamId}`)
-                .then(response => {
-                    if (!response.ok) {
-                        throw new Error('Failed to load team details');
-                    }
-                    return response.json();
-                })
-                .then(team => {
-                    // Populate form
-                    document.getElementById('teamId').value = team.id;
-                    document.getElementById('teamName').value = team.name;
-                    document.getElementById('teamCreatedYear').value = team.created_year || '';
-                    document.getElementById('teamPrimaryColor').value = team.primary_color;
-                    document.getElementById('teamSecondaryColor').value = team.secondary_color;
-                    document.getElementById('teamLogoShape').value = team.logo_shape_type;
-                    
-                    // Reset button state
-                    saveBtn.disabled = false;
-                    saveBtn.textContent = 'Update Team';
-                })
-                .catch(error => {
-                    console.error('Error loading team:', error);
-                    alert('Error loading team: ' + error.message);
-                    teamModal.hide();
-                });
+            // Populate form from the store
+            const team = store.teams[teamId];
+            document.getElementById('teamId').value = teamId;
+            document.getElementById('teamName').value = team.name;
+            document.getElementById('teamCreatedYear').value = team.created_year || '';
+            document.getElementById('teamPrimaryColor').value = team.primary_color;
+            document.getElementById('teamSecondaryColor').value = team.secondary_color;
+            document.getElementById('teamLogoShape').value = team.logo_shape_type;
         } else {
             // Adding new team
             modalTitle.textContent = 'Add Team';
@@ -717,7 +815,7 @@ document.addEventListener('DOMContentLoaded', function() {
                 teamModal.hide();
                 
                 // Reload teams
-                loadTeams(currentTournament.id);
+                refreshTournament();
                 
                 // Show success message
                 alert(isEditing ? 'Team updated successfully' : 'Team added successfully');
@@ -832,10 +930,9 @@ document.addEventListener('DOMContentLoaded', function() {
     // =============================================
     
     /**
-     * Load players for the tournament
-     * @param {number} tournamentId - Tournament ID
+     * Render the tournament's players from the store
      */
-    function loadPlayers(tournamentId) {
+    function renderPlayers() {
         const playersLoading = document.getElementById('playersLoading');
         const noPlayersMessage = document.getElementById('noPlayersMessage');
         const playersTable = document.getElementById('playersTable');
@@ -843,53 +940,35 @@ document.addEventListener('DOMContentLoaded', function() {
         
         if (!playersTableBody) return;
         
-        // Show loading state
-        playersLoading.classList.remove('d-none');
+        playersLoading.classList.add('d-none');
         noPlayersMessage.classList.add('d-none');
         playersTableBody.innerHTML = '';
         
-        // Fetch players
-        fetch(`/api/tournament/${tournamentId}/players`)
-            .then(response => {
-                if (!response.ok) {
-                    throw new Error('Failed to load players');
-                }
-                return response.json();
-            })
-            .then(players => {
-                // Hide loading state
-                playersLoading.classList.add('d-none');
-                
-                if (players.length === 0) {
-                    noPlayersMessage.classList.remove('d-none');
-                    playersTable.classList.add('d-none');
-                    return;
-                }
-                
-                // Show table
-                playersTable.classList.remove('d-none');
-                
-                // Store all players
-                allPlayers = players;
-                
-                // Apply team filter if selected
-                const teamFilter = document.getElementById('playerTeamFilter').value;
-                if (teamFilter !== 'all') {
-                    players = players.filter(player => player.team_id.toString() === teamFilter);
-                }
-                
-                // Render players
-                players.forEach(player => {
-                    const row = createPlayerRow(player);
-                    playersTableBody.appendChild(row);
-                });
-            })
-            .catch(error => {
-                console.error('Error loading players:', error);
-                playersLoading.classList.add('d-none');
-                noPlayersMessage.classList.remove('d-none');
-                noPlayersMessage.textContent = 'Error loading players: ' + error.message;
-            });
+        let players = playerList();
+        
+        // Store all players
+        allPlayers = players;
+        
+        if (players.length === 0) {
+            noPlayersMessage.classList.remove('d-none');
+            playersTable.classList.add('d-none');
+            return;
+        }
+        
+        // Show table
+        playersTable.classList.remove('d-none');
+        
+        // Apply team filter if selected
+        const teamFilter = document.getElementById('playerTeamFilter').value;
+        if (teamFilter !== 'all') {
+            players = players.filter(player => player.team_id.toString() === teamFilter);
+        }
+        
+        // Render players
+        players.forEach(player => {
+            const row = createPlayerRow(player);
+            playersTableBody.appendChild(row);
+        });
     }
     
     /**
@@ -936,8 +1015,7 @@ document.addEventListener('DOMContentLoaded', function() {
      * Filter players by team
      */
     function filterPlayers() {
-        const teamId = this.value;
-        loadPlayers(currentTournament.id);
+        renderPlayers();
     }
     
     /**
@@ -961,43 +1039,21 @@ document.addEventListener('DOMContentLoaded', function() {
             modalTitle.textContent = 'Edit Player';
             saveBtn.textContent = 'Update Player';
             
-            // Show loading state
-            saveBtn.disabled = true;
-            saveBtn.innerHTML = '<span class="spinner-border spinner-border-sm me-2" role="status" aria-hidden="true"></span> Loading...';
+            // Populate form from the store
+            const player = store.players[playerId];
+            document.getElementById('playerId').value = playerId;
+            document.getElementById('playerName').value = player.name;
+            document.getElementById('playerTeam').value = player.team_id;
+            document.getElementById('playerPosition').value = player.position;
+            document.getElementById('playerJerseyNumber').value = player.jersey_number;
             
-            // Fetch player details
-            fetch(`/api/player/${playerId}`)
-                .then(response => {
-                    if (!response.ok) {
-                        throw new Error('Failed to load player details');
-                    }
-                    return response.json();
-                })
-                .then(player => {
-                    // Populate form
-                    document.getElementById('playerId').value = player.id;
-                    document.getElementById('playerName').value = player.name;
-                    document.getElementById('playerTeam').value = player.team_id;
-                    document.getElementById('playerPosition').value = player.position;
-                    document.getElementById('playerJerseyNumber').value = player.jersey_number;
-                    
-                    if (player.height) {
-                        document.getElementById('playerHeight').value = player.height;
-                    }
-                    
-                    if (player.weight) {
-                        document.getElementById('playerWeight').value = player.weight;
-                    }
-                    
-                    // Reset button state
-                    saveBtn.disabled = false;
-                    saveBtn.textContent = 'Update Player';
-                })
-                .catch(error => {
-                    console.error('Error loading player:', error);
-                    alert('Error loading player: ' + error.message);
-                    playerModal.hide();
-                });
+            if (player.height) {
+                document.getElementById('playerHeight').value = player.height;
+            }
+            
+            if (player.weight) {
+                document.getElementById('playerWeight').value = player.weight;
+            }
         } else {
             // Adding new player
             modalTitle.textContent = 'Add Player';
@@ -1072,7 +1128,7 @@ document.addEventListener('DOMContentLoaded', function() {
                 playerModal.hide();
                 
                 // Reload players
-                loadPlayers(currentTournament.id);
+                refreshTournament();
                 
                 // Show success message
                 alert(isEditing ? 'Player updated successfully' : 'Player added successfully');
@@ -1093,10 +1149,9 @@ document.addEventListener('DOMContentLoaded', function() {
     // =============================================
     
     /**
-     * Load matches for the tournament
-     * @param {number} tournamentId - Tournament ID
+     * Render the tournament's matches from the store
      */
-    function loadMatches(tournamentId) {
+    function renderMatches() {
         const matchesLoading = document.getElementById('matchesLoading');
         const noMatchesMessage = document.getElementById('noMatchesMessage');
         const matchesTable = document.getElementById('matchesTable');
@@ -1105,54 +1160,36 @@ document.addEventListener('DOMContentLoaded', function() {
         
         if (!matchesTableBody || !matchesCardContainer) return;
         
-        // Show loading state
-        matchesLoading.classList.remove('d-none');
+        matchesLoading.classList.add('d-none');
         noMatchesMessage.classList.add('d-none');
         matchesTableBody.innerHTML = '';
         matchesCardContainer.innerHTML = '';
         
-        // Fetch matches
-        fetch(`/api/tournament/${tournamentId}/matches`)
-            .then(response => {
-                if (!response.ok) {
-                    throw new Error('Failed to load matches');
-                }
-                return response.json();
-            })
-            .then(matches => {
-                // Hide loading state
-                matchesLoading.classList.add('d-none');
-                
-                if (matches.length === 0) {
-                    noMatchesMessage.classList.remove('d-none');
-                    matchesTable.classList.add('d-none');
-                    return;
-                }
-                
-                // Show table
-                matchesTable.classList.remove('d-none');
-                
-                // Store all matches
-                allMatches = matches;
-                
-                // Update match filter in stats tab
-                updateMatchFilter(matches);
-                
-                // Render matches in list view
-                matches.forEach(match => {
-                    const row = createMatchRow(match);
-                    matchesTableBody.appendChild(row);
-                    
-                    const card = createMatchCard(match);
-                    matchesCardContainer.appendChild(card);
-                });
-            })
-            .catch(error => {
-                console.error('Error loading matches:', error);
-                matchesLoading.classList.add('d-none');
-                noMatchesMessage.classList.remove('d-none');
-                noMatchesMessage.textContent = 'Error loading matches: ' + error.message;
-            });
+        const matches = matchList();
+        
+        // Store all matches
+        allMatches = matches;
+        
+        // Update match filter in stats tab
+        updateMatchFilter(matches);
+        
+        if (matches.length === 0) {
+            noMatchesMessage.classList.remove('d-none');
+            matchesTable.classList.add('d-none');
+            return;
+        }
+        
+        // Show table
+        matchesTable.classList.remove('d-none');
+        
+        // Render matches in list view
+        matches.forEach(match => {
+            const row = createMatchRow(match);
+            matchesTableBody.appendChild(row);
+            
+            const card = createMatchCard(match);
+            matchesCardContainer.appendChild(card);
+        });
     }
     
     /**
@@ -1317,48 +1354,27 @@ document.addEventListener('DOMContentLoaded', function() {
             modalTitle.textContent = 'Edit Match';
             saveBtn.textContent = 'Update Match';
             
-            // Show loading state
-            saveBtn.disabled = true;
-            saveBtn.innerHTML = '<span class="spinner-border spinner-border-sm me-2" role="status" aria-hidden="true"></span> Loading...';
+            // Populate form from the store
+            const match = store.matches[matchId];
+            document.getElementById('matchId').value = matchId;
+            document.getElementById('matchTeam1').value = match.team1_id;
+            document.getElementById('matchTeam2').value = match.team2_id;
             
-            // Fetch match details
-            fetch(`/api/match/${matchId}`)
-                .then(response => {
-                    if (!response.ok) {
-                        throw new Error('Failed to load match details');
-                    }
-                    return response.json();
-                })
-                .then(match => {
-                    // Populate form
-                    document.getElementById('matchId').value = match.id;
-                    document.getElementById('matchTeam1').value = match.team1_id;
-                    document.getElementById('matchTeam2').value = match.team2_id;
-                    
-                    // Format datetime for input
-                    const matchDate = new Date(match.match_date);
-                    const dateTimeStr = matchDate.toISOString().slice(0, 16);
-                    document.getElementById('matchDate').value = dateTimeStr;
-                    
-                    document.getElementById('matchVenue').value = match.venue_name || '';
-                    
-                    // Handle score
-                    hasScoreCheckbox.checked = match.has_score;
-                    if (match.has_score) {
-                        scoreContainer.classList.remove('d-none');
-                        document.getElementById('team1Score').value = match.team1_score;
-                        document.getElementById('team2Score').value = match.team2_score;
-                    }
-                    
-                    // Reset button state
-                    saveBtn.disabled = false;
-                    saveBtn.textContent = 'Update Match';
-                })
-                .catch(error => {
-                    console.error('Error loading match:', error);
-                    alert('Error loading match: ' + error.message);
-                    matchModal.hide();
-                });
+            // Format datetime for input
+            const matchDate = new Date(match.match_date);
+            const dateTimeStr = matchDate.toISOString().slice(0, 16);
+            document.getElementById('matchDate').value = dateTimeStr;
+            
+            document.getElementById('matchVenue').value = match.venue_name || '';
+            
+            // Handle score
+            const hasScore = match.team1_score !== null;
+            hasScoreCheckbox.checked = hasScore;
+            if (hasScore) {
+                scoreContainer.classList.remove('d-none');
+                document.getElementById('team1Score').value = match.team1_score;
+                document.getElementById('team2Score').value = match.team2_score;
+            }
         } else {
             // Adding new match
             modalTitle.textContent = 'Add Match';
@@ -1467,7 +1483,7 @@ document.addEventListener('DOMContentLoaded', function() {
                 matchModal.hide();
                 
                 // Reload matches
-                loadMatches(currentTournament.id);
+                refreshTournament();
                 
                 // Show success message
                 alert(isEditing ? 'Match updated successfully' : 'Match added successfully');
@@ -1542,115 +1558,84 @@ document.addEventListener('DOMContentLoaded', function() {
         
         if (!statsTableBody) return;
         
-        // Show loading state
-        statsLoading.classList.remove('d-none');
+        statsLoading.classList.add('d-none');
         noStatsMessage.classList.add('d-none');
         statsTableBody.innerHTML = '';
         
-        // Fetch stats
-        fetch(`/api/match/${matchId}/stats`)
-            .then(response => {
-                if (!response.ok) {
-                    if (response.status === 404) {
-                        throw new Error('Match not found. It may have been deleted.');
-                    }
-                    throw new Error('Failed to load statistics');
-                }
-                return response.json();
-            })
-            .then(stats => {
-                // Hide loading state
-                statsLoading.classList.add('d-none');
-                
-                // Get the match to find participating teams and players
-                const match = allMatches.find(m => m.id.toString() === matchId);
-                if (!match) {
-                    noStatsMessage.classList.remove('d-none');
-                    noStatsMessage.textContent = 'Match not found. It may have been deleted.';
-                    return;
-                }
-                
-                // Find teams for this match
-                const team1 = allTeams.find(t => t.id === match.team1_id);
-                const team2 = allTeams.find(t => t.id === match.team2_id);
-                if (!team1 || !team2) {
-                    noStatsMessage.classList.remove('d-none');
-                    noStatsMessage.textContent = 'Teams not found for this match';
-                    return;
-                }
-                
-                // If we have no stats, create empty stats for players in these teams
-                if (stats.length === 0) {
-                    // Need to load all players for these teams
-                    Promise.all([
-                        fetch(`/api/team/${team1.id}/players`).then(res => res.json()),
-                        fetch(`/api/team/${team2.id}/players`).then(res => res.json())
-                    ])
-                        .then(([team1Players, team2Players]) => {
-                            const players = [...team1Players, ...team2Players];
-                            
-                            if (players.length === 0) {
-                                noStatsMessage.classList.remove('d-none');
-                                noStatsMessage.textContent = 'No players found for these teams';
-                                return;
-                            }
-                            
-                            // Filter based on team if selected
-                            const teamFilter = document.getElementById('statTeamFilter').value;
-                            let filteredPlayers = players;
-                            
-                            if (teamFilter !== 'all') {
-                                filteredPlayers = players.filter(p => p.team_id.toString() === teamFilter);
-                            }
-                            
-                            // Render empty stats rows
-                            filteredPlayers.forEach(player => {
-                                const row = createEmptyStatsRow(player, matchId);
-                                statsTableBody.appendChild(row);
-                            });
-                        })
-                        .catch(error => {
-                            console.error('Error loading players for stats:', error);
-                            noStatsMessage.classList.remove('d-none');
-                            noStatsMessage.textContent = 'Error loading players: ' + error.message;
-                        });
-                } else {
-                    // We have stats, display them
-                    
-                    // Filter based on team if selected
-                    const teamFilter = document.getElementById('statTeamFilter').value;
-                    let filteredStats = stats;
-                    
-                    if (teamFilter !== 'all') {
-                        filteredStats = stats.filter(s => s.team_id.toString() === teamFilter);
-                    }
-                    
-                    if (filteredStats.length === 0) {
-                        noStatsMessage.classList.remove('d-none');
-                        noStatsMessage.textContent = 'No statistics found for the selected team';
-                        return;
-                    }
-                    
-                    // Render stats rows
-                    filteredStats.forEach(stat => {
-                        const row = createStatsRow(stat);
-                        statsTableBody.appendChild(row);
-                    });
-                }
-            })
-            .catch(error => {
-                console.error('Error loading statistics:', error);
-                statsLoading.classList.add('d-none');
+        // Get the match to find participating teams and players
+        const match = allMatches.find(m => m.id.toString() === matchId);
+        if (!match) {
+            noStatsMessage.classList.remove('d-none');
+            noStatsMessage.textContent = 'Match not found. It may have been deleted.';
+            return;
+        }
+        
+        // Find teams for this match
+        const team1 = allTeams.find(t => t.id === match.team1_id);
+        const team2 = allTeams.find(t => t.id === match.team2_id);
+        if (!team1 || !team2) {
+            noStatsMessage.classList.remove('d-none');
+            noStatsMessage.textContent = 'Teams not found for this match';
+            return;
+        }
+        
+        const stats = matchStats(matchId);
+        const teamFilter = document.getElementById('statTeamFilter').value;
+        
+        // If we have no stats, create empty stats for players in these teams
+        if (stats.length === 0) {
+            const players = [
+                ...allPlayers.filter(p => p.team_id === team1.id),
+                ...allPlayers.filter(p => p.team_id === team2.id)
+            ];
+            
+            if (players.length === 0) {
+                noStatsMessage.classList.remove('d-none');
+                noStatsMessage.textContent = 'No players found for these teams';
+                return;
+            }
+            
+            // Filter based on team if selected
+            let filteredPlayers = players;
+            
+            if (teamFilter !== 'all') {
+                filteredPlayers = players.filter(p => p.team_id.toString() === teamFilter);
+            }
+            
+            // Render empty stats rows
+            filteredPlayers.forEach(player => {
+                const row = createEmptyStatsRow(player, matchId);
+                statsTableBody.appendChild(row);
+            });
+        } else {
+            // We have stats, display them
+            
+            // Filter based on team if selected
+            let filteredStats = stats;
+            
+            if (teamFilter !== 'all') {
+                filteredStats = stats.filter(s => s.team_id.toString() === teamFilter);
+            }
+            
+            if (filteredStats.length === 0) {
                 noStatsMessage.classList.remove('d-none');
-                noStatsMessage.textContent = 'Error loading statistics: ' + error.message;
+                noStatsMessage.textContent = 'No statistics found for the selected team';
+                return;
+            }
+            
+            // Render stats rows
+            filteredStats.forEach(stat => {
+                const row = createStatsRow(stat);
+                statsTableBody.appendChild(row);
             });
+        }
     }
     
     /**
      * Filter player statistics based on team
      */
     function filterPlayerStats() {
-        // Re-fetch stats with the current match and new team filter
+        // Redraw stats with the current match and new team filter
         const matchId = document.getElementById('statMatchFilter').value;
         if (matchId) {
             loadPlayerStats.call({ value: matchId });
@@ -1664,6 +1649,8 @@ document.addEventListener('DOMContentLoaded', function() {
      */
     function createStatsRow(stat) {
         const row = document.createElement('tr');
+        row.setAttribute('data-player-id', stat.player_id);
+        row.setAttribute('data-stat-id', stat.id);
         
         row.innerHTML = `
             <td>${stat.player_name}</td>
@@ -1712,6 +1699,10 @@ document.addEventListener('DOMContentLoaded', function() {
      */
     function createEmptyStatsRow(player, matchId) {
         const row = document.createElement('tr');
+        row.setAttribute('data-player-id', player.id);
+        
+        // Only rows the user typed into are sent by Save All
+        row.addEventListener('input', () => row.setAttribute('data-edited', 'true'));
         
         row.innerHTML = `
             <td>${player.name}</td>
@@ -1788,7 +1779,7 @@ document.addEventListener('DOMContentLoaded', function() {
             })
             .then(result => {
                 // Reload stats to get calculated fields
-                loadPlayerStats.call({ value: matchId });
+                refreshTournament().then(() => loadPlayerStats.call({ value: matchId }));
                 
                 // Show success indicator briefly
                 button.innerHTML = '<i class="fas fa-check"></i>';
@@ -1807,6 +1798,66 @@ document.addEventListener('DOMContentLoaded', function() {
             });
     }
     
+    /**
+     * Save every row of the stats table with a single request
+     */
+    function saveAllPlayerStats() {
+        const matchId = document.getElementById('statMatchFilter').value;
+        // Existing stat lines and rows the user edited; players who didn't play stay without one
+        const rows = document.querySelectorAll(
+            '#statsTableBody tr[data-stat-id], #statsTableBody tr[data-edited]');
+        if (!matchId || rows.length === 0) return;
+        
+        // Collect the box score
+        const stats = Array.from(rows).map(row => {
+            const statsData = { player_id: parseInt(row.getAttribute('data-player-id')) };
+            row.querySelectorAll('.stat-input').forEach(input => {
+                statsData[input.getAttribute('data-field')] = parseInt(input.value) || 0;
+            });
+            return statsData;
+        });
+        
+        // Show loading state
+        const button = this;
+        const originalHTML = button.innerHTML;
+        button.disabled = true;
+        button.innerHTML = '<span class="spinner-border spinner-border-sm" role="status" aria-hidden="true"></span> Saving...';
+        
+        fetch(`/api/match/${matchId}/stats/bulk`, {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+                'X-CSRFToken': getCsrfToken()
+            },
+            body: JSON.stringify({ stats })
+        })
+            .then(response => response.json().then(result => {
+                if (!response.ok) {
+                    throw new Error(result.error || 'Failed to save statistics');
+                }
+                return result;
+            }))
+            .then(() => {
+                // Reload stats to get calculated fields
+                refreshTournament().then(() => loadPlayerStats.call({ value: matchId }));
+                
+                // Show success indicator briefly
+                button.innerHTML = '<i class="fas fa-check"></i> Saved';
+                setTimeout(() => {
+                    button.disabled = false;
+                    button.innerHTML = originalHTML;
+                }, 1000);
+            })
+            .catch(error => {
+                console.error('Error saving statistics:', error);
+                alert('Error saving statistics: ' + error.message);
+                
+                // Reset button
+                button.disabled = false;
+                button.innerHTML = originalHTML;
+            });
+    }
+    
     /**
      * Update existing player statistics for a match
      * @param {number} playerId - Player ID
@@ -1840,7 +1891,7 @@ document.addEventListener('DOMContentLoaded', function() {
             })
             .then(result => {
                 // Reload stats to get calculated fields
-                loadPlayerStats.call({ value: matchId });
+                refreshTournament().then(() => loadPlayerStats.call({ value: matchId }));
                 
                 // Show success indicator briefly
                 button.innerHTML = '<i class="fas fa-check"></i>';
@@ -15,13 +15,21 @@ document.addEventListener('DOMContentLoaded', function() {
     const selectedFile = document.getElementById('selectedFile');
     const removeFileBtn = document.getElementById('removeFile');
     const uploadProgress = document.getElementById('uploadProgress');
+    const uploadProgressText = document.getElementById('uploadProgressText');
     
     // Step indicators
     const stepItems = document.querySelectorAll('.step-item');
     const stepProgress = document.querySelectorAll('.step-progress');
     
     // Size limits
-    const maxFileSize = 10 * 1024 * 1024; // 10MB
+    // Set by the server (UPLOAD_MAX_SIZE_MB), which rejects larger requests too
+    const maxFileSize = (parseInt(fileUploadArea?.dataset.maxSizeMb) || 10) * 1024 * 1024;
+    
+    // How often to ask the server about a running import, and how long to keep
+    // asking without seeing any progress. The server fails a job that stops
+    // updating after UPLOAD_JOB_TIMEOUT seconds; this is only a backstop
+    const uploadPollInterval = 1000;
+    const uploadPollLimit = ((parseInt(uploadProgress?.dataset.jobTimeout) || 900) + 60) * 1000 / uploadPollInterval;
     
     // Initialize the page with animations if available
     if (typeof initializeAnimations === 'function') {
@@ -109,14 +117,14 @@ document.addEventListener('DOMContentLoaded', function() {
     // Form submission
     if (uploadForm) {
         uploadForm.addEventListener('submit', function(event) {
-            // If the form is already being submitted, let it proceed
+            // The file is sent with fetch below, never by the browser
+            event.preventDefault();
+            
+            // Ignore repeated submits while an upload is in flight
             if (isSubmitting) {
                 return;
             }
             
-            // Prevent the default form submission temporarily
-            event.preventDefault();
-            
             // Validate file size (WTForms handles other validations)
             if (!validateFileSize()) {
                 return false;
@@ -153,8 +161,23 @@ document.addEventListener('DOMContentLoaded', function() {
                 }
             }
             
-            // Complete the upload animation sequence with delay
-            setTimeout(function() {
+            // Set the isSubmitting flag so the form cannot be sent twice
+            isSubmitting = true;
+            
+            // Send the file in the background; the server answers with an import job to follow
+            fetch(uploadForm.action || window.location.href, {
+                method: 'POST',
+                body: new FormData(uploadForm),
+                headers: {
+                    'X-Requested-With': 'XMLHttpRequest'
+                }
+            })
+            .then(response => response.json().then(data => ({ ok: response.ok, data: data })))
+            .then(({ ok, data }) => {
+                if (!ok) {
+                    throw new Error(data.error || 'Upload failed');
+                }
+                
                 // Update step indicators for completion if they exist
                 if (stepItems && stepItems.length > 2) {
                     updateStepStatus(1, 'completed');
@@ -165,50 +188,53 @@ document.addEventListener('DOMContentLoaded', function() {
                     updateProgressBar(1, 'completed');
                 }
                 
-                // Set the isSubmitting flag to true so the event handler won't be triggered again
-                isSubmitting = true;
-                
-                // Create a hidden form and copy all form data to it for submission
-                const hiddenForm = document.createElement('form');
-                hiddenForm.method = uploadForm.method;
-                hiddenForm.action = uploadForm.action;
-                hiddenForm.enctype = uploadForm.enctype;
-                hiddenForm.style.display = 'none';
-                
-                // Copy all form inputs to the hidden form
-                const formData = new FormData(uploadForm);
-                for (const [name, value] of formData.entries()) {
-                    if (name === 'file') {
-                        // Special handling for file input
-                        if (fileInput && fileInput.files.length > 0) {
-                            const newFileInput = document.createElement('input');
-                            newFileInput.type = 'file';
-                            newFileInput.name = 'file';
-                            
-                            // Create a new FileList-like object
-                            const dataTransfer = new DataTransfer();
-                            dataTransfer.items.add(fileInput.files[0]);
-                            newFileInput.files = dataTransfer.files;
-                            
-                            hiddenForm.appendChild(newFileInput);
-                        }
-                    } else {
-                        // For other inputs
-                        const input = document.createElement('input');
-                        input.type = 'hidden';
-                        input.name = name;
-                        input.value = value;
-                        hiddenForm.appendChild(input);
-                    }
+                pollUploadJob(data.status_url);
+            })
+            .catch(error => {
+                showUploadError(error.message);
+            });
+        });
+    }
+    
+    // Poll an upload job until it finishes, then show the result page
+    function pollUploadJob(statusUrl, lastProgress = null, unchangedPolls = 0) {
+        fetch(statusUrl, { headers: { 'Accept': 'application/json' } })
+            .then(response => {
+                if (!response.ok) {
+                    throw new Error('Could not check the upload progress');
+                }
+                return response.json();
+            })
+            .then(job => {
+                // Only large workbooks report progress before they are done
+                const progressText = job.progress > 0 ? `${job.progress}%` : '';
+                if (uploadProgressText) {
+                    uploadProgressText.textContent = progressText;
+                }
+                if (submitButton) {
+                    submitButton.value = `Importing... ${progressText}`.trim();
                 }
                 
-                // Append the hidden form to the body, submit it, and remove it
-                document.body.appendChild(hiddenForm);
-                hiddenForm.submit();
-                document.body.removeChild(hiddenForm);
-                
-            }, 1500); // Delay to show animation
-        });
+                unchangedPolls = job.progress === lastProgress ? unchangedPolls + 1 : 0;
+                if (job.finished || unchangedPolls >= uploadPollLimit) {
+                    // The result page flashes the job's outcome, or that it is still running
+                    window.location.href = job.result_url;
+                } else {
+                    setTimeout(() => pollUploadJob(statusUrl, job.progress, unchangedPolls), uploadPollInterval);
+                }
+            })
+            .catch(error => {
+                showUploadError(error.message);
+            });
+    }
+    
+    // Put the form back into its initial state and show why the upload failed
+    function showUploadError(message) {
+        isSubmitting = false;
+        resetForm();
+        if (fileInput) {
+            showValidationError(fileInput, message);
+        }
     }
     
     // File validation function - check size since WTForms handles type validation
@@ -451,6 +477,9 @@ document.addEventListener('DOMContentLoaded', function() {
         if (uploadProgress) {
             uploadProgress.classList.remove('active');
         }
+        if (uploadProgressText) {
+            uploadProgressText.textContent = '';
+        }
     }
     
     // Scroll to upload form when the upload button is clicked
@@ -476,6 +505,9 @@ document.addEventListener('DOMContentLoaded', function() {
     const noTournamentsMessage = document.getElementById('noTournamentsMessage');
     const loadingSpinner = document.getElementById('loadingSpinner');
     
+    // Tournaments fetched per request; further pages load on demand
+    const tournamentPageSize = 50;
+    
     // Edit tournament modal elements
     const editTournamentModal = document.getElementById('editTournamentModal');
     const editTournamentForm = document.getElementById('editTournamentForm');
@@ -557,10 +589,11 @@ document.addEventListener('DOMContentLoaded', function() {
     }
     
     /**
-     * Load tournaments with optional search filter
+     * Load tournaments with optional search filter, one page at a time
      * @param {string} searchQuery - Optional search query
+     * @param {string} cursor - Position to continue from; omitted for the first page
      */
-    function loadTournaments(searchQuery = '') {
+    function loadTournaments(searchQuery = '', cursor = null) {
         if (!tournamentTableBody) return;
         
         // Show loading spinner
@@ -573,30 +606,40 @@ document.addEventListener('DOMContentLoaded', function() {
             noTournamentsMessage.classList.add('d-none');
         }
         
-        // Clear current table rows
-        tournamentTableBody.innerHTML = '';
+        // Clear current table rows on the first page
+        if (!cursor) {
+            tournamentTableBody.innerHTML = '';
+        }
+        const loadMoreRow = document.getElementById('loadMoreTournamentsRow');
+        if (loadMoreRow) {
+            loadMoreRow.remove();
+        }
         
         // Build API URL
-        let url = '/api/tournaments';
+        const params = new URLSearchParams({ limit: tournamentPageSize });
         if (searchQuery) {
-            url += `?q=${encodeURIComponent(searchQuery)}`;
+            params.set('q', searchQuery);
+        }
+        if (cursor) {
+            params.set('cursor', cursor);
         }
         
         // Fetch tournaments
-        fetch(url)
+        fetch(`/api/tournaments?${params}`)
             .then(response => {
                 if (!response.ok) {
                     throw new Error('Failed to load tournaments');
                 }
-                return response.json();
+                const nextCursor = response.headers.get('X-Next-Cursor');
+                return response.json().then(tournaments => ({ tournaments, nextCursor }));
             })
-            .then(tournaments => {
+            .then(({ tournaments, nextCursor }) => {
                 // Hide loading spinner
                 if (loadingSpinner) {
                     loadingSpinner.classList.add('d-none');
                 }
                 
-                if (tournaments.length === 0) {
+                if (tournaments.length === 0 && !cursor) {
                     // Show no tournaments message
                     if (noTournamentsMessage) {
                         noTournamentsMessage.classList.remove('d-none');
@@ -608,6 +651,23 @@ document.addEventListener('DOMContentLoaded', function() {
                 tournaments.forEach(tournament => {
                     renderTournamentRow(tournament);
                 });
+                
+                // Offer the next page in a final table row
+                if (nextCursor) {
+                    const row = document.createElement('tr');
+                    row.id = 'loadMoreTournamentsRow';
+                    const cell = document.createElement('td');
+                    cell.colSpan = 100;
+                    cell.className = 'text-center';
+                    const button = document.createElement('button');
+                    button.type = 'button';
+                    button.className = 'btn btn-outline-secondary btn-sm';
+                    button.textContent = 'Load more tournaments';
+                    button.addEventListener('click', () => loadTournaments(searchQuery, nextCursor));
+                    cell.appendChild(button);
+                    row.appendChild(cell);
+                    tournamentTableBody.appendChild(row);
+                }
             })
             .catch(error => {
                 console.error('Error loading tournaments:', error);
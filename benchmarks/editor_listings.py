@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+# benchmarks/editor_listings.py
+# Times the editor's player and match listings for tournaments of growing size
+# (in a league of other tournaments): the whole unpaginated list against the
+# first ?limit=50 page, sorted by name, and a first page filtered to one team.
+#
+# Usage: python -m benchmarks.editor_listings [--players N ...] [--repeat N]
+
+import argparse
+import importlib.util
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import create_engine, insert
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+
+from app.models.models import db, Tournament, Team, Player, Match
+from benchmarks.query_plans import populate, PLAYERS_PER_TEAM
+
+BACKGROUND_TOURNAMENTS = 40
+POSITIONS = ['PG', 'SG', 'SF', 'PF', 'C']
+
+
+def add_tournament(conn, tournament_id, players):
+    """A tournament of the given size owned by user 1; returns one of its team ids"""
+    conn.execute(insert(Tournament), [{'id': tournament_id, 'name': f'Big League {players}', 'year': 2025,
+                                       'start_date': date(2025, 1, 1), 'end_date': date(2025, 6, 1),
+                                       'creator_id': 1}])
+    first_team = conn.execute(Team.__table__.select().order_by(Team.id.desc()).limit(1)).first().id + 1
+    team_ids = list(range(first_team, first_team + players // PLAYERS_PER_TEAM))
+    first_player = conn.execute(Player.__table__.select().order_by(Player.id.desc()).limit(1)).first().id + 1
+    conn.execute(insert(Team), [{'id': team_id, 'name': f'Team {team_id}', 'creator_id': 1,
+                                 'tournament_id': tournament_id} for team_id in team_ids])
+    conn.execute(insert(Player), [
+        {'id': first_player + i, 'name': f'Player {(i * 7919) % players:05d}', 'position': POSITIONS[i % 5],
+         'jersey_number': i % 100, 'team_id': team_ids[i % len(team_ids)], 'creator_id': 1}
+        for i in range(len(team_ids) * PLAYERS_PER_TEAM)
+    ])
+    conn.execute(insert(Match), [
+        {'tournament_id': tournament_id, 'team1_id': team_ids[i % len(team_ids)],
+         'team2_id': team_ids[(i + 1) % len(team_ids)], 'match_date': datetime(2025, 1, 1) + timedelta(hours=i),
+         'creator_id': 1}
+        for i in range(len(team_ids) * 4)
+    ])
+    return team_ids[0]
+
+
+def timed(client, url, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        response = client.get(url)
+        samples.append(time.perf_counter() - start)
+        assert response.status_code == 200, (url, response.status_code)
+    return statistics.median(samples) * 1000, len(response.get_json())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--players', type=int, nargs='+', default=[500, 2000, 8000])
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix='editor-listings-')
+    try:
+        path = os.path.join(workdir, 'listings.db')
+        engine = create_engine(f'sqlite:///{path}')
+        sizes = {}
+        with engine.begin() as conn:
+            db.metadata.create_all(conn)
+            populate(conn, BACKGROUND_TOURNAMENTS)
+            for i, players in enumerate(args.players):
+                tournament_id = BACKGROUND_TOURNAMENTS + i + 1
+                sizes[players] = (tournament_id, add_tournament(conn, tournament_id, players))
+        engine.dispose()
+
+        os.environ.update(TEST_DATABASE_URL=f'sqlite:///{path}', AUTO_CREATE_DB='false', CLEANUP_PYCACHE='false')
+        spec = importlib.util.spec_from_file_location('app_module', os.path.join(ROOT, 'app.py'))
+        app_module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(app_module)
+        app = app_module.create_app('testing')
+        client = app.test_client()
+        with client.session_transaction() as session:
+            session['_user_id'] = '1'
+            session['_fresh'] = True
+
+        print(f'{BACKGROUND_TOURNAMENTS} other tournaments, median of {args.repeat} requests\n')
+        print(f'{"players":>8}  {"all players":>14}  {"first page":>14}  {"team page":>14}  {"match page":>14}')
+        for players, (tournament_id, team_id) in sizes.items():
+            base = f'/api/tournament/{tournament_id}'
+            cells = [
+                timed(client, f'{base}/players', args.repeat),
+                timed(client, f'{base}/players?limit=50&sort=name', args.repeat),
+                timed(client, f'{base}/players?limit=50&sort=jersey&team_id={team_id}', args.repeat),
+                timed(client, f'{base}/matches?limit=50&played=false', args.repeat),
+            ]
+            print(f'{players:8d}  ' + '  '.join(f'{ms:7.2f}ms {rows:4d}' for ms, rows in cells))
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+# benchmarks/query_plans.py
+# Shows the SQLite query plans and timings of the hot foreign-key lookups
+# with and without the indexes added in migration 8e4b2d6f1a73.
+#
+# Usage: python -m benchmarks.query_plans [--tournaments N] [--repeat N]
+
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import create_engine, select, insert, text
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.models.models import (
+    db, User, Tournament, TournamentAccess, Team, Player, Match, MatchScore, PlayerStats
+)
+
+TEAMS_PER_TOURNAMENT = 10
+PLAYERS_PER_TEAM = 12
+MATCHES_PER_TOURNAMENT = 45
+
+
+def populate(conn, tournaments):
+    """Fill the schema with a synthetic multi-tournament league"""
+    rng = random.Random(5505)
+    conn.execute(insert(User), [
+        {'id': uid, 'full_name': f'User {uid}', 'username': f'user{uid}',
+         'email': f'user{uid}@example.com', 'password_hash': 'x'}
+        for uid in range(1, 51)
+    ])
+    conn.execute(insert(Tournament), [
+        {'id': tid, 'name': f'League {tid}', 'year': 2000 + tid % 25,
+         'start_date': date(2024, 1, 1), 'end_date': date(2024, 6, 1), 'creator_id': 1 + tid % 50}
+        for tid in range(1, tournaments + 1)
+    ])
+    conn.execute(insert(TournamentAccess), [
+        {'tournament_id': tid, 'user_id': uid}
+        for tid in range(1, tournaments + 1)
+        for uid in rng.sample(range(1, 51), 3)
+    ])
+
+    teams, players, matches, scores, stats = [], [], [], [], []
+    for tid in range(1, tournaments + 1):
+        team_ids = [len(teams) + i + 1 for i in range(TEAMS_PER_TOURNAMENT)]
+        for team_id in team_ids:
+            teams.append({'id': team_id, 'name': f'Team {team_id}', 'creator_id': 1, 'tournament_id': tid})
+            for _ in range(PLAYERS_PER_TEAM):
+                players.append({'id': len(players) + 1, 'name': f'Player {len(players) + 1}', 'position': 'PG',
+                                'jersey_number': rng.randint(0, 99), 'team_id': team_id, 'creator_id': 1})
+        for _ in range(MATCHES_PER_TOURNAMENT):
+            match_id = len(matches) + 1
+            team1_id, team2_id = rng.sample(team_ids, 2)
+            matches.append({'id': match_id, 'tournament_id': tid, 'team1_id': team1_id, 'team2_id': team2_id,
+                            'match_date': datetime(2024, 1, 1) + timedelta(days=rng.randint(0, 150)),
+                            'creator_id': 1})
+            scores.append({'match_id': match_id, 'team1_score': rng.randint(60, 120),
+                           'team2_score': rng.randint(60, 120)})
+            for team_id in (team1_id, team2_id):
+                first_player = (team_id - 1) * PLAYERS_PER_TEAM + 1
+                for player_id in range(first_player, first_player + PLAYERS_PER_TEAM):
+                    stats.append({'match_id': match_id, 'player_id': player_id,
+                                  'points': rng.randint(0, 40), 'rebounds': rng.randint(0, 15),
+                                  'assists': rng.randint(0, 12)})
+
+    for model, rows in ((Team, teams), (Player, players), (Match, matches),
+                        (MatchScore, scores), (PlayerStats, stats)):
+        conn.execute(insert(model), rows)
+    return len(stats)
+
+
+def hot_queries(tournaments):
+    """The lookups the routes run on every request, with mid-range parameters"""
+    tid = tournaments // 2
+    team_id = tid * TEAMS_PER_TOURNAMENT
+    player_id = team_id * PLAYERS_PER_TEAM
+    match_id = tid * MATCHES_PER_TOURNAMENT
+    return [
+        ('Team.tournament_id', select(Team).where(Team.tournament_id == tid)),
+        ('Player.team_id', select(Player).where(Player.team_id == team_id)),
+        ('Match.tournament_id', select(Match).where(Match.tournament_id == tid).order_by(Match.match_date)),
+        ('Match.team1_id/team2_id', select(Match.id).where((Match.team1_id == team_id) | (Match.team2_id == team_id))),
+        ('PlayerStats.match_id', select(PlayerStats).where(PlayerStats.match_id == match_id)),
+        ('PlayerStats.player_id', select(PlayerStats).where(PlayerStats.player_id == player_id)),
+        ('PlayerStats(match, player)', select(PlayerStats).where(PlayerStats.match_id == match_id,
+                                                                 PlayerStats.player_id == player_id)),
+        ('TournamentAccess(t, user)', select(TournamentAccess).where(TournamentAccess.tournament_id == tid,
+                                                                     TournamentAccess.user_id == 7)),
+        ('TournamentAccess.user_id', select(TournamentAccess.tournament_id).where(TournamentAccess.user_id == 7)),
+    ]
+
+
+def measure(conn, queries, repeat):
+    results = []
+    for label, query in queries:
+        compiled = query.compile(conn, compile_kwargs={'literal_binds': True})
+        plan = conn.execute(text(f'EXPLAIN QUERY PLAN {compiled}')).all()
+        start = time.perf_counter()
+        for _ in range(repeat):
+            conn.execute(query).all()
+        elapsed_ms = (time.perf_counter() - start) * 1000 / repeat
+        results.append((label, ' | '.join(row[-1] for row in plan), elapsed_ms))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--tournaments', type=int, default=40)
+    parser.add_argument('--repeat', type=int, default=50)
+    args = parser.parse_args()
+
+    engine = create_engine('sqlite://')
+    indexes = [index for table in db.metadata.sorted_tables for index in table.indexes]
+
+    with engine.begin() as conn:
+        db.metadata.create_all(conn)
+        # Start from the pre-migration schema
+        for index in indexes:
+            index.drop(conn)
+        stat_rows = populate(conn, args.tournaments)
+
+        print(f'{args.tournaments} tournaments, {stat_rows} player stat rows, {args.repeat} runs per query\n')
+        queries = hot_queries(args.tournaments)
+        before = measure(conn, queries, args.repeat)
+
+        for index in indexes:
+            index.create(conn)
+        conn.execute(text('ANALYZE'))
+        after = measure(conn, queries, args.repeat)
+
+    for (label, plan_before, ms_before), (_, plan_after, ms_after) in zip(before, after):
+        print(label)
+        print(f'  before: {ms_before:8.3f} ms  {plan_before}')
+        print(f'  after:  {ms_after:8.3f} ms  {plan_after}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+# benchmarks/sqlite_concurrency.py
+# Runs editor-style writers and dashboard-style readers against one SQLite
+# file at the same time, once with the default connection profile and once
+# with ProductionConfig.SQLITE_PRAGMAS, and reports throughput, latency and
+# "database is locked" failures for each.
+#
+# Usage: python -m benchmarks.sqlite_concurrency [--tournaments N] [--readers N] [--writers N] [--seconds N]
+
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import threading
+import time
+
+from sqlalchemy import create_engine, func, select, update
+from sqlalchemy.exc import OperationalError
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.models.database import configure_sqlite
+from app.models.models import db, Tournament, Match, PlayerStats
+from benchmarks.query_plans import populate, MATCHES_PER_TOURNAMENT, PLAYERS_PER_TEAM
+from config import Config, ProductionConfig
+
+PROFILES = [
+    ('default', Config.SQLITE_PRAGMAS),
+    ('production', ProductionConfig.SQLITE_PRAGMAS),
+]
+
+
+def read_once(conn, rng, tournaments):
+    """Per-player totals for one tournament, like the visualisation endpoints"""
+    tid = rng.randint(1, tournaments)
+    conn.execute(
+        select(PlayerStats.player_id, func.sum(PlayerStats.points), func.sum(PlayerStats.rebounds))
+        .join(Match, Match.id == PlayerStats.match_id)
+        .where(Match.tournament_id == tid)
+        .group_by(PlayerStats.player_id)
+    ).all()
+
+
+def write_once(conn, rng, tournaments):
+    """One box-score correction and its data version bump, like the editor"""
+    tid = rng.randint(1, tournaments)
+    match_id = (tid - 1) * MATCHES_PER_TOURNAMENT + rng.randint(1, MATCHES_PER_TOURNAMENT)
+    with conn.begin():
+        conn.execute(update(PlayerStats).where(PlayerStats.match_id == match_id)
+                     .values(points=rng.randint(0, 40)))
+        conn.execute(update(Tournament).where(Tournament.id == tid)
+                     .values(data_version=Tournament.data_version + 1))
+
+
+def worker(engine, operation, tournaments, deadline, results, seed):
+    rng = random.Random(seed)
+    latencies, locked = [], 0
+    with engine.connect() as conn:
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            try:
+                operation(conn, rng, tournaments)
+                if conn.in_transaction():
+                    conn.rollback()
+                latencies.append(time.perf_counter() - start)
+            except OperationalError as e:
+                if conn.in_transaction():
+                    conn.rollback()
+                if 'locked' not in str(e):
+                    raise
+                locked += 1
+    results.append((latencies, locked))
+
+
+def summarize(results, seconds):
+    latencies = sorted(latency for thread_latencies, _ in results for latency in thread_latencies)
+    locked = sum(count for _, count in results)
+    if not latencies:
+        return f'{0:9.1f} ops/s  {"-":>9}  {"-":>9}  {locked:6d} locked'
+    p50 = latencies[len(latencies) // 2] * 1000
+    p95 = latencies[int(len(latencies) * 0.95)] * 1000
+    return f'{len(latencies) / seconds:9.1f} ops/s  {p50:7.2f}ms  {p95:7.2f}ms  {locked:6d} locked'
+
+
+def run_profile(path, pragmas, args):
+    engine = create_engine(f'sqlite:///{path}', pool_size=args.readers + args.writers)
+    configure_sqlite(engine, pragmas)
+    with engine.begin() as conn:
+        db.metadata.create_all(conn)
+        populate(conn, args.tournaments)
+
+    readers, writers = [], []
+    deadline = time.perf_counter() + args.seconds
+    threads = [threading.Thread(target=worker, args=(engine, read_once, args.tournaments, deadline, readers, i))
+               for i in range(args.readers)]
+    threads += [threading.Thread(target=worker, args=(engine, write_once, args.tournaments, deadline, writers, -i))
+                for i in range(1, args.writers + 1)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    engine.dispose()
+    return summarize(readers, args.seconds), summarize(writers, args.seconds)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--tournaments', type=int, default=10)
+    parser.add_argument('--readers', type=int, default=4)
+    parser.add_argument('--writers', type=int, default=2)
+    parser.add_argument('--seconds', type=float, default=5)
+    args = parser.parse_args()
+
+    stat_rows = args.tournaments * MATCHES_PER_TOURNAMENT * 2 * PLAYERS_PER_TEAM
+    print(f'{args.tournaments} tournaments, {stat_rows} player stat rows, '
+          f'{args.readers} readers and {args.writers} writers for {args.seconds:g}s\n')
+
+    workdir = tempfile.mkdtemp(prefix='sqlite-concurrency-')
+    try:
+        for name, pragmas in PROFILES:
+            read_summary, write_summary = run_profile(os.path.join(workdir, f'{name}.db'), pragmas, args)
+            print(name)
+            print(f'  reads:  {read_summary}')
+            print(f'  writes: {write_summary}')
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+# benchmarks/startup_time.py
+# Times how long a fresh process takes to import app.py (which builds the app)
+# under the development and production configurations. "cold" runs start with
+# no __pycache__ in the project; "warm" runs reuse whatever the previous run
+# left behind, which is nothing when CLEANUP_PYCACHE sweeps it on exit.
+#
+# Usage: python -m benchmarks.startup_time [--runs N]
+
+import argparse
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+BOOT = (
+    "import importlib.util, os\n"
+    "spec = importlib.util.spec_from_file_location('app_module', os.path.join(os.getcwd(), 'app.py'))\n"
+    "spec.loader.exec_module(importlib.util.module_from_spec(spec))\n"
+)
+
+
+def sweep_pycache():
+    for root, dirs, _ in os.walk(ROOT):
+        dirs[:] = [d for d in dirs if d not in ('.git', 'venv', '.venv')]
+        if '__pycache__' in dirs:
+            shutil.rmtree(os.path.join(root, '__pycache__'))
+            dirs.remove('__pycache__')
+
+
+def boot(env):
+    start = time.perf_counter()
+    subprocess.run([sys.executable, '-c', BOOT], cwd=ROOT, env=env, check=True,
+                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--runs', type=int, default=5)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix='startup-time-')
+    try:
+        base_env = dict(os.environ, DATABASE_URL=f'sqlite:///{os.path.join(workdir, "startup.db")}')
+        # Create and seed the database once so no timed run pays for it
+        subprocess.run([sys.executable, 'manage.py', 'seed'], cwd=ROOT, env=base_env, check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+        print(f'{args.runs} runs per measurement, median wall time of a process that builds the app\n')
+        for config_name in ('development', 'production'):
+            env = dict(base_env, FLASK_CONFIG=config_name)
+            cold, warm = [], []
+            for _ in range(args.runs):
+                sweep_pycache()
+                cold.append(boot(env))
+                warm.append(boot(env))
+            print(f'{config_name:12s} cold {statistics.median(cold) * 1000:8.1f} ms   '
+                  f'warm {statistics.median(warm) * 1000:8.1f} ms')
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,11 +1,87 @@
 import os
 
+def database_url(name, default):
+    """Database URL from the environment; accepts the postgres:// scheme some hosts hand out"""
+    url = os.environ.get(name) or default
+    if url.startswith('postgres://'):
+        url = 'postgresql://' + url[len('postgres://'):]
+    return url
+
+def engine_options(url):
+    """Connection pool settings for a database URL.
+
+    In-memory SQLite runs on a single shared connection and takes no pool
+    settings. Server databases also check connections before use and recycle
+    them, so restarts and idle timeouts on the server side do not surface as
+    request errors.
+    """
+    if url in ('sqlite://', 'sqlite:///:memory:'):
+        return {}
+    options = {
+        'pool_size': int(os.environ.get('DB_POOL_SIZE', 10)),
+        'max_overflow': int(os.environ.get('DB_MAX_OVERFLOW', 5)),
+        'pool_timeout': int(os.environ.get('DB_POOL_TIMEOUT', 30))
+    }
+    if not url.startswith('sqlite'):
+        options['pool_pre_ping'] = os.environ.get('DB_POOL_PRE_PING', 'true').lower() in ('1', 'true', 'yes')
+        options['pool_recycle'] = int(os.environ.get('DB_POOL_RECYCLE', 1800))
+    return options
+
 class Config:
     SECRET_KEY = os.environ.get('SECRET_KEY') or 'default-dev-key-change-in-production'
-    SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL') or f'sqlite:///{os.path.abspath("db/cits5505.db")}'
+    SQLALCHEMY_DATABASE_URI = database_url('DATABASE_URL', f'sqlite:///{os.path.abspath("db/cits5505.db")}')
+    # Connections kept open per process; size to the number of worker threads
+    SQLALCHEMY_ENGINE_OPTIONS = engine_options(SQLALCHEMY_DATABASE_URI)
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     DEBUG = True
     USE_RELOADER = True
+    # Maximum number of /api/tournament_data payloads kept in memory per worker
+    ANALYTICS_CACHE_SIZE = int(os.environ.get('ANALYTICS_CACHE_SIZE', 256))
+    # Tournaments whose column frames (see app/services/analytics.py) are kept per worker
+    ANALYTICS_FRAMES_CACHE_SIZE = int(os.environ.get('ANALYTICS_FRAMES_CACHE_SIZE', 64))
+    # Rendered home page fragments (per season) and, when INDEX_PAGE_CACHE is set,
+    # whole home pages for anonymous visitors. Entries are dropped as soon as any
+    # tournament data changes, and after PAGE_CACHE_TTL seconds so upcoming
+    # matches roll over
+    PAGE_CACHE_SIZE = int(os.environ.get('PAGE_CACHE_SIZE', 64))
+    PAGE_CACHE_TTL = int(os.environ.get('PAGE_CACHE_TTL', 60))
+    INDEX_PAGE_CACHE = os.environ.get('INDEX_PAGE_CACHE', '').lower() in ('1', 'true', 'yes')
+    # Largest workbook the upload page accepts; the request body limit adds
+    # room for the rest of the multipart form
+    UPLOAD_MAX_SIZE_MB = int(os.environ.get('UPLOAD_MAX_SIZE_MB', 10))
+    MAX_CONTENT_LENGTH = UPLOAD_MAX_SIZE_MB * 1024 * 1024 + 64 * 1024
+    # Uploaded workbooks above this size (bytes) are imported in streaming mode,
+    # committing the Player Stats sheet IMPORT_CHUNK_SIZE rows at a time. Kept
+    # well under UPLOAD_MAX_SIZE_MB: an xlsx expands many times when parsed
+    IMPORT_STREAMING_THRESHOLD = int(os.environ.get('IMPORT_STREAMING_THRESHOLD', 4 * 1024 * 1024))
+    IMPORT_CHUNK_SIZE = int(os.environ.get('IMPORT_CHUNK_SIZE', 5000))
+    # Background tournament upload jobs: worker threads per process, where
+    # uploaded workbooks wait for them (None = system temp directory), and the
+    # seconds an unfinished job may go without an update before it is taken to
+    # have died with its process and is marked failed
+    UPLOAD_WORKERS = int(os.environ.get('UPLOAD_WORKERS', 2))
+    UPLOAD_JOB_DIR = os.environ.get('UPLOAD_JOB_DIR')
+    UPLOAD_JOB_TIMEOUT = int(os.environ.get('UPLOAD_JOB_TIMEOUT', 15 * 60))
+    # Largest ?limit= accepted by the paginated JSON listings
+    MAX_PAGE_SIZE = int(os.environ.get('MAX_PAGE_SIZE', 200))
+    # Static downloads (the upload template): seconds a copy fetched without the
+    # ?v= content version may be reused before revalidating. Behind a proxy, set
+    # USE_X_SENDFILE (Apache/lighttpd) or X_ACCEL_REDIRECT_PREFIX (an nginx
+    # internal location aliased to app/static) so the proxy sends the bytes
+    STATIC_DOWNLOAD_MAX_AGE = int(os.environ.get('STATIC_DOWNLOAD_MAX_AGE', 3600))
+    USE_X_SENDFILE = os.environ.get('USE_X_SENDFILE', '').lower() in ('1', 'true', 'yes')
+    X_ACCEL_REDIRECT_PREFIX = os.environ.get('X_ACCEL_REDIRECT_PREFIX')
+    # Point url_for('static') at the content-hashed copies built by
+    # `python manage.py assets`. Off in development so edited scripts show up
+    # without a rebuild
+    FINGERPRINT_ASSETS = os.environ.get('FINGERPRINT_ASSETS', '').lower() in ('1', 'true', 'yes')
+    # Create missing tables and seed an empty database on every app start, and
+    # delete __pycache__ directories on exit. Convenient in development; production
+    # boots skip both (see ProductionConfig)
+    AUTO_CREATE_DB = os.environ.get('AUTO_CREATE_DB', 'true').lower() in ('1', 'true', 'yes')
+    CLEANUP_PYCACHE = os.environ.get('CLEANUP_PYCACHE', 'true').lower() in ('1', 'true', 'yes')
+    # PRAGMAs run on every new SQLite connection (see configure_sqlite)
+    SQLITE_PRAGMAS = {'foreign_keys': 'ON'}
 
 class DevelopmentConfig(Config):
     DEBUG = True
@@ -15,13 +91,16 @@ class DevelopmentConfig(Config):
 class TestingConfig(Config):
     TESTING = True
     DEBUG = True
-    SQLALCHEMY_DATABASE_URI = 'sqlite:///:memory:'
+    # Set TEST_DATABASE_URL to run the tests against another database, e.g. PostgreSQL
+    SQLALCHEMY_DATABASE_URI = database_url('TEST_DATABASE_URL', 'sqlite:///:memory:')
+    SQLALCHEMY_ENGINE_OPTIONS = engine_options(SQLALCHEMY_DATABASE_URI)
     WTF_CSRF_ENABLED = False
     
 class SeleniumTestingConfig(Config):
     TESTING = True
     DEBUG = True
-    SQLALCHEMY_DATABASE_URI = os.environ.get('TEST_DATABASE_URL') or f'sqlite:///{os.path.abspath("tests/testapp.db")}'
+    SQLALCHEMY_DATABASE_URI = database_url('TEST_DATABASE_URL', f'sqlite:///{os.path.abspath("tests/testapp.db")}')
+    SQLALCHEMY_ENGINE_OPTIONS = engine_options(SQLALCHEMY_DATABASE_URI)
     WTF_CSRF_ENABLED = False
     SERVER_NAME = 'localhost:5000'
     
@@ -31,6 +110,23 @@ class ProductionConfig(Config):
     FLASK_ENV = 'production'
     SESSION_COOKIE_SECURE = True
     SESSION_COOKIE_HTTPONLY = True
+    # Schema and seed data come from `python manage.py createdb` / `upgrade`, not
+    # every worker boot, and bytecode caches survive restarts
+    AUTO_CREATE_DB = os.environ.get('AUTO_CREATE_DB', 'false').lower() in ('1', 'true', 'yes')
+    CLEANUP_PYCACHE = os.environ.get('CLEANUP_PYCACHE', 'false').lower() in ('1', 'true', 'yes')
+    FINGERPRINT_ASSETS = os.environ.get('FINGERPRINT_ASSETS', 'true').lower() in ('1', 'true', 'yes')
+    # WAL lets dashboard reads run alongside an editor write instead of queueing
+    # behind it, and writers wait busy_timeout ms for the lock rather than failing
+    # with "database is locked". NORMAL sync is durable across app crashes in WAL
+    # mode. cache_size is in KiB when negative.
+    SQLITE_PRAGMAS = {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'busy_timeout': int(os.environ.get('SQLITE_BUSY_TIMEOUT', 5000)),
+        'cache_size': -int(os.environ.get('SQLITE_CACHE_KB', 20000)),
+        'mmap_size': int(os.environ.get('SQLITE_MMAP_SIZE', 256 * 1024 * 1024)),
+        'foreign_keys': 'ON'
+    }
 
 config = {
     'development': DevelopmentConfig,
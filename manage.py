@@ -6,11 +6,13 @@ from importlib.machinery import SourceFileLoader
 app_module = SourceFileLoader("app_module", 
                             os.path.join(os.path.dirname(__file__), "app.py")).load_module()
  
-# Get the create_app function
+# Get the create_app and init_database functions
 create_app = app_module.create_app
+init_database = app_module.init_database
  
 # Import database
 from app.models.database import db
+from app.services.assets import build_assets
  
 # Create the app
 app = create_app(os.environ.get('FLASK_CONFIG') or 'default')
@@ -28,6 +30,9 @@ def print_usage():
     print("  python manage.py history       - Show migration history")
     print("  python manage.py current       - Show current migration")
     print("  python manage.py all           - Run init, migrate, and upgrade")
+    print("  python manage.py createdb      - Create missing tables (production boots skip this)")
+    print("  python manage.py seed          - Create missing tables and seed an empty database")
+    print("  python manage.py assets        - Fingerprint and precompress static CSS/JS into app/static/dist")
     print("  python manage.py message \"Your message\" - Create migration with custom message\n")
  
 if __name__ == "__main__":
@@ -69,6 +74,15 @@ if __name__ == "__main__":
                 migrate(directory="migrations", message=message)
                 upgrade(directory="migrations")
                 print("✅ All migration steps completed!")
+            elif command == "createdb":
+                init_database(seed=False)
+                print("✅ Database tables ready!")
+            elif command == "seed":
+                init_database()
+                print("✅ Database ready!")
+            elif command == "assets":
+                manifest = build_assets(app.static_folder)
+                print(f"✅ Built {len(manifest)} static assets!")
             else:
                 print_usage()
         except Exception as e:
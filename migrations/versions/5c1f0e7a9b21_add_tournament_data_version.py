@@ -0,0 +1,26 @@
+"""Add tournament data version
+
+Revision ID: 5c1f0e7a9b21
+Revises: 091d8ece6b36
+Create Date: 2026-10-17 09:12:44.518203
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5c1f0e7a9b21'
+down_revision = '091d8ece6b36'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('tournament', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('data_version', sa.Integer(), nullable=False, server_default='0'))
+
+
+def downgrade():
+    with op.batch_alter_table('tournament', schema=None) as batch_op:
+        batch_op.drop_column('data_version')
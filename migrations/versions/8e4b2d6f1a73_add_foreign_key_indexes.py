@@ -0,0 +1,50 @@
+"""Add foreign key indexes and unique composites
+
+Revision ID: 8e4b2d6f1a73
+Revises: 5c1f0e7a9b21
+Create Date: 2026-10-17 10:03:27.904116
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8e4b2d6f1a73'
+down_revision = '5c1f0e7a9b21'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Drop duplicate rows (keeping the newest) so the unique indexes can be built
+    op.execute(
+        'DELETE FROM player_stats WHERE id NOT IN '
+        '(SELECT MAX(id) FROM player_stats GROUP BY match_id, player_id)'
+    )
+    op.execute(
+        'DELETE FROM tournament_access WHERE id NOT IN '
+        '(SELECT MAX(id) FROM tournament_access GROUP BY tournament_id, user_id)'
+    )
+
+    op.create_index('ix_team_tournament_id', 'team', ['tournament_id'], unique=False)
+    op.create_index('ix_player_team_id', 'player', ['team_id'], unique=False)
+    op.create_index('ix_match_tournament_id', 'match', ['tournament_id'], unique=False)
+    op.create_index('ix_match_team1_id', 'match', ['team1_id'], unique=False)
+    op.create_index('ix_match_team2_id', 'match', ['team2_id'], unique=False)
+    op.create_index('ix_player_stats_player_id', 'player_stats', ['player_id'], unique=False)
+    op.create_index('uq_player_stats_match_player', 'player_stats', ['match_id', 'player_id'], unique=True)
+    op.create_index('ix_tournament_access_user_id', 'tournament_access', ['user_id'], unique=False)
+    op.create_index('uq_tournament_access_tournament_user', 'tournament_access', ['tournament_id', 'user_id'], unique=True)
+
+
+def downgrade():
+    op.drop_index('uq_tournament_access_tournament_user', table_name='tournament_access')
+    op.drop_index('ix_tournament_access_user_id', table_name='tournament_access')
+    op.drop_index('uq_player_stats_match_player', table_name='player_stats')
+    op.drop_index('ix_player_stats_player_id', table_name='player_stats')
+    op.drop_index('ix_match_team2_id', table_name='match')
+    op.drop_index('ix_match_team1_id', table_name='match')
+    op.drop_index('ix_match_tournament_id', table_name='match')
+    op.drop_index('ix_player_team_id', table_name='player')
+    op.drop_index('ix_team_tournament_id', table_name='team')
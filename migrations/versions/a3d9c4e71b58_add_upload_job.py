@@ -0,0 +1,39 @@
+"""Add upload job table
+
+Revision ID: a3d9c4e71b58
+Revises: 8e4b2d6f1a73
+Create Date: 2026-10-17 14:05:19.302871
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a3d9c4e71b58'
+down_revision = '8e4b2d6f1a73'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('upload_job',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('filename', sa.String(length=255), nullable=False),
+        sa.Column('status', sa.String(length=20), nullable=False),
+        sa.Column('progress', sa.Integer(), nullable=False),
+        sa.Column('message', sa.Text(), nullable=True),
+        sa.Column('tournament_id', sa.Integer(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['tournament_id'], ['tournament.id'], ),
+        sa.ForeignKeyConstraint(['user_id'], ['user.id'], ),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_upload_job_user_id', 'upload_job', ['user_id'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_upload_job_user_id', table_name='upload_job')
+    op.drop_table('upload_job')
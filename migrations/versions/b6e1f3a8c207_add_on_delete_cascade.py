@@ -0,0 +1,62 @@
+"""Add ON DELETE CASCADE to tournament data foreign keys
+
+Revision ID: b6e1f3a8c207
+Revises: f2b8c6d4a915
+Create Date: 2026-10-17 18:12:07.418260
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b6e1f3a8c207'
+down_revision = 'f2b8c6d4a915'
+branch_labels = None
+depends_on = None
+
+# SQLite foreign keys are unnamed; batch mode names them with this convention
+# so they can be dropped and recreated while the table is rebuilt
+NAMING_CONVENTION = {'fk': 'fk_%(table_name)s_%(column_0_name)s_%(referred_table_name)s'}
+
+# table -> [(column, referred table, ON DELETE action)]
+FOREIGN_KEYS = {
+    'tournament_access': [('tournament_id', 'tournament', 'CASCADE')],
+    'team': [('tournament_id', 'tournament', 'CASCADE')],
+    'player': [('team_id', 'team', 'CASCADE')],
+    'match': [('tournament_id', 'tournament', 'CASCADE'),
+              ('team1_id', 'team', 'CASCADE'),
+              ('team2_id', 'team', 'CASCADE')],
+    'match_score': [('match_id', 'match', 'CASCADE')],
+    'player_stats': [('match_id', 'match', 'CASCADE'),
+                     ('player_id', 'player', 'CASCADE')],
+    'upload_job': [('tournament_id', 'tournament', 'SET NULL')],
+}
+
+
+def _foreign_key_names(table):
+    """Existing constraint name per column, falling back to the batch naming convention"""
+    names = {}
+    for fk in sa.inspect(op.get_bind()).get_foreign_keys(table):
+        column = fk['constrained_columns'][0]
+        names[column] = fk['name'] or NAMING_CONVENTION['fk'] % {
+            'table_name': table, 'column_0_name': column, 'referred_table_name': fk['referred_table']}
+    return names
+
+
+def _replace_foreign_keys(cascade):
+    for table, foreign_keys in FOREIGN_KEYS.items():
+        names = _foreign_key_names(table)
+        with op.batch_alter_table(table, naming_convention=NAMING_CONVENTION) as batch_op:
+            for column, referred, ondelete in foreign_keys:
+                batch_op.drop_constraint(names[column], type_='foreignkey')
+                batch_op.create_foreign_key(names[column], referred, [column], ['id'],
+                                            ondelete=ondelete if cascade else None)
+
+
+def upgrade():
+    _replace_foreign_keys(cascade=True)
+
+
+def downgrade():
+    _replace_foreign_keys(cascade=False)
@@ -0,0 +1,48 @@
+"""Widen password hashes and add PostgreSQL trigram search indexes
+
+Revision ID: c4a7e2d9f318
+Revises: b6e1f3a8c207
+Create Date: 2026-10-17 19:26:51.730964
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c4a7e2d9f318'
+down_revision = 'b6e1f3a8c207'
+branch_labels = None
+depends_on = None
+
+# (index, table, column) for the ILIKE '%q%' searches
+TRIGRAM_INDEXES = [
+    ('ix_user_username_trgm', 'user', 'username'),
+    ('ix_user_email_trgm', 'user', 'email'),
+    ('ix_tournament_name_trgm', 'tournament', 'name'),
+    ('ix_tournament_description_trgm', 'tournament', 'description'),
+]
+
+
+def upgrade():
+    # scrypt hashes from werkzeug are longer than 128 characters; SQLite never
+    # enforced the limit, PostgreSQL does
+    with op.batch_alter_table('user') as batch_op:
+        batch_op.alter_column('password_hash', existing_type=sa.String(length=128),
+                              type_=sa.String(length=256), existing_nullable=False)
+
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        for name, table, column in TRIGRAM_INDEXES:
+            op.create_index(name, table, [column], unique=False, postgresql_using='gin',
+                            postgresql_ops={column: 'gin_trgm_ops'})
+
+
+def downgrade():
+    if op.get_bind().dialect.name == 'postgresql':
+        for name, table, _ in TRIGRAM_INDEXES:
+            op.drop_index(name, table_name=table)
+
+    with op.batch_alter_table('user') as batch_op:
+        batch_op.alter_column('password_hash', existing_type=sa.String(length=256),
+                              type_=sa.String(length=128), existing_nullable=False)
@@ -0,0 +1,25 @@
+"""Add tournament listing index
+
+Revision ID: d71e5a2c9f04
+Revises: a3d9c4e71b58
+Create Date: 2026-10-17 15:48:02.117645
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd71e5a2c9f04'
+down_revision = 'a3d9c4e71b58'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_tournament_creator_listing', 'tournament',
+                    ['creator_id', sa.text('year DESC'), 'name'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_tournament_creator_listing', table_name='tournament')
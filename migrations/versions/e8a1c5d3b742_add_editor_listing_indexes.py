@@ -0,0 +1,34 @@
+"""Add editor listing indexes
+
+Revision ID: e8a1c5d3b742
+Revises: c4a7e2d9f318
+Create Date: 2026-10-17 21:12:40.381926
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e8a1c5d3b742'
+down_revision = 'c4a7e2d9f318'
+branch_labels = None
+depends_on = None
+
+# (index, table, columns) behind the sorted, paginated editor listings
+LISTING_INDEXES = [
+    ('ix_team_tournament_name', 'team', ['tournament_id', 'name', 'id']),
+    ('ix_player_team_name', 'player', ['team_id', 'name', 'id']),
+    ('ix_player_team_jersey', 'player', ['team_id', 'jersey_number', 'id']),
+    ('ix_match_tournament_date', 'match', ['tournament_id', 'match_date', 'id']),
+]
+
+
+def upgrade():
+    for name, table, columns in LISTING_INDEXES:
+        op.create_index(name, table, columns, unique=False)
+
+
+def downgrade():
+    for name, table, _ in reversed(LISTING_INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,25 @@
+"""Add team leaderboard index
+
+Revision ID: f2b8c6d4a915
+Revises: d71e5a2c9f04
+Create Date: 2026-10-17 16:31:40.552018
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f2b8c6d4a915'
+down_revision = 'd71e5a2c9f04'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_team_leaderboard', 'team',
+                    [sa.text('wins DESC'), sa.text('points DESC')], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_team_leaderboard', table_name='team')
@@ -0,0 +1,50 @@
+"""Add player season totals table
+
+Revision ID: f9c3b7e2a164
+Revises: e8a1c5d3b742
+Create Date: 2026-10-17 22:31:08.517204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f9c3b7e2a164'
+down_revision = 'e8a1c5d3b742'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('player_season_totals',
+        sa.Column('player_id', sa.Integer(), nullable=False),
+        sa.Column('games', sa.Integer(), nullable=False),
+        sa.Column('points', sa.Integer(), nullable=False),
+        sa.Column('rebounds', sa.Integer(), nullable=False),
+        sa.Column('assists', sa.Integer(), nullable=False),
+        sa.Column('steals', sa.Integer(), nullable=False),
+        sa.Column('blocks', sa.Integer(), nullable=False),
+        sa.Column('turnovers', sa.Integer(), nullable=False),
+        sa.Column('three_pointers', sa.Integer(), nullable=False),
+        sa.Column('efficiency', sa.Integer(), nullable=False),
+        sa.Column('double_doubles', sa.Integer(), nullable=False),
+        sa.Column('triple_doubles', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['player_id'], ['player.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('player_id')
+    )
+    # Totals of the stat lines already recorded
+    op.execute("""
+        INSERT INTO player_season_totals (player_id, games, points, rebounds, assists, steals, blocks,
+                                          turnovers, three_pointers, efficiency, double_doubles, triple_doubles)
+        SELECT player_id, COUNT(*), COALESCE(SUM(points), 0), COALESCE(SUM(rebounds), 0),
+               COALESCE(SUM(assists), 0), COALESCE(SUM(steals), 0), COALESCE(SUM(blocks), 0),
+               COALESCE(SUM(turnovers), 0), COALESCE(SUM(three_pointers), 0), COALESCE(SUM(efficiency), 0),
+               SUM(CASE WHEN double_double THEN 1 ELSE 0 END), SUM(CASE WHEN triple_double THEN 1 ELSE 0 END)
+        FROM player_stats
+        GROUP BY player_id
+    """)
+
+
+def downgrade():
+    op.drop_table('player_season_totals')
@@ -20,11 +20,6 @@ app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{os.path.abspath("db/cits550
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 db.init_app(app)
 
-# Check if database exists before proceeding
-if not (os.path.exists('cits5505.db') or os.path.exists('db/cits5505.db')):
-    print("Error: Database file not found. Please run recreate_db.py and app.py first.")
-    sys.exit(1)
-
 def create_seed_data():
     """Create and insert seed data into the database"""
     
@@ -744,6 +739,12 @@ def create_seed_data():
     print("Seed data successfully created!")
 
 if __name__ == "__main__":
+    # Check if database exists before proceeding; the app imports this module
+    # to seed whatever database it is configured with, so only check here
+    if not (os.path.exists('cits5505.db') or os.path.exists('db/cits5505.db')):
+        print("Error: Database file not found. Please run recreate_db.py and app.py first.")
+        sys.exit(1)
+    
     with app.app_context():
         try:
             create_seed_data()
@@ -1,8 +1,16 @@
 import unittest
 import sys
 import os
+import io
+import gzip
+import shutil
+import subprocess
 import importlib.util
-from datetime import date, datetime
+import tempfile
+from datetime import date, datetime, timedelta
+from unittest.mock import patch
+from flask import Flask, g, url_for
+from sqlalchemy import create_engine, event, update
 
 # Add the parent directory to the path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -13,12 +21,46 @@ spec = importlib.util.spec_from_file_location("app_module", app_path)
 app_module = importlib.util.module_from_spec(spec)
 spec.loader.exec_module(app_module)
 
-from app.models.database import db
-from app.models.models import User, Tournament, Team, Player, Match, MatchScore, PlayerStats, TournamentAccess
-from config import TestingConfig
+from app.models.database import db, configure_sqlite
+from app.models.models import (User, Tournament, Team, Player, Match, MatchScore, PlayerStats, PlayerSeasonTotals,
+                               TournamentAccess, UploadJob)
+from app.services.standings import recalculate_standings, match_result, apply_result_change
+from app.services.cache import analytics_cache, frames_cache, bump_data_version
+from app.services.jobs import upload_executor
+from app.services.assets import build_assets, init_assets
+from app.services import importer, jobs
+from app.services.importer import import_tournament, import_tournament_streaming, TournamentImportError
+from config import TestingConfig, ProductionConfig
 
 unittest.TestLoader.sortTestMethodsUsing = None
 
+def build_workbook(**overrides):
+    """Build an in-memory workbook following the upload template layout"""
+    import pandas as pd
+    sheets = {
+        'Tournament': pd.DataFrame([{'name*': 'Import Cup', 'description': None, 'year*': 2025,
+                                     'start_date*': '2025-06-01', 'end_date*': '2025-07-15'}]),
+        'Teams': pd.DataFrame([{'team_id*': 1, 'name*': 'Alpha', 'primary_color': '#112233'},
+                               {'team_id*': 2, 'name*': 'Beta', 'primary_color': None}]),
+        'Players': pd.DataFrame([{'player_id*': 10, 'name*': 'Ann Able', 'position*': 'PG', 'jersey_number*': 4, 'team_id*': 1},
+                                 {'player_id*': 20, 'name*': 'Ben Bolt', 'position*': 'C', 'jersey_number*': 9, 'team_id*': 2},
+                                 {'player_id*': 30, 'name*': 'No Team', 'position*': 'SF', 'jersey_number*': 3, 'team_id*': 7}]),
+        'Matches': pd.DataFrame([{'match_id*': 100, 'team1_id*': 1, 'team2_id*': 2, 'match_date*': '2025-06-05 19:30'},
+                                 {'match_id*': 200, 'team1_id*': 2, 'team2_id*': 1, 'match_date*': '2025-06-12 20:00'}]),
+        'Match Scores': pd.DataFrame([{'match_id*': 100, 'team1_score*': 90, 'team2_score*': 80},
+                                      {'match_id*': 200, 'team1_score*': 70, 'team2_score*': 75}]),
+        'Player Stats': pd.DataFrame([{'match_id*': 100, 'player_id*': 10, 'points*': 21, 'rebounds*': 10, 'assists*': 10},
+                                      {'match_id*': 100, 'player_id*': 20, 'points*': 8, 'rebounds*': 12, 'assists*': 1, 'turnovers': 4},
+                                      {'match_id*': 200, 'player_id*': 30, 'points*': 5, 'rebounds*': 1, 'assists*': 1}])
+    }
+    sheets.update(overrides)
+    buffer = io.BytesIO()
+    with pd.ExcelWriter(buffer, engine='openpyxl') as writer:
+        for name, df in sheets.items():
+            df.to_excel(writer, sheet_name=name, index=False)
+    buffer.seek(0)
+    return buffer
+
 class BaseTestCase(unittest.TestCase):
     def setUp(self):
         testApp = app_module.create_app('testing')
@@ -466,6 +508,1099 @@ class PlayerStatsUnitTests(BaseTestCase):
         
         # Test triple_double (points, rebounds, and assists >= 10)
         self.assertTrue(stats.triple_double)
+        
+    def test_player_stats_uniqueness(self):
+        """Test that a player can only have one stat line per match"""
+        line = dict(rebounds=5, assists=5, steals=1, blocks=0, turnovers=2, three_pointers=1)
+        db.session.add(PlayerStats(match_id=self.test_match.id, player_id=self.test_player.id, points=10, **line))
+        db.session.commit()
+        
+        db.session.add(PlayerStats(match_id=self.test_match.id, player_id=self.test_player.id, points=12, **line))
+        with self.assertRaises(Exception):
+            db.session.commit()
+
+class StandingsUnitTests(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        # Create a test user
+        self.test_user = User(username='standingscreator', email='standings@example.com', full_name='Standings Creator')
+        self.test_user.set_password('password123')
+        db.session.add(self.test_user)
+        db.session.commit()
+        
+        # Create a test tournament
+        self.test_tournament = Tournament(
+            name='Standings Test Tournament',
+            year=2023,
+            start_date=date(2023, 11, 1),
+            end_date=date(2023, 11, 15),
+            creator_id=self.test_user.id
+        )
+        db.session.add(self.test_tournament)
+        db.session.commit()
+        
+        # Create three test teams
+        self.teams = [
+            Team(name=f'Standings Team {i}', creator_id=self.test_user.id, tournament_id=self.test_tournament.id)
+            for i in range(3)
+        ]
+        db.session.add_all(self.teams)
+        db.session.commit()
+        
+    def _add_match(self, team1, team2, team1_score, team2_score):
+        match = Match(
+            tournament_id=self.test_tournament.id,
+            team1_id=team1.id,
+            team2_id=team2.id,
+            match_date=datetime(2023, 11, 5, 18, 0),
+            creator_id=self.test_user.id
+        )
+        db.session.add(match)
+        db.session.flush()
+        score = MatchScore(match_id=match.id, team1_score=team1_score, team2_score=team2_score)
+        db.session.add(score)
+        return match, score
+        
+    def _records(self):
+        db.session.expire_all()
+        return [(team.wins, team.losses, team.points) for team in self.teams]
+        
+    def test_recalculate_standings(self):
+        """Test full standings recalculation from match scores"""
+        a, b, c = self.teams
+        self._add_match(a, b, 90, 80)
+        self._add_match(b, c, 70, 70)
+        self._add_match(c, a, 100, 95)
+        
+        recalculate_standings(self.test_tournament.id)
+        db.session.commit()
+        
+        self.assertEqual(self._records(), [(1, 1, 2), (0, 1, 1), (1, 0, 3)])
+        
+    def test_apply_result_change(self):
+        """Test incremental standings updates match a full recalculation"""
+        a, b, c = self.teams
+        match, score = self._add_match(a, b, 90, 80)
+        apply_result_change(None, match_result(match.team1_id, match.team2_id, score))
+        db.session.commit()
+        self.assertEqual(self._records(), [(1, 0, 2), (0, 1, 0), (0, 0, 0)])
+        
+        # Flip the result and move the match to a different opponent
+        old_result = match_result(match.team1_id, match.team2_id, score)
+        match.team2_id = c.id
+        score.team1_score = 60
+        apply_result_change(old_result, match_result(match.team1_id, match.team2_id, score))
+        db.session.commit()
+        incremental = self._records()
+        self.assertEqual(incremental, [(0, 1, 0), (0, 0, 0), (1, 0, 2)])
+        
+        recalculate_standings(self.test_tournament.id)
+        db.session.commit()
+        self.assertEqual(self._records(), incremental)
+
+class ApiTestCase(BaseTestCase):
+    """Base class for route tests: a logged-in owner with a small scored tournament"""
+    def setUp(self):
+        super().setUp()
+        self.client = self.app_context.app.test_client()
+        
+        self.owner = User(username='apiowner', email='apiowner@example.com', full_name='Api Owner')
+        self.owner.set_password('password123')
+        db.session.add(self.owner)
+        db.session.commit()
+        
+        self.tournament = Tournament(
+            name='Api Tournament',
+            year=2024,
+            start_date=date(2024, 3, 1),
+            end_date=date(2024, 3, 30),
+            creator_id=self.owner.id
+        )
+        db.session.add(self.tournament)
+        db.session.commit()
+        
+        self.team1 = Team(name='Api Team One', creator_id=self.owner.id, tournament_id=self.tournament.id)
+        self.team2 = Team(name='Api Team Two', creator_id=self.owner.id, tournament_id=self.tournament.id)
+        db.session.add_all([self.team1, self.team2])
+        db.session.commit()
+        
+        self.player1 = Player(name='Alice Guard', position='PG', jersey_number=1,
+                              team_id=self.team1.id, creator_id=self.owner.id)
+        self.player2 = Player(name='Bob Center', position='C', jersey_number=5,
+                              team_id=self.team2.id, creator_id=self.owner.id)
+        db.session.add_all([self.player1, self.player2])
+        db.session.commit()
+        
+        self.match = Match(
+            tournament_id=self.tournament.id,
+            team1_id=self.team1.id,
+            team2_id=self.team2.id,
+            match_date=datetime(2024, 3, 10, 18, 0),
+            creator_id=self.owner.id
+        )
+        db.session.add(self.match)
+        db.session.commit()
+        
+        db.session.add(MatchScore(match_id=self.match.id, team1_score=88, team2_score=80))
+        db.session.add_all([
+            PlayerStats(match_id=self.match.id, player_id=self.player1.id,
+                        points=30, rebounds=4, assists=11, steals=2, blocks=0, turnovers=3, three_pointers=5),
+            PlayerStats(match_id=self.match.id, player_id=self.player2.id,
+                        points=12, rebounds=10, assists=1, steals=0, blocks=4, turnovers=1, three_pointers=0)
+        ])
+        db.session.commit()
+        recalculate_standings(self.tournament.id)
+        db.session.commit()
+        
+        self.login(self.owner)
+        
+    def login(self, user):
+        with self.client.session_transaction() as session:
+            session['_user_id'] = str(user.id)
+            session['_fresh'] = True
+        # Requests share the test's app context, so drop Flask-Login's cached user
+        g.pop('_login_user', None)
+        
+    def count_statements(self, method, url, client=None, status=200, **kwargs):
+        """Make a request and count the SQL statements it runs; returns (response, count)"""
+        # Requests share the test's session; start each one without cached objects
+        db.session.expire_all()
+        statements = []
+        def count(*args):
+            statements.append(args[2])
+        event.listen(db.engine, 'before_cursor_execute', count)
+        try:
+            response = getattr(client or self.client, method)(url, **kwargs)
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', count)
+        self.assertEqual(response.status_code, status)
+        db.session.expire_all()
+        return response, len(statements)
+
+class TournamentDataApiTests(ApiTestCase):
+    def test_tournament_data(self):
+        """Test the aggregated visualisation payload"""
+        response = self.client.get(f'/api/tournament_data?tournament_id={self.tournament.id}')
+        self.assertEqual(response.status_code, 200)
+        data = response.get_json()
+        
+        self.assertEqual(data['summary'], {
+            'teams_count': 2, 'players_count': 2, 'matches_count': 1, 'avg_points_per_game': 84.0
+        })
+        self.assertEqual(data['team_standings']['labels'], ['Api Team One', 'Api Team Two'])
+        self.assertEqual(data['points_distribution']['points_scored'], [88.0, 80.0])
+        self.assertEqual(data['top_scorers']['labels'], ['A. Guard', 'B. Center'])
+        self.assertEqual(data['top_scorers']['teams'], ['Api Team One', 'Api Team Two'])
+        self.assertEqual(data['player_efficiency']['efficiency'], [44.0, 26.0])
+        self.assertEqual(data['double_triple_leaders']['double_doubles'], [1, 1])
+        self.assertEqual(data['match_score_trends']['winning_scores'], [88])
+        self.assertEqual(data['team_records'][0]['diff'], 8.0)
+        
+    def test_tournament_data_player_filter(self):
+        """Test team and player filters narrow the aggregates"""
+        response = self.client.get(
+            f'/api/tournament_data?tournament_id={self.tournament.id}'
+            f'&team_id={self.team2.id}&player_id={self.player2.id}')
+        data = response.get_json()
+        
+        self.assertEqual(data['summary']['teams_count'], 1)
+        self.assertEqual(data['summary']['players_count'], 1)
+        self.assertEqual(data['top_scorers']['points'], [12.0])
+        self.assertEqual(data['team_records'][0]['team'], 'Api Team Two')
+        
+    def test_tournament_data_cache(self):
+        """Test cached payloads are reused until an editor write bumps the version"""
+        url = f'/api/tournament_data?tournament_id={self.tournament.id}'
+        first = self.client.get(url).get_json()
+        self.assertEqual(len(analytics_cache()), 1)
+        self.assertEqual(self.client.get(url).get_json(), first)
+        self.assertEqual(len(analytics_cache()), 1)
+        
+        # Flip the result through the editor API
+        response = self.client.put(f'/api/match/{self.match.id}', json={'team1_score': 70, 'team2_score': 75})
+        self.assertEqual(response.status_code, 200)
+        db.session.expire_all()
+        self.assertEqual(db.session.get(Tournament, self.tournament.id).data_version, 1)
+        
+        updated = self.client.get(url).get_json()
+        self.assertEqual(updated['team_standings']['labels'], ['Api Team Two', 'Api Team One'])
+        self.assertEqual(len(analytics_cache()), 2)
+
+    def test_tournament_data_query_count_is_constant(self):
+        """Test the payload costs the same number of statements for a much larger tournament"""
+        url = f'/api/tournament_data?tournament_id={self.tournament.id}'
+        response, small = self.count_statements('get', url)
+        data = response.get_json()
+        self.assertEqual(data['summary']['players_count'], 2)
+        
+        # Ten more teams of five players, each team with a scored, box-scored match
+        for i in range(10):
+            team = Team(name=f'Api Extra {i}', creator_id=self.owner.id, tournament_id=self.tournament.id)
+            db.session.add(team)
+            db.session.flush()
+            players = [Player(name=f'Extra Player {i}{j}', position='SF', jersey_number=j,
+                              team_id=team.id, creator_id=self.owner.id) for j in range(5)]
+            match = Match(tournament_id=self.tournament.id, team1_id=team.id, team2_id=self.team2.id,
+                          match_date=datetime(2024, 3, 12 + i, 18, 0), creator_id=self.owner.id)
+            db.session.add_all(players + [match])
+            db.session.flush()
+            db.session.add(MatchScore(match_id=match.id, team1_score=70 + i, team2_score=75))
+            db.session.add_all([PlayerStats(match_id=match.id, player_id=player.id, points=10 + j,
+                                            rebounds=3, assists=2, steals=1, blocks=0, turnovers=1,
+                                            three_pointers=1) for j, player in enumerate(players)])
+        bump_data_version(self.tournament.id)
+        db.session.commit()
+        
+        response, large = self.count_statements('get', url)
+        data = response.get_json()
+        self.assertEqual(data['summary']['players_count'], 52)
+        self.assertEqual(len(data['top_scorers']['labels']), 5)
+        self.assertEqual(large, small)
+        
+    def test_filter_changes_reuse_tournament_frames(self):
+        """Test other filters and comparisons are served from the cached frames until a write"""
+        url = f'/api/tournament_data?tournament_id={self.tournament.id}'
+        self.client.get(url)
+        self.assertEqual(len(frames_cache()), 1)
+        
+        # Only the user and the access scope are read
+        response, statements = self.count_statements('get', f'{url}&team_id={self.team2.id}')
+        data = response.get_json()
+        self.assertEqual(statements, 2)
+        self.assertEqual(data['team_standings']['labels'], ['Api Team Two'])
+        self.assertEqual(data['top_scorers']['labels'], ['B. Center'])
+        
+        # Comparing against another tournament loads only that one, a query per table
+        other = Tournament(name='Api Other', year=2024, start_date=date(2024, 4, 1), end_date=date(2024, 4, 30),
+                           creator_id=self.owner.id)
+        db.session.add(other)
+        db.session.commit()
+        response, statements = self.count_statements('get', '/api/tournament_data?tournament_id=all')
+        data = response.get_json()
+        self.assertEqual(statements, 2 + 3)
+        self.assertEqual(data['summary']['teams_count'], 2)
+        self.assertEqual(len(frames_cache()), 2)
+        
+        # A write bumps the version and the tournament is read again
+        response = self.client.put(f'/api/match/{self.match.id}', json={'team1_score': 70, 'team2_score': 75})
+        self.assertEqual(response.status_code, 200)
+        data = self.client.get(f'{url}&team_id={self.team2.id}').get_json()
+        self.assertEqual(data['team_standings']['wins'], [1])
+        self.assertEqual(len(frames_cache()), 3)
+        
+class ConditionalGetApiTests(ApiTestCase):
+    def test_etag_not_modified(self):
+        """Test unchanged polls get 304 and writes produce a new ETag"""
+        url = f'/api/tournament/{self.tournament.id}/teams'
+        first = self.client.get(url)
+        self.assertEqual(first.status_code, 200)
+        etag = first.headers['ETag']
+        self.assertTrue(etag)
+        
+        repeat = self.client.get(url, headers={'If-None-Match': etag})
+        self.assertEqual(repeat.status_code, 304)
+        self.assertEqual(repeat.data, b'')
+        
+        # Any write to the tournament invalidates the ETag
+        self.client.put(f'/api/team/{self.team1.id}', json={'name': 'Renamed Team'})
+        changed = self.client.get(url, headers={'If-None-Match': etag})
+        self.assertEqual(changed.status_code, 200)
+        self.assertNotEqual(changed.headers['ETag'], etag)
+        self.assertIn('Renamed Team', [team['name'] for team in changed.get_json()])
+        
+    def test_etag_differs_per_url(self):
+        """Test ETags are not shared between endpoints of the same tournament"""
+        teams = self.client.get(f'/api/tournament/{self.tournament.id}/teams')
+        matches = self.client.get(f'/api/tournament/{self.tournament.id}/matches')
+        self.assertNotEqual(teams.headers['ETag'], matches.headers['ETag'])
+        
+        response = self.client.get(f'/api/tournament/{self.tournament.id}/matches',
+                                   headers={'If-None-Match': teams.headers['ETag']})
+        self.assertEqual(response.status_code, 200)
+
+class TemplateDownloadTests(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.client = self.app_context.app.test_client()
+
+    def test_template_download_is_cacheable(self):
+        """Test the template carries a content ETag and honours conditional and range requests"""
+        response = self.client.get('/download_template')
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('attachment', response.headers['Content-Disposition'])
+        self.assertTrue(response.cache_control.public)
+        self.assertEqual(response.cache_control.max_age, TestingConfig.STATIC_DOWNLOAD_MAX_AGE)
+        etag = response.headers['ETag']
+        size = len(response.data)
+        response.close()
+
+        cached = self.client.get('/download_template', headers={'If-None-Match': etag})
+        self.assertEqual(cached.status_code, 304)
+        self.assertEqual(cached.data, b'')
+
+        partial = self.client.get('/download_template', headers={'Range': 'bytes=0-99'})
+        self.assertEqual(partial.status_code, 206)
+        self.assertEqual(len(partial.data), 100)
+        self.assertEqual(partial.headers['Content-Range'], f'bytes 0-99/{size}')
+        partial.close()
+
+    def test_versioned_template_link_is_immutable(self):
+        """Test the upload page links the template by content version, cached for a year"""
+        version = self.client.get('/download_template').headers['ETag'].strip('"')[:12]
+        response = self.client.get(f'/download_template?v={version}')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.cache_control.immutable)
+        self.assertEqual(response.cache_control.max_age, 365 * 24 * 3600)
+        response.close()
+
+    def test_template_offloaded_to_proxy(self):
+        """Test X_ACCEL_REDIRECT_PREFIX hands the bytes to nginx"""
+        self.app_context.app.config['X_ACCEL_REDIRECT_PREFIX'] = '/internal-static/'
+        response = self.client.get('/download_template')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers['X-Accel-Redirect'],
+                         '/internal-static/templates/Tournament%20Upload%20Template.xlsx')
+        self.assertEqual(response.data, b'')
+        self.assertIn('attachment', response.headers['Content-Disposition'])
+
+class StaticAssetUnitTests(unittest.TestCase):
+    def setUp(self):
+        self.static_folder = tempfile.mkdtemp()
+        os.makedirs(os.path.join(self.static_folder, 'js'))
+        with open(os.path.join(self.static_folder, 'js', 'editor.js'), 'w') as f:
+            f.write('console.log("editor");\n' * 200)
+        with open(os.path.join(self.static_folder, 'logo.txt'), 'w') as f:
+            f.write('not an asset')
+        self.app = Flask(__name__, static_folder=self.static_folder, static_url_path='/static')
+        self.app.config['FINGERPRINT_ASSETS'] = True
+
+    def tearDown(self):
+        shutil.rmtree(self.static_folder, ignore_errors=True)
+
+    def test_build_fingerprints_and_precompresses(self):
+        """Test the build writes hashed, gzip-compressed copies and a manifest"""
+        manifest = build_assets(self.static_folder)
+        self.assertEqual(list(manifest), ['js/editor.js'])
+        hashed = os.path.join(self.static_folder, 'dist', manifest['js/editor.js'])
+        self.assertRegex(manifest['js/editor.js'], r'^js/editor\.[0-9a-f]{12}\.js$')
+        with open(hashed + '.gz', 'rb') as f:
+            self.assertEqual(gzip.decompress(f.read()), b'console.log("editor");\n' * 200)
+
+        # Rebuilding unchanged sources gives the same names
+        self.assertEqual(build_assets(self.static_folder), manifest)
+
+    def test_fingerprinted_urls_served_immutable_and_compressed(self):
+        """Test url_for('static') points at the hashed copy, served precompressed for a year"""
+        manifest = build_assets(self.static_folder)
+        init_assets(self.app)
+        with self.app.test_request_context():
+            url = url_for('static', filename='js/editor.js')
+            self.assertEqual(url, f"/static/dist/{manifest['js/editor.js']}")
+            self.assertEqual(url_for('static', filename='logo.txt'), '/static/logo.txt')
+
+        client = self.app.test_client()
+        response = client.get(url, headers={'Accept-Encoding': 'gzip'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers['Content-Encoding'], 'gzip')
+        self.assertEqual(response.mimetype, 'text/javascript')
+        self.assertTrue(response.cache_control.immutable)
+        self.assertEqual(response.cache_control.max_age, 365 * 24 * 3600)
+        self.assertIn('Accept-Encoding', response.vary)
+        response.close()
+
+        plain = client.get(url, headers={'Accept-Encoding': 'identity'})
+        self.assertIsNone(plain.headers.get('Content-Encoding'))
+        self.assertEqual(plain.data, b'console.log("editor");\n' * 200)
+        plain.close()
+
+        other = client.get('/static/logo.txt')
+        self.assertEqual(other.data, b'not an asset')
+        self.assertFalse(other.cache_control.immutable)
+        other.close()
+
+class AccessScopeApiTests(ApiTestCase):
+    def setUp(self):
+        super().setUp()
+        self.viewer = User(username='apiviewer', email='apiviewer@example.com', full_name='Api Viewer')
+        self.viewer.set_password('password123')
+        db.session.add(self.viewer)
+        db.session.commit()
+
+    def share_with_viewer(self):
+        access = TournamentAccess(tournament_id=self.tournament.id, user_id=self.viewer.id)
+        db.session.add(access)
+        db.session.commit()
+        return access
+
+    def test_shared_user_can_view_but_not_edit(self):
+        """Test shared tournaments are readable in the visualisations and closed in the editor"""
+        self.share_with_viewer()
+        self.login(self.viewer)
+
+        self.assertEqual(self.client.get(f'/api/tournament_data?tournament_id={self.tournament.id}').status_code, 200)
+        self.assertEqual(self.client.get(f'/api/teams?tournament_id={self.tournament.id}').status_code, 200)
+        self.assertEqual(self.client.get(f'/api/player_stats?player_id={self.player1.id}').status_code, 200)
+
+        self.assertEqual(self.client.get(f'/api/tournament/{self.tournament.id}/teams').status_code, 403)
+        self.assertEqual(self.client.get(f'/api/player/{self.player1.id}').status_code, 403)
+        self.assertEqual(self.client.get(f'/api/match/{self.match.id}').status_code, 403)
+
+        # Unknown ids are still not found rather than denied
+        self.assertEqual(self.client.get('/api/tournament/999999/teams').status_code, 404)
+        self.assertEqual(self.client.get('/api/player/999999').status_code, 404)
+
+    def test_revoked_access_applies_on_next_request(self):
+        """Test the access scope is not carried over between requests"""
+        access = self.share_with_viewer()
+        self.login(self.viewer)
+        url = f'/api/teams?tournament_id={self.tournament.id}'
+        self.assertEqual(self.client.get(url).status_code, 200)
+
+        db.session.delete(access)
+        db.session.commit()
+        self.assertEqual(self.client.get(url).status_code, 403)
+
+    def test_player_lookup_query_count(self):
+        """Test a player request loads the user, the player with its team and the access scope"""
+        response, statements = self.count_statements('get', f'/api/player/{self.player1.id}')
+        self.assertEqual(response.get_json()['team_name'], 'Api Team One')
+        self.assertEqual(statements, 3)
+
+class BoxScoreApiTests(ApiTestCase):
+    def test_bulk_save_upserts_box_score(self):
+        """Test one request updates existing rows and creates missing ones"""
+        bench = Player(name='Cal Bench', position='SF', jersey_number=12,
+                       team_id=self.team1.id, creator_id=self.owner.id)
+        db.session.add(bench)
+        db.session.commit()
+
+        response = self.client.post(f'/api/match/{self.match.id}/stats/bulk', json={'stats': [
+            {'player_id': self.player1.id, 'points': 33, 'rebounds': 5, 'assists': 9, 'steals': 1},
+            {'player_id': bench.id, 'points': 4, 'rebounds': 2, 'assists': 0}
+        ]})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json()['created'], 1)
+        self.assertEqual(response.get_json()['updated'], 1)
+
+        db.session.expire_all()
+        stats = {s.player_id: s for s in PlayerStats.query.filter_by(match_id=self.match.id)}
+        self.assertEqual(len(stats), 3)
+        self.assertEqual((stats[self.player1.id].points, stats[self.player1.id].steals,
+                          stats[self.player1.id].three_pointers), (33, 1, 0))
+        self.assertEqual(stats[bench.id].rebounds, 2)
+        self.assertEqual(db.session.get(Tournament, self.tournament.id).data_version, 1)
+
+    def test_bulk_save_writes_every_row(self):
+        """Test an all-zero row is saved like any other; the editor leaves untouched rows out"""
+        bench = Player(name='Cal Bench', position='SF', jersey_number=12,
+                       team_id=self.team1.id, creator_id=self.owner.id)
+        db.session.add(bench)
+        db.session.commit()
+        bench_id, player_id = bench.id, self.player1.id
+        
+        zeros = {field: 0 for field in ['points', 'rebounds', 'assists', 'steals', 'blocks', 'turnovers',
+                                        'three_pointers']}
+        response = self.client.post(f'/api/match/{self.match.id}/stats/bulk', json={'stats': [
+            {'player_id': player_id, 'points': 30, 'rebounds': 4, 'assists': 11},
+            dict(zeros, player_id=bench_id)
+        ]})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual((response.get_json()['created'], response.get_json()['updated']), (1, 1))
+        
+        db.session.expire_all()
+        self.assertEqual(PlayerStats.query.filter_by(player_id=bench_id).count(), 1)
+        self.assertEqual(db.session.get(PlayerSeasonTotals, bench_id).games, 1)
+        
+    def test_bulk_save_rejects_foreign_players(self):
+        """Test a player outside the match teams rejects the whole box score"""
+        outsider_team = Team(name='Api Outsiders', creator_id=self.owner.id, tournament_id=self.tournament.id)
+        db.session.add(outsider_team)
+        db.session.commit()
+        outsider = Player(name='Dan Outside', position='SG', jersey_number=7,
+                          team_id=outsider_team.id, creator_id=self.owner.id)
+        db.session.add(outsider)
+        db.session.commit()
+
+        response = self.client.post(f'/api/match/{self.match.id}/stats/bulk', json={'stats': [
+            {'player_id': self.player1.id, 'points': 50, 'rebounds': 5, 'assists': 9},
+            {'player_id': outsider.id, 'points': 4, 'rebounds': 2, 'assists': 0}
+        ]})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.get_json()['player_ids'], [outsider.id])
+
+        db.session.expire_all()
+        self.assertEqual(PlayerStats.query.filter_by(match_id=self.match.id).count(), 2)
+        self.assertEqual(PlayerStats.query.filter_by(player_id=self.player1.id).one().points, 30)
+
+        missing = self.client.post(f'/api/match/{self.match.id}/stats/bulk',
+                                   json={'stats': [{'player_id': self.player1.id, 'points': 1}]})
+        self.assertEqual(missing.status_code, 400)
+
+class PlayerSeasonTotalsApiTests(ApiTestCase):
+    def _totals(self, player_id):
+        db.session.expire_all()
+        totals = db.session.get(PlayerSeasonTotals, player_id)
+        if totals is None:
+            return None
+        return (totals.games, totals.points, totals.efficiency, totals.double_doubles, totals.triple_doubles)
+
+    def test_totals_follow_stat_writes(self):
+        """Test creating, updating and deleting stat lines keeps the season totals in step"""
+        self.assertEqual(self._totals(self.player1.id), (1, 30, 44, 1, 0))
+        rematch = Match(tournament_id=self.tournament.id, team1_id=self.team1.id, team2_id=self.team2.id,
+                        match_date=datetime(2024, 3, 20, 18, 0), creator_id=self.owner.id)
+        db.session.add(rematch)
+        db.session.commit()
+        player_id, match_id, rematch_id = self.player1.id, self.match.id, rematch.id
+
+        response = self.client.post(f'/api/match/{rematch_id}/stats/bulk', json={'stats': [
+            {'player_id': player_id, 'points': 20, 'rebounds': 10, 'assists': 10}
+        ]})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self._totals(player_id), (2, 50, 84, 2, 1))
+
+        response = self.client.put(f'/api/player/{player_id}/stats/{rematch_id}', json={'points': 2})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self._totals(player_id), (2, 32, 66, 2, 0))
+
+        response = self.client.delete(f'/api/player/{player_id}/stats/{match_id}')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self._totals(player_id), (1, 2, 22, 1, 0))
+
+        data = self.client.get(f'/api/player_stats?player_id={player_id}').get_json()
+        self.assertEqual(data['player_stats'], [2.0, 10.0, 10.0, 0.0, 0.0, 0.0])
+
+    def test_deleting_match_clears_totals(self):
+        """Test the bulk stat delete behind a match delete recounts both teams' players"""
+        player1_id, player2_id = self.player1.id, self.player2.id
+        response = self.client.delete(f'/api/match/{self.match.id}')
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNone(self._totals(player1_id))
+        self.assertIsNone(self._totals(player2_id))
+
+        data = self.client.get(f'/api/tournament_data?tournament_id={self.tournament.id}').get_json()
+        self.assertEqual(data['top_scorers']['labels'], [])
+
+    def test_deleting_match_recounts_moved_players(self):
+        """Test a player who changed teams after the match loses that game from the totals"""
+        rematch = Match(tournament_id=self.tournament.id, team1_id=self.team1.id, team2_id=self.team2.id,
+                        match_date=datetime(2024, 3, 20, 18, 0), creator_id=self.owner.id)
+        db.session.add(rematch)
+        db.session.commit()
+        db.session.add(PlayerStats(match_id=rematch.id, player_id=self.player1.id, points=8, rebounds=2,
+                                   assists=1, steals=0, blocks=0, turnovers=1, three_pointers=0))
+        db.session.commit()
+        newcomers = Team(name='Api Newcomers', creator_id=self.owner.id, tournament_id=self.tournament.id)
+        db.session.add(newcomers)
+        db.session.commit()
+        player_id, match_id, newcomers_id = self.player1.id, self.match.id, newcomers.id
+        self.assertEqual(self._totals(player_id), (2, 38, 54, 1, 0))
+        
+        response = self.client.put(f'/api/player/{player_id}', json={'team_id': newcomers_id})
+        self.assertEqual(response.status_code, 200)
+        response = self.client.delete(f'/api/match/{match_id}')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self._totals(player_id), (1, 8, 10, 0, 0))
+
+class SnapshotApiTests(ApiTestCase):
+    def test_snapshot_returns_editable_graph(self):
+        """Test the snapshot keys teams, players, matches and stats by id"""
+        unplayed = Match(tournament_id=self.tournament.id, team1_id=self.team2.id, team2_id=self.team1.id,
+                         match_date=datetime(2024, 3, 20, 18, 0), creator_id=self.owner.id)
+        db.session.add(unplayed)
+        db.session.commit()
+        url = f'/api/tournament/{self.tournament.id}/snapshot'
+        ids = (self.team1.id, self.player2.id, self.match.id, unplayed.id, self.player1.id)
+        team1_id, player2_id, match_id, unplayed_id, player1_id = ids
+
+        response, statements = self.count_statements('get', url)
+        # User, access scope, then tournament, teams, players, matches and stats
+        self.assertEqual(statements, 7)
+
+        snapshot = response.get_json()
+        self.assertEqual(snapshot['tournament']['name'], 'Api Tournament')
+        self.assertEqual(snapshot['teams'][str(team1_id)]['wins'], 1)
+        self.assertEqual(snapshot['players'][str(player2_id)]['team_id'], self.team2.id)
+        self.assertEqual(snapshot['matches'][str(match_id)]['team1_score'], 88)
+        self.assertIsNone(snapshot['matches'][str(unplayed_id)]['team1_score'])
+        self.assertEqual(snapshot['stats'][str(match_id)][str(player1_id)]['assists'], 11)
+        self.assertTrue(snapshot['stats'][str(match_id)][str(player1_id)]['double_double'])
+        self.assertNotIn(str(unplayed_id), snapshot['stats'])
+
+        cached = self.client.get(url, headers={'If-None-Match': response.headers['ETag']})
+        self.assertEqual(cached.status_code, 304)
+
+    def test_snapshot_requires_edit_access(self):
+        """Test only users who can edit the tournament get its snapshot"""
+        viewer = User(username='snapshotviewer', email='snapshotviewer@example.com', full_name='Snapshot Viewer')
+        viewer.set_password('password123')
+        db.session.add(viewer)
+        db.session.commit()
+        db.session.add(TournamentAccess(tournament_id=self.tournament.id, user_id=viewer.id))
+        db.session.commit()
+        self.login(viewer)
+
+        self.assertEqual(self.client.get(f'/api/tournament/{self.tournament.id}/snapshot').status_code, 403)
+        self.assertEqual(self.client.get('/api/tournament/999999/snapshot').status_code, 404)
+
+class EditorListingApiTests(ApiTestCase):
+    def setUp(self):
+        super().setUp()
+        db.session.add_all([
+            Player(name='Abe Forward', position='SF', jersey_number=30, team_id=self.team1.id, creator_id=self.owner.id),
+            Player(name='Zed Guard', position='PG', jersey_number=2, team_id=self.team1.id, creator_id=self.owner.id),
+            Match(tournament_id=self.tournament.id, team1_id=self.team2.id, team2_id=self.team1.id,
+                  match_date=datetime(2024, 3, 5, 18, 0), creator_id=self.owner.id)
+        ])
+        db.session.commit()
+
+    def _pages(self, url):
+        names, cursor = [], None
+        while True:
+            response = self.client.get(url + (f'&cursor={cursor}' if cursor else ''))
+            self.assertEqual(response.status_code, 200)
+            names.append([row['name'] for row in response.get_json()])
+            cursor = response.headers.get('X-Next-Cursor')
+            if not cursor:
+                return names
+
+    def test_players_sorted_filtered_and_paginated(self):
+        """Test player pages follow the sort key across cursors and apply the filters"""
+        base = f'/api/tournament/{self.tournament.id}/players'
+        self.assertEqual(self._pages(f'{base}?limit=2&sort=name'),
+                         [['Abe Forward', 'Alice Guard'], ['Bob Center', 'Zed Guard']])
+        self.assertEqual(self._pages(f'{base}?limit=2&sort=-jersey&team_id={self.team1.id}'),
+                         [['Abe Forward', 'Zed Guard'], ['Alice Guard']])
+        guards = self.client.get(f'{base}?position=PG').get_json()
+        self.assertEqual([player['name'] for player in guards], ['Alice Guard', 'Zed Guard'])
+        self.assertEqual(guards[0]['team_name'], 'Api Team One')
+
+        self.assertEqual(self.client.get(f'{base}?sort=height').status_code, 400)
+        self.assertEqual(self.client.get(f'{base}?limit=2&sort=jersey&cursor=WyJBYmUiLDFd').status_code, 400)
+
+    def test_matches_filtered_by_played(self):
+        """Test match listings filter on whether a score exists and sort by date"""
+        base = f'/api/tournament/{self.tournament.id}/matches'
+        matches = self.client.get(base).get_json()
+        self.assertEqual([match['has_score'] for match in matches], [False, True])
+
+        played = self.client.get(f'{base}?played=true').get_json()
+        self.assertEqual([match['id'] for match in played], [self.match.id])
+        self.assertEqual((played[0]['team1_name'], played[0]['team1_score']), ('Api Team One', 88))
+        unplayed = self.client.get(f'{base}?played=false&sort=-date').get_json()
+        self.assertEqual(len(unplayed), 1)
+        self.assertNotIn('team1_score', unplayed[0])
+        self.assertEqual(self.client.get(f'{base}?played=maybe').status_code, 400)
+
+class CascadeDeleteApiTests(ApiTestCase):
+    def test_foreign_keys_enforced(self):
+        """Test SQLite connections enforce foreign keys"""
+        if db.engine.dialect.name != 'sqlite':
+            self.skipTest('SQLite only')
+        self.assertEqual(db.session.execute(db.text('PRAGMA foreign_keys')).scalar(), 1)
+
+    def test_delete_tournament_removes_everything(self):
+        """Test a tournament delete clears every table with a fixed number of statements"""
+        viewer = User(username='cascadeviewer', email='cascadeviewer@example.com', full_name='Cascade Viewer')
+        viewer.set_password('password123')
+        db.session.add(viewer)
+        db.session.commit()
+        db.session.add(TournamentAccess(tournament_id=self.tournament.id, user_id=viewer.id))
+        job = UploadJob(user_id=self.owner.id, filename='cup.xlsx', status='succeeded',
+                        tournament_id=self.tournament.id)
+        db.session.add(job)
+        db.session.commit()
+        tournament_id, team_ids, match_id = self.tournament.id, [self.team1.id, self.team2.id], self.match.id
+
+        _, statements = self.count_statements('delete', f'/api/tournament/{tournament_id}')
+
+        self.assertIsNone(db.session.get(Tournament, tournament_id))
+        self.assertEqual(Team.query.filter_by(tournament_id=tournament_id).count(), 0)
+        self.assertEqual(Player.query.filter(Player.team_id.in_(team_ids)).count(), 0)
+        self.assertEqual(Match.query.filter_by(tournament_id=tournament_id).count(), 0)
+        self.assertEqual(MatchScore.query.filter_by(match_id=match_id).count(), 0)
+        self.assertEqual(PlayerStats.query.filter_by(match_id=match_id).count(), 0)
+        self.assertEqual(TournamentAccess.query.filter_by(tournament_id=tournament_id).count(), 0)
+        self.assertIsNone(db.session.get(UploadJob, job.id).tournament_id)
+        # User, ownership check, savepoint, one statement per table, release
+        self.assertEqual(statements, 13)
+
+    def test_delete_team_cascades(self):
+        """Test a team delete removes its players and matches but keeps the opponent"""
+        team_id, player_id, match_id = self.team1.id, self.player1.id, self.match.id
+        self.count_statements('delete', f'/api/team/{team_id}')
+
+        self.assertIsNone(db.session.get(Team, team_id))
+        self.assertIsNone(db.session.get(Player, player_id))
+        self.assertIsNone(db.session.get(Match, match_id))
+        self.assertEqual(MatchScore.query.filter_by(match_id=match_id).count(), 0)
+        self.assertEqual(PlayerStats.query.filter_by(match_id=match_id).count(), 0)
+        self.assertIsNotNone(db.session.get(Team, self.team2.id))
+        self.assertIsNotNone(db.session.get(Player, self.player2.id))
+        # The opponent's only stat line went with the match
+        self.assertIsNone(db.session.get(PlayerSeasonTotals, self.player2.id))
+        
+    def test_delete_team_takes_results_out_of_opponent_records(self):
+        """Test a team delete removes its matches from the opponents' wins, losses and points"""
+        team3 = Team(name='Api Team Three', creator_id=self.owner.id, tournament_id=self.tournament.id)
+        db.session.add(team3)
+        db.session.commit()
+        # Team one beat team two in setUp; team two then beats team three
+        match = Match(tournament_id=self.tournament.id, team1_id=self.team2.id, team2_id=team3.id,
+                      match_date=datetime(2024, 3, 12, 18, 0), creator_id=self.owner.id)
+        db.session.add(match)
+        db.session.commit()
+        db.session.add(MatchScore(match_id=match.id, team1_score=90, team2_score=70))
+        db.session.commit()
+        recalculate_standings(self.tournament.id)
+        db.session.commit()
+        team2_id, team3_id = self.team2.id, team3.id
+        self.assertEqual((self.team2.wins, self.team2.losses, self.team2.points), (1, 1, 2))
+        
+        self.count_statements('delete', f'/api/team/{self.team1.id}')
+        
+        team2, team3 = db.session.get(Team, team2_id), db.session.get(Team, team3_id)
+        self.assertEqual((team2.wins, team2.losses, team2.points), (1, 0, 2))
+        self.assertEqual((team3.wins, team3.losses, team3.points), (0, 1, 0))
+
+class SqliteProfileUnitTests(unittest.TestCase):
+    def test_production_pragmas_applied_per_connection(self):
+        """Test every pooled connection gets the production SQLite profile"""
+        with tempfile.TemporaryDirectory() as workdir:
+            engine = create_engine(f'sqlite:///{os.path.join(workdir, "profile.db")}', pool_size=2)
+            configure_sqlite(engine, ProductionConfig.SQLITE_PRAGMAS)
+            try:
+                with engine.connect() as first, engine.connect() as second:
+                    for conn in (first, second):
+                        self.assertEqual(conn.exec_driver_sql('PRAGMA journal_mode').scalar(), 'wal')
+                        self.assertEqual(conn.exec_driver_sql('PRAGMA synchronous').scalar(), 1)
+                        self.assertEqual(conn.exec_driver_sql('PRAGMA busy_timeout').scalar(),
+                                         ProductionConfig.SQLITE_PRAGMAS['busy_timeout'])
+                        self.assertEqual(conn.exec_driver_sql('PRAGMA foreign_keys').scalar(), 1)
+            finally:
+                engine.dispose()
+
+class StartupUnitTests(unittest.TestCase):
+    def test_boot_skips_schema_work_and_pycache_sweep_when_disabled(self):
+        """Test create_app leaves the database and atexit alone when the startup flags are off"""
+        class LeanConfig(TestingConfig):
+            AUTO_CREATE_DB = False
+            CLEANUP_PYCACHE = False
+
+        with patch.dict(app_module.config, {'lean': LeanConfig}), \
+             patch.object(app_module, 'init_database') as init_database, \
+             patch.object(app_module.atexit, 'register') as register:
+            app_module.create_app('lean')
+        init_database.assert_not_called()
+        register.assert_not_called()
+
+    def test_boot_does_not_import_excel_stack(self):
+        """Test building the app leaves pandas, numpy and openpyxl for the upload path"""
+        boot = ("import importlib.util\n"
+                f"spec = importlib.util.spec_from_file_location('app_module', {os.path.abspath(app_path)!r})\n"
+                "spec.loader.exec_module(importlib.util.module_from_spec(spec))\n")
+        env = dict(os.environ, FLASK_CONFIG='testing', AUTO_CREATE_DB='false', CLEANUP_PYCACHE='false')
+        result = subprocess.run([sys.executable, '-X', 'importtime', '-c', boot], env=env,
+                                cwd=os.path.dirname(os.path.abspath(app_path)),
+                                capture_output=True, text=True, check=True)
+        imported = {line.split('|')[-1].strip() for line in result.stderr.splitlines()
+                    if line.startswith('import time:')}
+        self.assertIn('app.services.jobs', imported)
+        for module in ('pandas', 'numpy', 'openpyxl', 'app.services.importer'):
+            self.assertNotIn(module, imported)
+
+class TournamentImportUnitTests(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.test_user = User(username='importer', email='importer@example.com', full_name='Import User')
+        self.test_user.set_password('password123')
+        db.session.add(self.test_user)
+        db.session.commit()
+        
+    def test_import_tournament(self):
+        """Test a workbook is imported with ids remapped and derived fields filled"""
+        tournament = import_tournament(build_workbook(), self.test_user.id)
+        db.session.commit()
+        
+        teams = {team.name: team for team in Team.query.filter_by(tournament_id=tournament.id)}
+        self.assertEqual(sorted(teams), ['Alpha', 'Beta'])
+        self.assertEqual(teams['Beta'].primary_color, '#000000')
+        self.assertEqual((teams['Alpha'].wins, teams['Alpha'].points), (2, 4))
+        
+        # The player with an unknown team is skipped
+        players = {player.name: player for player in
+                   Player.query.join(Team).filter(Team.tournament_id == tournament.id)}
+        self.assertEqual(sorted(players), ['Ann Able', 'Ben Bolt'])
+        self.assertEqual(players['Ann Able'].team_id, teams['Alpha'].id)
+        
+        self.assertEqual(Match.query.filter_by(tournament_id=tournament.id).count(), 2)
+        stats = {stat.player_id: stat for stat in
+                 PlayerStats.query.join(Match).filter(Match.tournament_id == tournament.id)}
+        self.assertEqual(len(stats), 2)
+        self.assertEqual(stats[players['Ann Able'].id].efficiency, 41)
+        self.assertTrue(stats[players['Ann Able'].id].triple_double)
+        self.assertEqual(stats[players['Ben Bolt'].id].efficiency, 17)
+        self.assertFalse(stats[players['Ben Bolt'].id].double_double)
+        totals = db.session.get(PlayerSeasonTotals, players['Ann Able'].id)
+        self.assertEqual((totals.games, totals.efficiency, totals.triple_doubles), (1, 41, 1))
+        
+    def test_import_validation(self):
+        """Test missing columns and bad values are reported without writing anything"""
+        import pandas as pd
+        tournament_count = Tournament.query.count()
+        with self.assertRaises(TournamentImportError) as ctx:
+            import_tournament(build_workbook(Teams=pd.DataFrame([{'team_id*': 1}])), self.test_user.id)
+        self.assertIn('Missing required fields in Teams sheet: name', str(ctx.exception))
+        db.session.rollback()
+        
+        bad_stats = pd.DataFrame([{'match_id*': 100, 'player_id*': 10, 'points*': 'lots', 'rebounds*': 1, 'assists*': 1}])
+        with self.assertRaises(TournamentImportError) as ctx:
+            import_tournament(build_workbook(**{'Player Stats': bad_stats}), self.test_user.id)
+        self.assertIn('Invalid number in Player Stats sheet, column points', str(ctx.exception))
+        db.session.rollback()
+        
+        self.assertEqual(Tournament.query.count(), tournament_count)
+        
+    def test_streaming_import(self):
+        """Test the chunked import matches the in-memory one and later duplicates win"""
+        import pandas as pd
+        stats = pd.DataFrame([{'match_id*': 100, 'player_id*': 10, 'points*': 3, 'rebounds*': 1, 'assists*': 1},
+                              {'match_id*': 100, 'player_id*': 20, 'points*': 8, 'rebounds*': 12, 'assists*': 1, 'turnovers': 4},
+                              {'match_id*': 100, 'player_id*': 10, 'points*': 21, 'rebounds*': 10, 'assists*': 10}])
+        tournament = import_tournament_streaming(build_workbook(**{'Player Stats': stats}), self.test_user.id, chunk_size=1)
+        
+        self.assertEqual(Team.query.filter_by(tournament_id=tournament.id, name='Alpha').one().wins, 2)
+        lines = PlayerStats.query.join(Match).filter(Match.tournament_id == tournament.id)\
+            .order_by(PlayerStats.points).all()
+        self.assertEqual([(line.points, line.efficiency) for line in lines], [(8, 17), (21, 41)])
+        totals = [db.session.get(PlayerSeasonTotals, line.player_id) for line in lines]
+        self.assertEqual([(row.games, row.points) for row in totals], [(1, 8), (1, 21)])
+        self.assertTrue(lines[1].triple_double)
+        
+    def test_streaming_import_failure(self):
+        """Test a bad stats chunk removes the already committed part of the import"""
+        import pandas as pd
+        tournament_count = Tournament.query.count()
+        stats = pd.DataFrame([{'match_id*': 100, 'player_id*': 10, 'points*': 3, 'rebounds*': 1, 'assists*': 1},
+                              {'match_id*': 100, 'player_id*': 20, 'points*': 'x', 'rebounds*': 1, 'assists*': 1}])
+        with self.assertRaises(TournamentImportError):
+            import_tournament_streaming(build_workbook(**{'Player Stats': stats}), self.test_user.id, chunk_size=1)
+        
+        self.assertEqual(Tournament.query.count(), tournament_count)
+        self.assertEqual(Team.query.filter_by(name='Alpha').count(), 0)
+        
+    def test_upload_large_workbook_streams(self):
+        """Test uploads above the size threshold go through the streaming importer"""
+        self.app_context.app.config['IMPORT_STREAMING_THRESHOLD'] = 0
+        self.app_context.app.config['IMPORT_CHUNK_SIZE'] = 2
+        with patch('app.services.importer.import_tournament_streaming',
+                   wraps=importer.import_tournament_streaming) as streaming:
+            tournament = import_tournament(build_workbook(), self.test_user.id)
+        streaming.assert_called_once()
+        self.assertEqual(PlayerStats.query.join(Match).filter(Match.tournament_id == tournament.id).count(), 2)
+
+class TournamentListApiTests(ApiTestCase):
+    def setUp(self):
+        super().setUp()
+        for name, year in [('Autumn Cup', 2023), ('Winter Cup', 2023), ('Spring Cup', 2024), ('Alpha Cup', 2024)]:
+            tournament = Tournament(name=name, year=year, start_date=date(year, 1, 1),
+                                    end_date=date(year, 2, 1), creator_id=self.owner.id)
+            db.session.add(tournament)
+        db.session.commit()
+        
+    def _pages(self, url, limit):
+        """Follow X-Next-Cursor through every page of a listing"""
+        pages, cursor = [], None
+        while True:
+            query = f'{url}{"&" if "?" in url else "?"}limit={limit}' + (f'&cursor={cursor}' if cursor else '')
+            response = self.client.get(query)
+            self.assertEqual(response.status_code, 200)
+            pages.append(response.get_json())
+            cursor = response.headers.get('X-Next-Cursor')
+            if not cursor:
+                return pages
+        
+    def test_tournament_listing(self):
+        """Test the listing order and the per-tournament counts"""
+        data = self.client.get('/api/tournaments').get_json()
+        self.assertEqual([t['name'] for t in data],
+                         ['Alpha Cup', 'Api Tournament', 'Spring Cup', 'Autumn Cup', 'Winter Cup'])
+        api = next(t for t in data if t['name'] == 'Api Tournament')
+        self.assertEqual((api['teams_count'], api['matches_count']), (2, 1))
+        self.assertEqual(data[0]['teams_count'], 0)
+        
+    def test_tournament_listing_pages(self):
+        """Test keyset pages cover the full listing, also when searching"""
+        full = self.client.get('/api/tournaments').get_json()
+        pages = self._pages('/api/tournaments', 2)
+        self.assertEqual([len(page) for page in pages], [2, 2, 1])
+        self.assertEqual([t for page in pages for t in page], full)
+        
+        pages = self._pages('/api/tournaments?q=cup', 1)
+        self.assertEqual([t['name'] for page in pages for t in page],
+                         ['Alpha Cup', 'Spring Cup', 'Autumn Cup', 'Winter Cup'])
+        
+    def test_tournament_listing_bad_cursor(self):
+        """Test malformed paging parameters are rejected"""
+        self.assertEqual(self.client.get('/api/tournaments?limit=2&cursor=nonsense').status_code, 400)
+        self.assertEqual(self.client.get('/api/tournaments?limit=0').status_code, 400)
+        self.assertEqual(self.client.get('/api/tournaments?cursor=abc').status_code, 400)
+
+class IndexPageTests(ApiTestCase):
+    def test_index_query_count_is_fixed(self):
+        """Test the home page query count does not grow with teams or match cards"""
+        _, baseline = self.count_statements('get', '/')
+        
+        teams = [Team(name=f'Extra Team {i}', creator_id=self.owner.id, tournament_id=self.tournament.id)
+                 for i in range(20)]
+        db.session.add_all(teams)
+        db.session.flush()
+        for home, away in zip(teams[::2], teams[1::2]):
+            db.session.add(Match(tournament_id=self.tournament.id, team1_id=home.id, team2_id=away.id,
+                                 match_date=datetime(2099, 1, 1), creator_id=self.owner.id))
+        bump_data_version(self.tournament.id)
+        db.session.commit()
+        
+        _, queries = self.count_statements('get', '/')
+        self.assertEqual(queries, baseline)
+        
+    def test_index_leaderboard_year_filter(self):
+        """Test the leaderboard is ordered by record and limited to the selected season"""
+        response, _ = self.count_statements('get', f'/?year={self.tournament.year}')
+        html = response.data.decode()
+        self.assertLess(html.index('Api Team One'), html.index('Api Team Two'))
+        
+        response, _ = self.count_statements('get', '/?year=1999')
+        self.assertIn('No teams for this season yet.', response.data.decode())
+        
+    def test_index_fragments_cached_until_scores_change(self):
+        """Test cached home page sections are reused, then refreshed after a score edit"""
+        _, first = self.count_statements('get', '/')
+        response, cached = self.count_statements('get', '/')
+        self.assertEqual(first - cached, 3)
+        self.assertIn('>1-0<', response.data.decode())
+        
+        # Team Two wins the rematch of the only match
+        response = self.client.put(f'/api/match/{self.match.id}', json={'team1_score': 70, 'team2_score': 90})
+        self.assertEqual(response.status_code, 200)
+        
+        response, queries = self.count_statements('get', '/')
+        self.assertEqual(queries, first)
+        html = response.data.decode()
+        self.assertLess(html.index('Api Team Two'), html.index('Api Team One'))
+        
+    def test_anonymous_page_cache(self):
+        """Test whole pages are cached for anonymous visitors only when enabled"""
+        self.app_context.app.config['INDEX_PAGE_CACHE'] = True
+        self.count_statements('get', '/')
+        _, logged_in = self.count_statements('get', '/')
+        self.assertGreater(logged_in, 1)
+        
+        anonymous = self.app_context.app.test_client()
+        g.pop('_login_user', None)
+        first, _ = self.count_statements('get', '/?year=2024', anonymous)
+        again, queries = self.count_statements('get', '/?year=2024', anonymous)
+        self.assertEqual(again.data, first.data)
+        self.assertEqual(queries, 1)
+
+class UploadJobApiTests(ApiTestCase):
+    def _upload(self, workbook):
+        return self.client.post('/upload', data={'file': (workbook, 'league.xlsx'), 'confirm': 'y'},
+                                content_type='multipart/form-data',
+                                headers={'X-Requested-With': 'XMLHttpRequest'})
+        
+    def test_upload_runs_as_job(self):
+        """Test an upload is queued, imported in the background and reported when done"""
+        response = self._upload(build_workbook())
+        self.assertEqual(response.status_code, 202)
+        status_url = response.get_json()['status_url']
+        
+        upload_executor().shutdown(wait=True)
+        
+        job = self.client.get(status_url).get_json()
+        self.assertEqual((job['status'], job['progress'], job['finished']), ('succeeded', 100, True))
+        tournament = db.session.get(Tournament, job['tournament_id'])
+        self.assertEqual((tournament.name, tournament.creator_id, tournament.data_version), ('Import Cup', self.owner.id, 1))
+        
+        # The result page flashes the outcome for the success modal
+        page = self.client.get(job['result_url'])
+        self.assertIn(b'Tournament uploaded successfully!', page.data)
+        
+    def test_failed_upload_job(self):
+        """Test validation errors end the job as failed and are only visible to its owner"""
+        import pandas as pd
+        tournament_count = Tournament.query.count()
+        response = self._upload(build_workbook(Teams=pd.DataFrame([{'team_id*': 1}])))
+        status_url = response.get_json()['status_url']
+        upload_executor().shutdown(wait=True)
+        
+        job = self.client.get(status_url).get_json()
+        self.assertEqual(job['status'], 'failed')
+        self.assertIn('Missing required fields in Teams sheet', job['message'])
+        self.assertEqual(Tournament.query.count(), tournament_count)
+        
+        other = User(username='otheruser', email='other@example.com', full_name='Other User')
+        other.set_password('password123')
+        db.session.add(other)
+        db.session.commit()
+        self.login(other)
+        self.assertEqual(self.client.get(status_url).status_code, 403)
+        
+    def test_upload_over_streaming_threshold_streams(self):
+        """Test uploads the page accepts reach the streaming importer, and larger ones are refused"""
+        config = self.app_context.app.config
+        self.assertLess(config['IMPORT_STREAMING_THRESHOLD'], config['UPLOAD_MAX_SIZE_MB'] * 1024 * 1024)
+        self.assertGreater(config['MAX_CONTENT_LENGTH'], config['UPLOAD_MAX_SIZE_MB'] * 1024 * 1024)
+        
+        workbook = build_workbook()
+        config['IMPORT_STREAMING_THRESHOLD'] = len(workbook.getvalue()) - 1
+        with patch('app.services.importer.import_tournament_streaming',
+                   wraps=importer.import_tournament_streaming) as streaming:
+            response = self._upload(workbook)
+            self.assertEqual(response.status_code, 202)
+            upload_executor().shutdown(wait=True)
+        streaming.assert_called_once()
+        self.assertEqual(self.client.get(response.get_json()['status_url']).get_json()['status'], 'succeeded')
+        
+        config['MAX_CONTENT_LENGTH'] = 1024
+        response = self._upload(build_workbook())
+        self.assertEqual(response.status_code, 413)
+        self.assertIn('maximum limit of 10MB', response.get_json()['error'])
+        
+    def test_stale_upload_job_is_failed(self):
+        """Test a job whose worker died mid-import is failed and its workbook deleted"""
+        with patch('app.services.jobs.run_upload_job'):
+            response = self._upload(build_workbook())
+        job = db.session.get(UploadJob, response.get_json()['job_id'])
+        path = jobs._job_path(job.id)
+        self.assertTrue(os.path.exists(path))
+        
+        # Still within the timeout: left alone
+        data = self.client.get(response.get_json()['status_url']).get_json()
+        self.assertEqual((data['status'], data['finished']), ('queued', False))
+        
+        job.status = 'running'
+        db.session.commit()
+        db.session.execute(update(UploadJob).where(UploadJob.id == job.id)
+                           .values(updated_at=datetime.utcnow() - timedelta(hours=1)))
+        db.session.commit()
+        data = self.client.get(response.get_json()['status_url']).get_json()
+        self.assertEqual((data['status'], data['finished']), ('failed', True))
+        self.assertIn('stopped before it finished', data['message'])
+        self.assertFalse(os.path.exists(path))
+        
+        # A worker that only now picks the job up leaves it failed
+        jobs.run_upload_job(self.app_context.app, job.id, path)
+        db.session.expire_all()
+        self.assertEqual(db.session.get(UploadJob, job.id).status, 'failed')
+        
+    def test_upload_rejects_invalid_form(self):
+        """Test a submission without the confirmation is rejected before any job is created"""
+        response = self.client.post('/upload', data={'file': (build_workbook(), 'league.xlsx')},
+                                    content_type='multipart/form-data',
+                                    headers={'X-Requested-With': 'XMLHttpRequest'})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(UploadJob.query.count(), 0)
 
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file